@@ -28,15 +28,21 @@ import os
 import logging
 import time
 import asyncio
-from typing import Optional
+from typing import Optional, Set, Tuple
 
 from lib.database import DatabaseManager, Account
 from lib.login_manager import LoginManager
 from lib.webhook_manager import WebhookManager
 from lib.exceptions import HoyoHelperError, WebhookError
 from lib.cookie import get_cookie as get_daily_login_cookie_async, format_cookies
-from lib.encrypt import decrypt
+from lib.encrypt import (KdfParams, LazySecret, calibrate_kdf, decrypt, encrypt, key_cache_stats, prime_session_key,
+                         set_kdf_params, wipe_key_cache)
 from lib.settings import ConfigManager
+from lib.scheduler import AccountScheduler, HostRateLimiter
+from lib.run_journal import RunJournal
+from lib.paths import get_data_dir
+from lib.card_pipeline import CardRenderPipeline
+from lib.card_encoder import CardEncoder
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - [%(name)s] %(message)s")
 logger = logging.getLogger(__name__)
@@ -110,8 +116,48 @@ class WindolessApp:
                 logger.error(f"Also failed to send critical DatabaseManager init error webhook: {wh_e_crit}")
             raise SystemExit(f"DatabaseManager initialization failed: {e}") from e
 
-        self.webhook_mgr = WebhookManager()
-        self.login_mgr = LoginManager(self.webhook_mgr)
+        try:
+            card_encoder = CardEncoder(
+                image_format=self.config_manager.get_card_format(),
+                compress_level=self.config_manager.get_card_compress_level(),
+                quality=self.config_manager.get_card_quality(),
+                quantize_colors=self.config_manager.get_card_quantize_colors(),
+                max_bytes=self.config_manager.get_card_max_kilobytes() * 1024,
+            )
+        except ValueError as e:
+            logger.warning(f"{e} Falling back to PNG cards.")
+            card_encoder = CardEncoder()
+        self.webhook_mgr = WebhookManager(
+            global_requests_per_second=self.config_manager.get_webhook_global_rate(),
+            max_retries=self.config_manager.get_webhook_max_retries(),
+            store=self.database_manager,
+            digest=self.config_manager.get_webhook_digest(),
+            digest_window=self.config_manager.get_webhook_digest_window(),
+            encoder=card_encoder,
+        )
+        self.login_mgr = LoginManager(
+            self.webhook_mgr,
+            pool_size=self.config_manager.get_network_pool_size(),
+            keep_alive=self.config_manager.get_network_keep_alive(),
+            retry_total=self.config_manager.get_network_retry_total(),
+            backoff_factor=self.config_manager.get_network_backoff_factor(),
+            cache_dir=get_data_dir(self.runtime_environment, 'cache'),
+            asset_cache_max_bytes=self.config_manager.get_asset_cache_max_megabytes() * 1024 * 1024,
+            asset_revalidate_after=self.config_manager.get_asset_cache_revalidate_hours() * 3600,
+            image_cache_max_bytes=self.config_manager.get_image_cache_max_megabytes() * 1024 * 1024,
+        )
+        self.login_mgr.rate_limiter = HostRateLimiter(self.config_manager.get_scheduler_host_rate())
+        self.login_mgr.render_pipeline = CardRenderPipeline(
+            self.login_mgr,
+            workers=self.config_manager.get_render_workers(),
+            use_processes=self.config_manager.get_render_use_processes(),
+        )
+        self.scheduler = AccountScheduler(max_concurrency=self.config_manager.get_scheduler_max_concurrency())
+        self.skip_signed_today = self.config_manager.get_scheduler_skip_signed_today()
+        self.signed_games: Set[Tuple[int, str]] = set()
+        self.signed_games_date: Optional[str] = None
+        self.skipped_signed_games = 0
+        self.journal = RunJournal(self.database_manager)
 
         if self.config_manager.get_app_first():
             logger.info("First run detected for ConfigManager. Loading defaults.")
@@ -127,6 +173,8 @@ class WindolessApp:
         except Exception as e:
             logger.critical(f"Failed to load essential configuration (encryption key): {e}")
             raise SystemExit(f"Essential configuration missing, cannot start: {e}") from e
+        self._configure_kdf()
+        self.webhook_mgr.secret_key = self.default_encryption_key
 
         self.accounts: list[Account] = []
         logger.info("WindolessApp initialized successfully.")
@@ -172,12 +220,16 @@ class WindolessApp:
         current_cookie_daily_login = account.get("cookie_daily_login")
 
         if current_cookie_daily_login:
-            logger.info(f"Account {nickname}: Using existing daily login cookie.")
-            return current_cookie_daily_login
+            try:
+                cookie = await self._reveal_async(current_cookie_daily_login)
+                logger.info(f"Account {nickname}: Using existing daily login cookie.")
+                return cookie
+            except ValueError as e:
+                logger.error(f"Account {nickname}: Stored daily login cookie could not be decrypted ({e}).")
 
         logger.warning(f"Account {nickname}: No daily login cookie found. Attempting to generate.")
         try:
-            self.webhook_mgr.send(f"INFO: Account {nickname} - No daily login cookie. Attempting to generate now.", url=account_webhook_url)
+            self.webhook_mgr.queue(f"INFO: Account {nickname} - No daily login cookie. Attempting to generate now.", url=account_webhook_url)
         except WebhookError as e:
             logger.warning(f"Could not send cookie generation notice webhook for {nickname}: {e}")
 
@@ -189,19 +241,21 @@ class WindolessApp:
             err_msg = f"Missing username or encrypted password for account {nickname}. Cannot generate cookie."
             logger.error(err_msg)
             try:
-                self.webhook_mgr.send(f"ERROR: Account {nickname} - {err_msg}", url=account_webhook_url)
+                self.webhook_mgr.queue(f"ERROR: Account {nickname} - {err_msg}", url=account_webhook_url)
             except WebhookError as e: logger.warning(f"Webhook failed for: {err_msg} - {e}")
             return None
 
         try:
-            decrypted_password = decrypt(self.default_encryption_key, encrypted_pass)
+            # Only decrypted here, when a cookie has to be generated; accounts with a cookie never pay for it.
+            decrypted_password = (await self._reveal_async(encrypted_pass) if isinstance(encrypted_pass, LazySecret)
+                                  else await asyncio.to_thread(decrypt, self.default_encryption_key, encrypted_pass))
             if not decrypted_password:
                 raise ValueError("Decryption resulted in empty password.")
         except Exception as e:
             err_msg = f"Failed to decrypt password for account {nickname}: {e}"
             logger.error(err_msg, exc_info=True)
             try:
-                self.webhook_mgr.send(f"ERROR: Account {nickname} - {err_msg}", url=account_webhook_url)
+                self.webhook_mgr.queue(f"ERROR: Account {nickname} - {err_msg}", url=account_webhook_url)
             except WebhookError as wh_e: logger.warning(f"Webhook failed for: {err_msg} - {wh_e}")
             return None
 
@@ -213,9 +267,12 @@ class WindolessApp:
             err_msg = f"Failed to get raw cookie for account {nickname} via login: {e}"
             logger.error(err_msg, exc_info=True)
             try:
-                self.webhook_mgr.send(f"ERROR: Account {nickname} - {err_msg}", url=account_webhook_url)
+                self.webhook_mgr.queue(f"ERROR: Account {nickname} - {err_msg}", url=account_webhook_url)
             except WebhookError as wh_e: logger.warning(f"Webhook failed for: {err_msg} - {wh_e}")
             return None
+        finally:
+            if isinstance(encrypted_pass, LazySecret):
+                encrypted_pass.wipe()
         
         try:
             formatted_cookies = format_cookies(raw_cookie_list)
@@ -225,11 +282,14 @@ class WindolessApp:
             err_msg = f"Failed to format cookie for account {nickname}: {e}"
             logger.error(err_msg, exc_info=True)
             try:
-                self.webhook_mgr.send(f"ERROR: Account {nickname} - {err_msg}", url=account_webhook_url)
+                self.webhook_mgr.queue(f"ERROR: Account {nickname} - {err_msg}", url=account_webhook_url)
             except WebhookError as wh_e: logger.warning(f"Webhook failed for: {err_msg} - {wh_e}")
             return None
         
         logger.info(f"Successfully generated and formatted cookie for account {nickname}.")
+        stored_cookie = formatted_cookies
+        if self.config_manager.get_database_encrypt():
+            stored_cookie = await asyncio.to_thread(encrypt, self.default_encryption_key, formatted_cookies)
         
         account_to_update: Account = {
             "id": account["id"],
@@ -237,19 +297,19 @@ class WindolessApp:
             "username": username,
             "encrypted_password": encrypted_pass,
             "games": account.get("games", []),
-            "cookie_daily_login": formatted_cookies,
+            "cookie_daily_login": stored_cookie,
             "cookie_codes": account["cookie_codes"],
             "passing": account.get("passing", False),
-            "webhook": account_webhook_url
+            "webhook": account.get("webhook") # The stored value, so an encrypted webhook stays encrypted
         }
         
-        if self.database_manager.update_account(account_to_update):
+        if await asyncio.to_thread(self.database_manager.update_account, account_to_update):
             logger.info(f"Successfully updated cookie for account {nickname} in the database.")
         else:
             err_msg = f"Failed to save newly generated cookie for {nickname} to database. Using in-memory cookie for this session."
             logger.error(err_msg)
             try:
-                self.webhook_mgr.send(f"ERROR: Account {nickname} - {err_msg}", url=account_webhook_url)
+                self.webhook_mgr.queue(f"ERROR: Account {nickname} - {err_msg}", url=account_webhook_url)
             except WebhookError as wh_e: logger.warning(f"Webhook failed for: {err_msg} - {wh_e}")
             
         return formatted_cookies
@@ -288,17 +348,27 @@ class WindolessApp:
         account_id = account.get("id", "N/A")
         logger.info(f"--- Running for account: {nickname} (ID: {account_id}) ---")
 
-        account_webhook_url = account.get("webhook")
+        games_to_process = account.get("games")
+        if games_to_process and all(self._already_signed(account_id, game_code) for game_code in games_to_process):
+            self.skipped_signed_games += len(games_to_process)
+            logger.info(f"Account {nickname}: All {len(games_to_process)} game(s) are already signed in for "
+                        f"{self.signed_games_date}. Skipping account.")
+            return
+
+        try:
+            account_webhook_url = await self._reveal_async(account.get("webhook"))
+        except ValueError as e:
+            logger.error(f"Account {nickname}: Stored webhook URL could not be decrypted ({e}).")
+            account_webhook_url = None
         if not account_webhook_url:
             logger.warning(f"Account {nickname}: No webhook URL configured. Notifications for this account will use default or be skipped.")
         else:
             logger.info(f"Account {nickname}: Using webhook URL: {account_webhook_url[:25]}...")
 
-        games_to_process = account.get("games")
         if not games_to_process:
             logger.warning(f"Account {nickname}: No games linked. Skipping account processing.")
             try:
-                self.webhook_mgr.send(f"WARNING: Account {nickname} - No games linked. Skipping.", url=account_webhook_url)
+                self.webhook_mgr.queue(f"WARNING: Account {nickname} - No games linked. Skipping.", url=account_webhook_url)
             except WebhookError as e: logger.warning(f"Webhook failed for no games linked msg: {e}")
             return
 
@@ -313,6 +383,11 @@ class WindolessApp:
             game_code = game_code.strip().lower()
             if not game_code: continue
 
+            if self._already_signed(account_id, game_code):
+                self.skipped_signed_games += 1
+                logger.info(f"Account {nickname}: '{game_code}' is already signed in for {self.signed_games_date}. Skipping.")
+                continue
+
             logger.info(f"Account {nickname}: Processing game code '{game_code}'...")
             if game_code in self.game_links_map:
                 game_specific_links = self.game_links_map[game_code]
@@ -321,40 +396,156 @@ class WindolessApp:
 
                 logger.info(f"Account {nickname}: Attempting daily check-in for {game_display_name} (using short_name: {game_short_name_for_lm}).")
                 
-                try:
-                    success = self.login_mgr.process_account(
-                        cookie=daily_cookie,
-                        account_name=f"{nickname}",
-                        game_links=game_specific_links,
-                        game_short_name=game_short_name_for_lm, 
-                        account_webhook_url=account_webhook_url
-                    )
-                    
-                    if success:
-                        logger.info(f"Account {nickname}: Successfully processed {game_display_name}.")
-                    else:
-                        logger.warning(f"Account {nickname}: Failed to process {game_display_name}. See LoginManager logs/webhooks for details.")
-                except HoyoHelperError as hhe:
-                    logger.error(f"Account {nickname}: A controllable error occurred processing {game_display_name}: {hhe}", exc_info=True)
+                journal_account_id = account_id if isinstance(account_id, int) else None
+                async with self.journal.track(journal_account_id, game_code) as metrics:
+                    sign_date = LoginManager.current_sign_date()
                     try:
-                        self.webhook_mgr.send(f"ERROR: Account {nickname} ({game_display_name}) - Processing error: {hhe.message}", url=account_webhook_url)
-                    except WebhookError as e: logger.warning(f"Webhook failed for HoyoHelperError msg: {e}")
-                except Exception as e:
-                    logger.error(f"Account {nickname}: An UNEXPECTED error occurred while calling process_account for {game_display_name}: {e}", exc_info=True)
-                    try:
-                        self.webhook_mgr.send(f"CRITICAL: Account {nickname} ({game_display_name}) - Unexpected error during processing: {str(e)[:100]}", url=account_webhook_url)
-                    except WebhookError as wh_e: logger.warning(f"Webhook failed for critical error msg: {wh_e}")
-                
-                await asyncio.sleep(1)
+                        outcome = await self.login_mgr.process_account_outcome_async(
+                            cookie=daily_cookie,
+                            account_name=f"{nickname}",
+                            game_links=game_specific_links,
+                            game_short_name=game_short_name_for_lm, 
+                            account_webhook_url=account_webhook_url
+                        )
+                        success = outcome["success"]
+                        metrics.success, metrics.error = success, outcome["error"]
+                        await self._record_game_status(account_id, game_code, sign_date if outcome["signed_in"] else None,
+                                                       outcome["total_sign_day"], outcome["error"], outcome["latency"])
+                    
+                        if success:
+                            logger.info(f"Account {nickname}: Successfully processed {game_display_name}.")
+                        else:
+                            logger.warning(f"Account {nickname}: Failed to process {game_display_name}. See LoginManager logs/webhooks for details.")
+                    except HoyoHelperError as hhe:
+                        logger.error(f"Account {nickname}: A controllable error occurred processing {game_display_name}: {hhe}", exc_info=True)
+                        metrics.error = str(hhe)
+                        await self._record_game_status(account_id, game_code, None, None, str(hhe), None)
+                        try:
+                            self.webhook_mgr.queue(f"ERROR: Account {nickname} ({game_display_name}) - Processing error: {hhe.message}", url=account_webhook_url)
+                        except WebhookError as e: logger.warning(f"Webhook failed for HoyoHelperError msg: {e}")
+                    except Exception as e:
+                        logger.error(f"Account {nickname}: An UNEXPECTED error occurred while calling process_account for {game_display_name}: {e}", exc_info=True)
+                        metrics.error = f"{type(e).__name__}: {e}"
+                        await self._record_game_status(account_id, game_code, None, None, metrics.error, None)
+                        try:
+                            self.webhook_mgr.queue(f"CRITICAL: Account {nickname} ({game_display_name}) - Unexpected error during processing: {str(e)[:100]}", url=account_webhook_url)
+                        except WebhookError as wh_e: logger.warning(f"Webhook failed for critical error msg: {wh_e}")
 
             else:
                 logger.warning(f"Account {nickname}: Game code '{game_code}' not found in GAME_LINKS_MAP. Skipping this game.")
                 try:
-                    self.webhook_mgr.send(f"WARNING: Account {nickname} - Game code '{game_code}' is configured but not recognized. Skipping.", url=account_webhook_url)
+                    self.webhook_mgr.queue(f"WARNING: Account {nickname} - Game code '{game_code}' is configured but not recognized. Skipping.", url=account_webhook_url)
                 except WebhookError as e: logger.warning(f"Webhook failed for game code not found msg: {e}")
         
         logger.info(f"--- Finished processing games for account: {nickname} ---")
 
+    @staticmethod
+    async def _reveal_async(secret) -> Optional[str]:
+        """
+        The function `_reveal_async` reads a secret without blocking the event loop. The first reveal
+        of a `LazySecret` derives a key and may rehash it in the database, so it runs in a worker
+        thread and other accounts keep running meanwhile.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param secret ()  - A `LazySecret`, plain text or `None`.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns The plain text. Raises `ValueError` when the secret does not decrypt.
+        
+        .-.-.-.
+        
+        
+        """
+        if isinstance(secret, LazySecret):
+            return await asyncio.to_thread(secret.reveal)
+        return secret
+
+    async def _warm_card_templates_async(self, game_short_names: Set[str]):
+        for game_short_name in sorted(game_short_names):
+            try:
+                ready = await asyncio.to_thread(self.login_mgr.warm_card_templates, game_short_name)
+                logger.info(f"{ready} card template(s) ready for {game_short_name}.")
+            except Exception as e: # Renders build their templates themselves if this fails
+                logger.warning(f"Could not build card templates for {game_short_name}: {e}")
+
+    def _configure_kdf(self):
+        """
+        The function `_configure_kdf` sets the key derivation new and rehashed secrets are encrypted
+        with. When `kdf_target_ms` is set and the stored parameters were not calibrated for it, the
+        configured algorithm is calibrated on this host first and the result saved, so the
+        measurement runs once per target rather than once per run.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        
+        """
+        config = self.config_manager
+        params = KdfParams(config.get_kdf_algorithm(), config.get_kdf_iterations(),
+                           config.get_kdf_memory_kib(), config.get_kdf_parallelism())
+        target_ms = config.get_kdf_target_ms()
+        try:
+            if target_ms > 0 and target_ms != config.get_kdf_calibrated_ms():
+                params = calibrate_kdf(params.algorithm, target_ms, parallelism=params.parallelism)
+                config.set_kdf_params(*params, calibrated_ms=target_ms)
+                logger.info(f"Calibrated key derivation for {target_ms} ms: {params.describe()}.")
+            set_kdf_params(params)
+        except ValueError as e:
+            logger.warning(f"{e} Keeping {KdfParams().describe()}.")
+
+    def _already_signed(self, account_id, game_code: str) -> bool:
+        """
+        The function `_already_signed` tells whether an account's game is known to be signed in for
+        the current check-in day, from the status loaded at the start of the run.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param account_id ()  - The id of the account.
+        
+        .-.-.-.
+        
+        @ param game_code (str)  - The game code as configured on the account.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns `True` if the game can be skipped in this run.
+        
+        .-.-.-.
+        
+        
+        """
+        if not self.skip_signed_today or self.signed_games_date != LoginManager.current_sign_date():
+            return False
+        return (account_id, game_code.strip().lower()) in self.signed_games
+
+    async def _record_game_status(self, account_id, game_code: str, sign_date: Optional[str], total_sign_day: Optional[int],
+                                  error: Optional[str], latency: Optional[float]):
+        if not isinstance(account_id, int):
+            return
+        if not await asyncio.to_thread(self.database_manager.record_game_status, account_id, game_code, sign_date,
+                                       total_sign_day, error, latency):
+            logger.warning(f"Could not store the run status of account ID {account_id} ({game_code}).")
+
 
     async def main_async(self):
         """
@@ -371,7 +562,8 @@ class WindolessApp:
         
         
         @ returns The `main_async` function is an asynchronous function that processes accounts in a
-        Windoless App. It loads accounts from a database, processes them one by one using the
+        Windoless App. It loads accounts from a database, processes them concurrently through the
+        `AccountScheduler` (bounded by `max_concurrency`, with per-host request spacing) using the
         `run_account_async` method, and sends appropriate log messages and webhooks for different
         scenarios.
         
@@ -380,48 +572,118 @@ class WindolessApp:
         
         """
         logger.info("Starting Windoless App daily processing...")
-        
+        self.login_mgr.reset_run_cache()
+        # Outbox URLs are encrypted when queued on the event loop; derive the session key here instead
+        await asyncio.to_thread(prime_session_key, self.default_encryption_key)
+        restored = await asyncio.to_thread(self.webhook_mgr.restore_pending)
+        if restored:
+            logger.info(f"Resending {restored} webhook message(s) left undelivered by an earlier run.")
+
+        upgraded, not_upgraded = await asyncio.to_thread(self.database_manager.upgrade_account_encryption,
+                                                         self.default_encryption_key)
+        if upgraded or not_upgraded:
+            logger.info(f"Upgraded {upgraded} account password(s) to the v2 encryption format"
+                        f"{f', {not_upgraded} could not be decrypted with the configured key' if not_upgraded else ''}.")
 
         try:
-            self.accounts = self.database_manager.load_accounts()
+            self.accounts = await asyncio.to_thread(self.database_manager.load_accounts,
+                                                    secret_key=self.default_encryption_key)
         except Exception as e:
             logger.critical(f"Failed to load accounts from database: {e}", exc_info=True)
             try:
-                self.webhook_mgr.send("CRITICAL ALERT: Failed to load accounts from database. HoYo Helper cannot process accounts.")
+                self.webhook_mgr.queue("CRITICAL ALERT: Failed to load accounts from database. HoYo Helper cannot process accounts.")
             except WebhookError as wh_e: logger.warning(f"Webhook failed for critical db load error: {wh_e}")
             return
 
         if not self.accounts:
             logger.info("No accounts found in the database to process.")
             try:
-                self.webhook_mgr.send("INFO: No accounts configured in HoYo Helper for processing.")
+                self.webhook_mgr.queue("INFO: No accounts configured in HoYo Helper for processing.")
             except WebhookError as e: logger.warning(f"Webhook failed for no accounts msg: {e}")
             return
         
         logger.info(f"Loaded {len(self.accounts)} accounts for processing.")
-        
-        for account_data in self.accounts:
+        if self.skip_signed_today:
+            self.signed_games_date = LoginManager.current_sign_date()
+            self.signed_games = await asyncio.to_thread(self.database_manager.load_signed_games, self.signed_games_date)
+            self.skipped_signed_games = 0
+            logger.info(f"{len(self.signed_games)} account game(s) are already signed in for {self.signed_games_date} "
+                        f"and will be skipped.")
+        
+        async def _report_account_failure(account_data: Account, e: BaseException):
+            account_nickname = account_data.get("nickname", "UnknownAccount")
+            logger.critical(f"A critical unhandled error occurred while running account {account_nickname}: {e}", exc_info=e)
+            webhook = account_data.get("webhook")
+            # Revealed earlier in the run unless the failure came first; never derive a key here.
+            account_specific_wh = webhook.peek() if isinstance(webhook, LazySecret) else webhook
+            msg = f"CRITICAL UNHANDLED ERROR processing account {account_nickname}: {str(e)[:100]}. See server logs."
             try:
-                await self.run_account_async(account_data)
-            except Exception as e:
-                account_nickname = account_data.get("nickname", "UnknownAccount")
-                logger.critical(f"A critical unhandled error occurred while running account {account_nickname}: {e}", exc_info=True)
-                account_specific_wh = account_data.get("webhook")
-                msg = f"CRITICAL UNHANDLED ERROR processing account {account_nickname}: {str(e)[:100]}. See server logs."
-                try:
-                    self.webhook_mgr.send(msg, url=account_specific_wh)
-                    if not account_specific_wh and self.webhook_mgr.default_url:
-                         self.webhook_mgr.send(msg)
-                except WebhookError as wh_e_critical:
-                    logger.error(f"Failed to send critical error webhook for {account_nickname}: {wh_e_critical}")
-            
-            logger.info("Waiting before processing next account...")
-            await asyncio.sleep(5)
+                self.webhook_mgr.queue(msg, url=account_specific_wh)
+                if not account_specific_wh and self.webhook_mgr.default_url:
+                     self.webhook_mgr.queue(msg)
+            except WebhookError as wh_e_critical:
+                logger.error(f"Failed to send critical error webhook for {account_nickname}: {wh_e_critical}")
+
+        logger.info(f"Processing with up to {self.scheduler.max_concurrency} account(s) at once, "
+                    f"{self.login_mgr.rate_limiter.requests_per_second} request(s)/s per host.")
+        purged_runs = await asyncio.to_thread(self.database_manager.purge_runs,
+                                              self.config_manager.get_scheduler_run_history_days() * 24 * 3600)
+        if purged_runs:
+            logger.info(f"Removed {purged_runs} run(s) older than the run history window from the journal.")
+        self.journal = RunJournal(self.database_manager)
+        await asyncio.to_thread(self.journal.start, self.scheduler.max_concurrency)
+        # Built in the background while the first accounts are signing in, so their cards find them ready
+        # Normalized like run_account_async, so mixed-case game codes get their templates warmed too
+        game_codes = [(account["id"], game_code.strip().lower())
+                      for account in self.accounts for game_code in account.get("games") or []]
+        card_games = {self.game_links_map[game_code].get('short_name', game_code) for account_id, game_code in game_codes
+                      if game_code in self.game_links_map and not self._already_signed(account_id, game_code)}
+        warm_task = asyncio.create_task(self._warm_card_templates_async(card_games))
+        try:
+            run_report = await self.scheduler.run(self.accounts, self.run_account_async, on_error=_report_account_failure)
+        finally:
+            await asyncio.to_thread(self.journal.finish, len(self.accounts), self.scheduler.failures)
+            await warm_task
         
         logger.info("Windoless App finished processing all accounts.")
+        logger.info(f"Run summary: {AccountScheduler.format_report(run_report)}")
+        if self.skipped_signed_games:
+            logger.info(f"Skipped {self.skipped_signed_games} game(s) already signed in today.")
+        logger.info(f"Secrets: {LazySecret.total_decrypts} decrypt(s), {LazySecret.total_rehashes} rehash(es), "
+                    f"{key_cache_stats()['misses']} key derivation(s).")
+        conn_stats = self.login_mgr.connection_stats()
+        logger.info(f"HTTP connection pool: {conn_stats['requests']} requests over {conn_stats['hosts']} host(s), "
+                    f"{conn_stats['connections_opened']} connection(s) opened, {conn_stats['connections_reused']} reused.")
+        memo_stats = self.login_mgr.request_memo.stats()
+        logger.info(f"Request memo: {memo_stats['hits']} hit(s), {memo_stats['misses']} miss(es).")
+        reward_stats = self.login_mgr.reward_cache.stats()
+        logger.info(f"Reward calendar cache: {reward_stats['hits']} hit(s), {reward_stats['misses']} miss(es).")
+        reset_stats = self.login_mgr.reset_time_cache.stats()
+        logger.info(f"Reset time cache: {reset_stats['hits']} hit(s), {reset_stats['misses']} miss(es).")
+        asset_stats = self.login_mgr.asset_cache.stats()
+        logger.info(f"Asset cache: {asset_stats['hits']} hit(s), {asset_stats['misses']} miss(es), "
+                    f"{asset_stats['revalidated']} revalidated, {asset_stats['offline_fallbacks']} offline fallback(s), "
+                    f"{asset_stats['entries']} file(s) / {asset_stats['bytes'] / (1024 * 1024):.1f} MB on disk.")
+        render_stats = self.login_mgr.render_pipeline.stats()
+        logger.info(f"Card rendering ({render_stats['workers']} {render_stats['mode']} worker(s)): "
+                    f"{render_stats['completed']} rendered, {render_stats['failed']} failed, "
+                    f"{render_stats['mean_render_ms']:.0f} ms mean render time.")
+        image_stats = self.login_mgr.image_cache.stats()
+        logger.info(f"Decoded image cache: {image_stats['hits']} hit(s), {image_stats['misses']} miss(es), "
+                    f"{image_stats['entries']} image(s) using {image_stats['bytes'] / (1024 * 1024):.1f} of "
+                    f"{image_stats['max_bytes'] / (1024 * 1024):.0f} MB.")
         try:
-            self.webhook_mgr.send("INFO: HoYo Helper has completed its daily processing cycle for all accounts.")
+            self.webhook_mgr.queue(f"INFO: HoYo Helper has completed its daily processing cycle for all accounts. {AccountScheduler.format_report(run_report)}")
         except WebhookError as e: logger.warning(f"Webhook failed for completion msg: {e}")
+        await asyncio.to_thread(self.webhook_mgr.flush)
+        outbox_stats = self.webhook_mgr.outbox_stats()
+        logger.info(f"Webhook outbox: {outbox_stats['queued']} message(s) in {outbox_stats['posts']} post(s), "
+                    f"{outbox_stats['merged']} merged, {outbox_stats['rate_limited']} rate limited, {outbox_stats['failed']} failed.")
+        encoder_stats = self.webhook_mgr.encoder.stats()
+        if encoder_stats['encoded']:
+            logger.info(f"Card encoding ({encoder_stats['format']}): {encoder_stats['encoded']} card(s), "
+                        f"{encoder_stats['mean_kib']:.1f} KiB and {encoder_stats['mean_encode_ms']:.1f} ms on average, "
+                        f"{encoder_stats['over_budget']} over the size budget.")
 
 
 # The above Python code snippet is a part of a script that handles the startup of an application. Here
@@ -429,7 +691,13 @@ class WindolessApp:
 if __name__ == "__main__":
     try:
         app = WindolessApp()
-        asyncio.run(app.main_async())
+        try:
+            asyncio.run(app.main_async())
+        finally:
+            app.login_mgr.close()
+            app.webhook_mgr.close()
+            app.database_manager.close()
+            wipe_key_cache()
     except SystemExit as se:
         logger.critical(f"Application exiting due to SystemExit: {se}")
     except Exception as e:
@@ -0,0 +1,359 @@
+FILE_VERSION = "0.1.0"
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+
+from .cache import _write_json_atomic
+from .http_session import HTTPSessionPool
+
+logger = logging.getLogger(__name__)
+
+
+class AssetCache:
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+    DEFAULT_REVALIDATE_AFTER = 24 * 60 * 60
+    INDEX_FILE = "index.json"
+
+    def __init__(self, cache_dir: Optional[str], http_pool: HTTPSessionPool,
+                 max_bytes: int = DEFAULT_MAX_BYTES, revalidate_after: float = DEFAULT_REVALIDATE_AFTER):
+        """
+        The function initializes a content-addressed disk cache for CDN assets. Blobs are stored once
+        per SHA-256 under `objects/<sha[:2]>/<sha>`, and `index.json` maps every URL to its blob and the
+        validators (`ETag`, `Last-Modified`) the server sent with it.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param cache_dir (Optional[str])  - Folder for the cache. When `None` nothing is cached and
+        every call goes to the network.
+
+        .-.-.-.
+
+        @ param http_pool (HTTPSessionPool)  - The pooled session used for downloads.
+
+        .-.-.-.
+
+        @ param max_bytes (int)  - Size limit of all blobs together. The least recently used URLs are
+        evicted once it is exceeded.
+
+        .-.-.-.
+
+        @ param revalidate_after (float)  - Seconds after which a cached asset is revalidated with a
+        conditional request before being used again.
+
+        .-.-.-.
+
+
+        """
+        self.cache_dir = cache_dir
+        self.http_pool = http_pool
+        self.max_bytes = max(0, int(max_bytes))
+        self.revalidate_after = max(0.0, float(revalidate_after))
+        self._lock = threading.Lock()
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self.counters = {"hits": 0, "misses": 0, "revalidated": 0, "refreshed": 0,
+                         "offline_fallbacks": 0, "evictions": 0}
+        self._load_index()
+
+    @property
+    def enabled(self) -> bool:
+        return self.cache_dir is not None
+
+    def _index_path(self) -> str:
+        return os.path.join(self.cache_dir, self.INDEX_FILE)
+
+    def _blob_path(self, sha: str) -> str:
+        return os.path.join(self.cache_dir, "objects", sha[:2], sha)
+
+    def _load_index(self):
+        if not self.enabled or not os.path.exists(self._index_path()):
+            return
+        try:
+            with open(self._index_path(), 'r', encoding='utf-8') as handle:
+                data = json.load(handle)
+            self._index = {url: entry for url, entry in data.items()
+                           if isinstance(entry, dict) and (entry.get("missing") or entry.get("sha"))}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable asset cache index '{self._index_path()}': {e}")
+            self._index = {}
+
+    def _save_index(self):
+        """
+        The function `_save_index` writes the index to disk. The caller must hold `_lock`.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+
+        """
+        if not self.enabled:
+            return
+        try:
+            _write_json_atomic(self._index_path(), self._index)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Could not write asset cache index '{self._index_path()}': {e}")
+
+    def _read_blob(self, sha: str) -> Optional[bytes]:
+        try:
+            with open(self._blob_path(sha), 'rb') as handle:
+                data = handle.read()
+        except OSError:
+            return None
+        if hashlib.sha256(data).hexdigest() != sha:
+            logger.warning(f"Asset cache blob {sha} is corrupt, it will be downloaded again.")
+            return None
+        return data
+
+    def _write_blob(self, data: bytes) -> str:
+        sha = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(sha)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as handle:
+                handle.write(data)
+            os.replace(tmp_path, path)
+        return sha
+
+    def _total_bytes(self) -> int:
+        sizes = {entry["sha"]: entry.get("size", 0) for entry in self._index.values() if entry.get("sha")}
+        return sum(sizes.values())
+
+    def _drop_entry(self, url: str):
+        """
+        The function `_drop_entry` removes a URL from the index and deletes its blob when no other URL
+        points at the same content. The caller must hold `_lock`.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param url (str)  - The URL to forget.
+
+        .-.-.-.
+
+
+        """
+        entry = self._index.pop(url, None)
+        sha = entry.get("sha") if entry else None
+        if not sha or any(other.get("sha") == sha for other in self._index.values()):
+            return
+        try:
+            os.remove(self._blob_path(sha))
+        except OSError:
+            pass
+
+    def _evict(self):
+        if self.max_bytes <= 0:
+            return
+        total = self._total_bytes()
+        if total <= self.max_bytes:
+            return
+        by_age = sorted((entry.get("last_access", 0), url) for url, entry in self._index.items() if entry.get("sha"))
+        for _, url in by_age:
+            if total <= self.max_bytes:
+                break
+            self._drop_entry(url)
+            self.counters["evictions"] += 1
+            total = self._total_bytes()
+
+    def _store(self, url: str, response: requests.Response) -> bytes:
+        data = response.content
+        now = time.time()
+        with self._lock:
+            try:
+                sha = self._write_blob(data)
+            except OSError as e:
+                logger.warning(f"Could not write asset '{url}' to the cache: {e}")
+                return data
+            self._index[url] = {
+                "sha": sha,
+                "size": len(data),
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "fetched_at": now,
+                "last_access": now,
+            }
+            self._evict()
+            self._save_index()
+        return data
+
+    def _mark_missing(self, url: str):
+        with self._lock:
+            self._drop_entry(url)
+            self._index[url] = {"missing": True, "fetched_at": time.time()}
+            self._save_index()
+
+    def is_known_missing(self, url: str) -> bool:
+        """
+        The function `is_known_missing` tells whether the CDN answered 404 for `url` recently, so the
+        caller can go straight to a fallback asset.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param url (str)  - The asset URL.
+
+        .-.-.-.
+
+
+
+        @ returns `True` when a 404 for this URL is younger than `revalidate_after`.
+
+        .-.-.-.
+
+
+        """
+        with self._lock:
+            entry = self._index.get(url)
+            return bool(entry and entry.get("missing")
+                        and time.time() - entry.get("fetched_at", 0) < self.revalidate_after)
+
+    def _cached(self, url: str) -> Tuple[Optional[Dict[str, Any]], Optional[bytes]]:
+        with self._lock:
+            entry = self._index.get(url)
+            if not entry or not entry.get("sha"):
+                return None, None
+            entry = dict(entry)
+        data = self._read_blob(entry["sha"])
+        if data is None:
+            with self._lock:
+                self._drop_entry(url)
+                self._dirty = True
+            return None, None
+        return entry, data
+
+    def _touch(self, url: str, **fields: Any):
+        with self._lock:
+            entry = self._index.get(url)
+            if entry is not None:
+                entry["last_access"] = time.time()
+                entry.update(fields)
+                self._dirty = True
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None,
+            timeout: Tuple[float, float] = (5, 15)) -> bytes:
+        """
+        The function `get` returns the bytes of an asset, reading the disk cache first. Fresh entries
+        are served without touching the network. Stale entries are revalidated with `If-None-Match` /
+        `If-Modified-Since`, and if the CDN cannot be reached the stale copy is used anyway.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param url (str)  - The asset URL.
+
+        .-.-.-.
+
+        @ param headers (Optional[Dict[str, str]])  - Extra request headers.
+
+        .-.-.-.
+
+        @ param timeout (Tuple[float, float])  - Connect and read timeout for downloads.
+
+        .-.-.-.
+
+
+
+        @ returns The raw asset bytes.
+
+        .-.-.-.
+
+
+        """
+        if not self.enabled:
+            response = self.http_pool.get(url, headers=headers, timeout=timeout)
+            response.raise_for_status()
+            return response.content
+
+        if self.is_known_missing(url):
+            self.counters["hits"] += 1
+            raise requests.exceptions.HTTPError(f"404 Not Found (cached) for url: {url}")
+
+        entry, cached_data = self._cached(url)
+        if entry is not None and time.time() - entry.get("fetched_at", 0) < self.revalidate_after:
+            self.counters["hits"] += 1
+            self._touch(url)
+            return cached_data
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if entry.get("etag"):
+                request_headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                request_headers["If-Modified-Since"] = entry["last_modified"]
+        else:
+            self.counters["misses"] += 1
+
+        try:
+            response = self.http_pool.get(url, headers=request_headers, timeout=timeout)
+            if response.status_code == 304 and entry is not None:
+                self.counters["revalidated"] += 1
+                self._touch(url, fetched_at=time.time())
+                return cached_data
+            if response.status_code == 404:
+                self._mark_missing(url)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            not_found = getattr(getattr(e, "response", None), "status_code", None) == 404
+            if entry is None or not_found:
+                raise
+            self.counters["offline_fallbacks"] += 1
+            logger.warning(f"Could not revalidate asset '{url}' ({e.__class__.__name__}), using cached copy.")
+            self._touch(url)
+            return cached_data
+
+        if entry is not None:
+            self.counters["refreshed"] += 1
+        return self._store(url, response)
+
+    def flush(self):
+        """
+        The function `flush` writes pending access times to the index so LRU order survives restarts.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+
+        """
+        with self._lock:
+            if self._dirty:
+                self._save_index()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            entries = sum(1 for entry in self._index.values() if entry.get("sha"))
+            total = self._total_bytes()
+        return dict(self.counters, entries=entries, bytes=total)
@@ -0,0 +1,430 @@
+FILE_VERSION = "0.1.0"
+
+import copy
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# HoYoLAB daily check-in resets at midnight UTC+8 for the global servers.
+SERVER_RESET_TZ = timezone(timedelta(hours=8))
+
+
+def server_month_key(now: Optional[datetime] = None) -> str:
+    now = now or datetime.now(timezone.utc)
+    return now.astimezone(SERVER_RESET_TZ).strftime("%Y-%m")
+
+
+def server_month_end(now: Optional[datetime] = None) -> float:
+    """
+    The function `server_month_end` returns the Unix time at which the current month ends in the
+    server reset timezone.
+
+    .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+    Author - Liam Scott
+    Last update - 10/18/2026
+
+    .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+    @ param now (Optional[datetime])  - The reference time, defaults to the current time.
+
+    .-.-.-.
+
+
+
+    @ returns The Unix timestamp of the first moment of the next month (UTC+8).
+
+    .-.-.-.
+
+
+    """
+    local_now = (now or datetime.now(timezone.utc)).astimezone(SERVER_RESET_TZ)
+    if local_now.month == 12:
+        next_month = local_now.replace(year=local_now.year + 1, month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
+    else:
+        next_month = local_now.replace(month=local_now.month + 1, day=1, hour=0, minute=0, second=0, microsecond=0)
+    return next_month.timestamp()
+
+
+def _write_json_atomic(path: str, data: Any):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as handle:
+        json.dump(data, handle)
+    os.replace(tmp_path, path)
+
+
+class RequestMemo:
+    DEFAULT_MAX_AGE = 300.0
+
+    def __init__(self, max_age: float = DEFAULT_MAX_AGE):
+        """
+        The function initializes a per-run memo of successful GET responses. Entries are keyed on
+        (cookie, URL, params) so a response is only ever reused for the same account.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param max_age (float)  - Seconds after which an entry is ignored even if the run was never
+        reset. This keeps long-lived callers such as the GUI from reading stale sign-in state.
+
+        .-.-.-.
+
+
+        """
+        self.max_age = max_age
+        self._entries: Dict[Tuple[Hashable, ...], Tuple[float, Dict]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(cookie: Optional[str], url: str, params: Optional[Dict] = None) -> Tuple[Hashable, ...]:
+        frozen_params = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        return (cookie or "", url, frozen_params)
+
+    def get(self, cookie: Optional[str], url: str, params: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        The function `get` returns a copy of the memoized response, or `None` on a miss.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param cookie (Optional[str])  - The cookie the request is made with.
+
+        .-.-.-.
+
+        @ param url (str)  - The request URL.
+
+        .-.-.-.
+
+        @ param params (Optional[Dict])  - The query parameters of the request.
+
+        .-.-.-.
+
+
+
+        @ returns A deep copy of the stored JSON response, so callers cannot change the memo.
+
+        .-.-.-.
+
+
+        """
+        key = self.make_key(cookie, url, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] <= self.max_age:
+                self.hits += 1
+                return copy.deepcopy(entry[1])
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, cookie: Optional[str], url: str, params: Optional[Dict], response: Dict):
+        key = self.make_key(cookie, url, params)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), copy.deepcopy(response))
+
+    def invalidate(self, cookie: Optional[str], url: Optional[str] = None):
+        """
+        The function `invalidate` drops memoized responses of one account, either for a single URL
+        (any params) or for every URL when `url` is `None`.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param cookie (Optional[str])  - The cookie whose entries are dropped.
+
+        .-.-.-.
+
+        @ param url (Optional[str])  - The URL to drop, or `None` for all URLs of that cookie.
+
+        .-.-.-.
+
+
+        """
+        cookie_key = cookie or ""
+        with self._lock:
+            stale = [key for key in self._entries
+                     if key[0] == cookie_key and (url is None or key[1] == url)]
+            for key in stale:
+                del self._entries[key]
+
+    def reset(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+class RewardCalendarCache:
+    def __init__(self, cache_file: Optional[str] = None):
+        """
+        The function initializes the cross-account cache of monthly reward calendars. The `/home`
+        awards list is identical for every account of a game for the whole month, so it is keyed on
+        the game `act_id` and the month in the server reset timezone.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param cache_file (Optional[str])  - JSON file used to keep the calendars between runs. When
+        `None` the cache only lives in memory.
+
+        .-.-.-.
+
+
+        """
+        self.cache_file = cache_file
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    @staticmethod
+    def _key(act_id: str, month: str) -> str:
+        return f"{act_id}|{month}"
+
+    def _load(self):
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as handle:
+                data = json.load(handle)
+            now = time.time()
+            self._entries = {key: entry for key, entry in data.items()
+                             if isinstance(entry, dict) and entry.get("expires_at", 0) > now}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable reward calendar cache '{self.cache_file}': {e}")
+            self._entries = {}
+
+    def _save(self):
+        if not self.cache_file:
+            return
+        try:
+            _write_json_atomic(self.cache_file, self._entries)
+        except OSError as e:
+            logger.warning(f"Could not write reward calendar cache '{self.cache_file}': {e}")
+
+    def get(self, act_id: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        The function `get` returns the cached awards list of the current month for a game.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param act_id (str)  - The event id of the game's check-in page.
+
+        .-.-.-.
+
+
+
+        @ returns A copy of the awards list, or `None` on a miss or after expiry.
+
+        .-.-.-.
+
+
+        """
+        key = self._key(act_id, server_month_key())
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.get("expires_at", 0) > time.time():
+                self.hits += 1
+                return copy.deepcopy(entry["awards"])
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, act_id: str, awards: List[Dict[str, Any]], refresh_time_unix: Optional[str] = None):
+        """
+        The function `put` stores the awards list of the current month. The entry expires at the end
+        of the month, or at the refresh time reported by `_time_info` when that refresh already
+        starts the next month.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param act_id (str)  - The event id of the game's check-in page.
+
+        .-.-.-.
+
+        @ param awards (List[Dict[str, Any]])  - The awards list returned by the `/home` endpoint.
+
+        .-.-.-.
+
+        @ param refresh_time_unix (Optional[str])  - The next refresh timestamp, if known.
+
+        .-.-.-.
+
+
+        """
+        month = server_month_key()
+        expires_at = server_month_end()
+        if refresh_time_unix:
+            try:
+                refresh_at = float(refresh_time_unix)
+                refresh_month = server_month_key(datetime.fromtimestamp(refresh_at, timezone.utc))
+                if refresh_month != month and time.time() < refresh_at < expires_at + 86400:
+                    expires_at = refresh_at
+            except (TypeError, ValueError):
+                logger.debug(f"Ignoring invalid refresh time for reward calendar cache: {refresh_time_unix}")
+        with self._lock:
+            self._entries[self._key(act_id, month)] = {
+                "awards": copy.deepcopy(awards),
+                "expires_at": expires_at,
+            }
+            self._save()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._save()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+class ResetTimeCache:
+    def __init__(self, cache_file: Optional[str] = None):
+        """
+        The function initializes the cache of server refresh timestamps. The `refresh_time` (or
+        Genshin's `resign_time`) returned by `_time_info` is a server-wide reset moment, so one value
+        per game is shared by every account until that moment has passed.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param cache_file (Optional[str])  - JSON file used to keep the timestamps between runs and
+        daemon cycles. When `None` the cache only lives in memory.
+
+        .-.-.-.
+
+
+        """
+        self.cache_file = cache_file
+        self._entries: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    @staticmethod
+    def _expires_at(refresh_time_unix: str) -> float:
+        try:
+            return float(refresh_time_unix)
+        except (TypeError, ValueError):
+            return 0.0
+
+    def _load(self):
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as handle:
+                data = json.load(handle)
+            now = time.time()
+            self._entries = {act_id: str(value) for act_id, value in data.items()
+                             if self._expires_at(value) > now}
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable reset time cache '{self.cache_file}': {e}")
+            self._entries = {}
+
+    def _save(self):
+        if not self.cache_file:
+            return
+        try:
+            _write_json_atomic(self.cache_file, self._entries)
+        except OSError as e:
+            logger.warning(f"Could not write reset time cache '{self.cache_file}': {e}")
+
+    def get(self, act_id: str) -> Optional[str]:
+        """
+        The function `get` returns the cached refresh timestamp of a game while it is still in the
+        future.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param act_id (str)  - The event id of the game's check-in page.
+
+        .-.-.-.
+
+
+
+        @ returns The refresh time as a Unix timestamp string, or `None` once it has passed.
+
+        .-.-.-.
+
+
+        """
+        with self._lock:
+            value = self._entries.get(act_id)
+            if value is not None and self._expires_at(value) > time.time():
+                self.hits += 1
+                return value
+            if value is not None:
+                del self._entries[act_id]
+            self.misses += 1
+            return None
+
+    def put(self, act_id: str, refresh_time_unix: str):
+        if self._expires_at(refresh_time_unix) <= time.time():
+            return
+        with self._lock:
+            self._entries[act_id] = str(refresh_time_unix)
+            self._save()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._save()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,167 @@
+FILE_VERSION = "0.1.0"
+
+import logging
+import threading
+import time
+from io import BytesIO
+from typing import Any, Dict, Optional, Tuple
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+
+class CardEncoder:
+    FORMATS = {
+        "PNG": ("png", "image/png"),
+        "WEBP": ("webp", "image/webp"),
+        "JPEG": ("jpg", "image/jpeg"),
+    }
+    QUALITY_STEPS = (90, 80, 70, 60, 50, 40)
+    PALETTE_STEPS = (256, 128, 64, 32)
+
+    def __init__(self, image_format: str = "PNG", compress_level: int = 6, quality: int = 90,
+                 quantize_colors: int = 0, max_bytes: int = 0):
+        """
+        The function initializes the encoder that turns rendered cards into webhook uploads. The
+        defaults give the same PNG the webhook manager always sent.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param image_format (str)  - 'PNG', 'WEBP' or 'JPEG'.
+
+        .-.-.-.
+
+        @ param compress_level (int)  - zlib level for PNG (0-9) and effort for WebP (0-6, capped).
+        Lower is faster and bigger.
+
+        .-.-.-.
+
+        @ param quality (int)  - Starting quality for WebP and JPEG (1-100).
+
+        .-.-.-.
+
+        @ param quantize_colors (int)  - Reduce a PNG to a palette of this many colors (2-256) before
+        saving, 0 keeps full color. Cards have few distinct colors, so 256 is usually invisible.
+
+        .-.-.-.
+
+        @ param max_bytes (int)  - Size budget per card, 0 for none. Over budget, WebP and JPEG are
+        saved again at lower quality and PNG with smaller palettes, until it fits or the last step
+        is reached.
+
+        .-.-.-.
+
+
+        """
+        image_format = image_format.upper()
+        if image_format == "JPG":
+            image_format = "JPEG"
+        if image_format not in self.FORMATS:
+            raise ValueError(f"Unsupported card format '{image_format}', use one of {', '.join(self.FORMATS)}.")
+        self.image_format = image_format
+        self.compress_level = min(9, max(0, int(compress_level)))
+        self.quality = min(100, max(1, int(quality)))
+        self.quantize_colors = min(256, max(0, int(quantize_colors)))
+        self.max_bytes = max(0, int(max_bytes))
+        self._lock = threading.Lock()
+        self.encoded = 0
+        self.over_budget = 0
+        self.total_bytes = 0
+        self.encode_seconds = 0.0
+
+    def _save(self, card: Image.Image, quality: int, colors: int) -> bytes:
+        image = card
+        options: Dict[str, Any] = {}
+        if self.image_format == "PNG":
+            if colors:
+                image = image.quantize(colors=colors, method=Image.Quantize.FASTOCTREE if image.mode == "RGBA"
+                                       else Image.Quantize.MEDIANCUT)
+            options["compress_level"] = self.compress_level
+        elif self.image_format == "WEBP":
+            options.update(quality=quality, method=min(6, self.compress_level))
+        else:
+            if image.mode != "RGB":
+                # JPEG has no alpha, flatten onto black like Discord's dark theme.
+                background = Image.new("RGB", image.size, (0, 0, 0))
+                background.paste(image, mask=image.getchannel("A") if "A" in image.getbands() else None)
+                image = background
+            options.update(quality=quality, optimize=True)
+        with BytesIO() as buffer:
+            image.save(buffer, format=self.image_format, **options)
+            return buffer.getvalue()
+
+    def _attempts(self):
+        if self.image_format == "PNG":
+            yield self.quality, self.quantize_colors
+            if self.max_bytes:
+                for colors in self.PALETTE_STEPS:
+                    if not self.quantize_colors or colors < self.quantize_colors:
+                        yield self.quality, colors
+        else:
+            yield self.quality, 0
+            if self.max_bytes:
+                for quality in self.QUALITY_STEPS:
+                    if quality < self.quality:
+                        yield quality, 0
+
+    def encode(self, card: Image.Image) -> Tuple[str, bytes, str]:
+        """
+        The function `encode` saves a card in the configured format, staying within `max_bytes` when
+        it can, and logs how long that took and how big the result is.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param card (Image.Image)  - The rendered card.
+
+        .-.-.-.
+
+
+
+        @ returns A `(file name, bytes, MIME type)` tuple for the upload.
+
+        .-.-.-.
+
+
+        """
+        extension, mime = self.FORMATS[self.image_format]
+        started = time.perf_counter()
+        data = b""
+        setting = ""
+        for quality, colors in self._attempts():
+            data = self._save(card, quality, colors)
+            setting = f"{colors} colors" if colors else ("" if self.image_format == "PNG" else f"quality {quality}")
+            if not self.max_bytes or len(data) <= self.max_bytes:
+                break
+        seconds = time.perf_counter() - started
+        over_budget = bool(self.max_bytes) and len(data) > self.max_bytes
+        with self._lock:
+            self.encoded += 1
+            self.over_budget += over_budget
+            self.total_bytes += len(data)
+            self.encode_seconds += seconds
+        logger.info(f"Encoded {card.size[0]}x{card.size[1]} card as {self.image_format}"
+                    f"{' (' + setting + ')' if setting else ''}: {len(data) / 1024:.1f} KiB in {seconds * 1000:.1f} ms"
+                    f"{', over the size budget' if over_budget else ''}.")
+        return f"Card.{extension}", data, mime
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            encoded = self.encoded
+            return {
+                "format": self.image_format,
+                "encoded": encoded,
+                "over_budget": self.over_budget,
+                "mean_kib": (self.total_bytes / encoded / 1024) if encoded else 0.0,
+                "mean_encode_ms": (self.encode_seconds / encoded * 1000) if encoded else 0.0,
+            }
@@ -0,0 +1,204 @@
+FILE_VERSION = "0.1.0"
+
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+# Set in each worker process by `_init_render_worker`.
+_worker_login_manager = None
+
+
+def _init_render_worker(options: Dict[str, Any]):
+    """
+    The function `_init_render_worker` runs once in every render process and builds the
+    `LoginManager` used for rendering there, with its own fonts and in-memory caches. The disk asset
+    cache is shared with the parent through `cache_dir`.
+
+    .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+    Author - Liam Scott
+    Last update - 10/18/2026
+
+    .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+    @ param options (Dict[str, Any])  - Keyword arguments for `LoginManager`.
+
+    .-.-.-.
+
+
+    """
+    global _worker_login_manager
+    from .login_manager import LoginManager
+    _worker_login_manager = LoginManager(None, **options)
+
+
+def _render_in_worker(card_data: Dict[str, Any], game_short_name: str) -> Tuple[Optional[Image.Image], float]:
+    started = time.perf_counter()
+    card = _worker_login_manager._card_generator(card_data, game_short_name)
+    return card, time.perf_counter() - started
+
+
+class CardRenderPipeline:
+    DEFAULT_WORKERS = 2
+
+    def __init__(self, login_manager, workers: int = DEFAULT_WORKERS, use_processes: bool = False):
+        """
+        The function initializes a pool that renders reward cards off the sign-in path. Threads share
+        the caches of `login_manager`. Processes sidestep the GIL for the Pillow work; each one gets its
+        own `LoginManager` built with the same cache settings.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param login_manager (LoginManager)  - The LoginManager whose `_card_generator` is used.
+
+        .-.-.-.
+
+        @ param workers (int)  - Number of render threads or processes.
+
+        .-.-.-.
+
+        @ param use_processes (bool)  - Use a `ProcessPoolExecutor` instead of a thread pool. Workers
+        are started with the 'spawn' method so they are safe to create from a threaded process, like
+        the headless app in Docker.
+
+        .-.-.-.
+
+
+        """
+        self.login_manager = login_manager
+        self.workers = max(1, int(workers))
+        self.use_processes = use_processes
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.render_seconds = 0.0
+
+    def _worker_options(self) -> Dict[str, Any]:
+        login_manager = self.login_manager
+        return {
+            "cache_dir": login_manager.cache_dir,
+            "asset_cache_max_bytes": login_manager.asset_cache.max_bytes,
+            "asset_revalidate_after": login_manager.asset_cache.revalidate_after,
+            "image_cache_max_bytes": login_manager.image_cache.max_bytes,
+        }
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.use_processes:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_init_render_worker,
+                        initargs=(self._worker_options(),),
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="card-render")
+            return self._executor
+
+    def _render_in_thread(self, card_data: Dict[str, Any], game_short_name: str) -> Tuple[Optional[Image.Image], float]:
+        started = time.perf_counter()
+        card = self.login_manager._card_generator(card_data, game_short_name)
+        return card, time.perf_counter() - started
+
+    def submit(self, card_data: Dict[str, Any], game_short_name: str) -> Future:
+        """
+        The function `submit` queues a card render and returns immediately.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param card_data (Dict[str, Any])  - The parsed card data from `_data_parser`.
+
+        .-.-.-.
+
+        @ param game_short_name (str)  - The short name of the game, used for card assets.
+
+        .-.-.-.
+
+
+
+        @ returns A `concurrent.futures.Future` resolving to the card image, or `None` when
+        `_card_generator` could not build one. Exceptions from the renderer are set on the future.
+
+        .-.-.-.
+
+
+        """
+        executor = self._get_executor()
+        if self.use_processes:
+            inner = executor.submit(_render_in_worker, card_data, game_short_name)
+        else:
+            inner = executor.submit(self._render_in_thread, card_data, game_short_name)
+        with self._lock:
+            self.submitted += 1
+
+        result: Future = Future()
+
+        def _done(finished: Future):
+            try:
+                card, seconds = finished.result()
+            except BaseException as e:
+                with self._lock:
+                    self.failed += 1
+                result.set_exception(e)
+                return
+            with self._lock:
+                self.completed += 1
+                self.render_seconds += seconds
+            result.set_result(card)
+
+        inner.add_done_callback(_done)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            finished = self.completed
+            return {
+                "mode": "process" if self.use_processes else "thread",
+                "workers": self.workers,
+                "submitted": self.submitted,
+                "completed": finished,
+                "failed": self.failed,
+                "mean_render_ms": (self.render_seconds / finished * 1000) if finished else 0.0,
+            }
+
+    def shutdown(self, wait: bool = True):
+        """
+        The function `shutdown` stops the workers. Pending renders finish first when `wait` is `True`.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param wait (bool)  - Wait for queued renders before returning.
+
+        .-.-.-.
+
+
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
@@ -25,27 +25,90 @@
 
 import sqlite3
 from sqlite3 import Connection, Cursor
-from typing import List, Dict, Any, TypedDict, Optional
+from typing import List, Dict, Any, TypedDict, Optional, Iterable, Set, Tuple, Callable, Union
+from concurrent.futures import ThreadPoolExecutor
 import os
+import hashlib
+import threading
+import time
+from functools import partial
+
+from .encrypt import FORMAT_V1, LazySecret, blob_version, decrypt_bytes, encrypt, upgrade_blob
+from .exceptions import CryptoJobError, MigrationError
+from .migrations import Migration, backup_database, migrate, schema_version
 
 class Account(TypedDict):
     id: Optional[int]
     nickname: str
     username: str
-    encrypted_password: str
+    encrypted_password: Union[bytes, str, LazySecret]
     games: List[str]
-    cookie_daily_login: Optional[str]
-    cookie_codes: Optional[str]
+    cookie_daily_login: Union[None, str, bytes, LazySecret]
+    cookie_codes: Union[None, str, bytes, LazySecret]
     passing: bool
-    webhook: Optional[str]
+    webhook: Union[None, str, bytes, LazySecret]
 
 class Group(TypedDict):
     id: Optional[int]
     name: str
     members: List[str]
 
+class OutboxMessage(TypedDict):
+    id: int
+    url: str
+    content: str
+    attachment: Optional[bytes]
+    attachment_name: Optional[str]
+    attachment_type: Optional[str]
+    attempts: int
+    next_attempt_at: float
+
+class GameStatus(TypedDict):
+    account_id: int
+    game: str
+    last_sign_date: Optional[str]
+    total_sign_day: Optional[int]
+    last_error: Optional[str]
+    last_latency: Optional[float]
+    updated_at: float
+
+class RunSummary(TypedDict):
+    id: int
+    started_at: float
+    ended_at: Optional[float]
+    max_concurrency: Optional[int]
+    accounts: Optional[int]
+    failed: Optional[int]
+
+class RunEvent(TypedDict):
+    run_id: Optional[int]
+    account_id: Optional[int]
+    game: str
+    started_at: float
+    ended_at: float
+    http_calls: int
+    retries: int
+    retcode: Optional[int]
+    render_ms: Optional[float]
+    success: bool
+    error: Optional[str]
+
+class CryptoJobProgress(TypedDict):
+    job_id: int
+    operation: str
+    rows_total: int
+    rows_done: int
+    rows_failed: int
+    elapsed_seconds: float
+    finished: bool
+
 class DatabaseManager:
-    def __init__(self, database_file='Info.db', runtime='os'):
+    SECRET_COLUMNS = ("encrypted_password", "cookie_daily_login", "cookie_codes", "webhook")
+    CRYPTO_OPERATIONS = ("encrypt", "decrypt", "rekey", "upgrade")
+    ACCOUNT_COLUMNS = "id, nickname, username, encrypted_password, games, cookie_daily_login, cookie_codes, passing, webhook"
+    BUSY_TIMEOUT_MS = 5000
+
+    def __init__(self, database_file='Info.db', runtime='os', journal_mode='WAL', synchronous='NORMAL'):
         """
         The function initializes a database file path based on the runtime environment (OS or Docker)
         and creates the necessary directories if they do not exist.
@@ -69,10 +132,26 @@ class DatabaseManager:
         
         .-.-.-.
         
+        @ param journal_mode (str)  - SQLite journal mode. 'WAL' lets the GUI, the headless runner and
+        `temp_database_loader.py` read while another one writes; use 'DELETE' on file systems without
+        shared memory support (some network mounts).
+        
+        .-.-.-.
+        
+        @ param synchronous (str)  - SQLite `synchronous` setting. 'NORMAL' is safe with WAL and skips an
+        fsync per commit.
+        
+        .-.-.-.
+        
         
         """
         self.runtime = runtime
         self.database_file = database_file
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
+        self._local = threading.local()
+        self._connections: List[Connection] = []
+        self._connections_lock = threading.Lock()
 
         if self.runtime == 'os':
             if os.name == 'nt':
@@ -100,18 +179,28 @@ class DatabaseManager:
                 os.makedirs(db_dir, exist_ok=True)
             # print(f"Database path set to: {self.database_file}") # Optional: for debugging
         
-        self.check_database()
+        if not self.check_database():
+            conn: Connection = self.get_connection()
+            try:
+                current = schema_version(conn)
+            finally:
+                self.release_connection(conn)
+            if current > SCHEMA_VERSION:
+                self.close()
+                raise MigrationError(f"Database schema version {current} is newer than this version of the app "
+                                     f"(latest {SCHEMA_VERSION}). Update HoYo Helper to use {self.database_file}.")
 
 
     def get_connection(self) -> Connection:
         """
-        The function `get_connection` returns a connection to a SQLite database using the specified
-        database file.
+        The function `get_connection` returns the calling thread's connection to the SQLite database,
+        opening and configuring it on first use. Connections are kept open and reused, so callers
+        hand them back with `release_connection` instead of closing them.
         
         .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
         
         Author - Liam Scott
-        Last update - 05/26/2025
+        Last update - 10/18/2026
         
         .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
         
@@ -123,66 +212,317 @@ class DatabaseManager:
         
         
         """
-        return sqlite3.connect(self.database_file)
+        conn: Optional[Connection] = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        # check_same_thread is off only so close() can close every thread's connection; each
+        # connection is still used by the thread that opened it.
+        conn = sqlite3.connect(self.database_file, timeout=self.BUSY_TIMEOUT_MS / 1000, check_same_thread=False)
+        conn.execute(f"PRAGMA busy_timeout = {int(self.BUSY_TIMEOUT_MS)}")
+        try:
+            mode = conn.execute(f"PRAGMA journal_mode = {self.journal_mode}").fetchone()
+            if mode and mode[0].upper() != self.journal_mode.upper():
+                print(f"Database journal mode is {mode[0]}, {self.journal_mode} is not available for {self.database_file}")
+        except sqlite3.Error as e:
+            print(f"Could not set journal mode {self.journal_mode}: {e}")
+        conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+        conn.execute("PRAGMA foreign_keys = ON")
+        self._local.conn = conn
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+
+    def release_connection(self, conn: Optional[Connection]):
+        """
+        The function `release_connection` hands a connection from `get_connection` back after use.
+        Anything left uncommitted, e.g. after an error, is rolled back so the next caller on this
+        thread starts clean and no write lock is held.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param conn (Optional[Connection])  - The connection to release.
+        
+        .-.-.-.
+        
+        
+        """
+        if conn is not None and conn.in_transaction:
+            try:
+                conn.rollback()
+            except sqlite3.Error as e:
+                print(f"Database error while releasing a connection: {e}")
+
+    def close(self):
+        """
+        The function `close` closes the connections of all threads. A later call to
+        `get_connection` opens a new one.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        
+        """
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        self._local = threading.local()
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                print(f"Database error while closing a connection: {e}")
 
     def setup_database(self) -> bool:
         """
-        The `setup_database` function creates two tables, 'accounts' and 'groups', in a database if they
-        do not already exist.
+        The `setup_database` function brings the database schema up to date by applying the pending
+        migrations in `SCHEMA_MIGRATIONS`: the 'accounts', 'groups', 'webhook_outbox',
+        'account_games' and 'group_members' tables and their indexes. Existing databases are backed up
+        next to the database file first.
         
         .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
         
         Author - Liam Scott
-        Last update - 05/26/2025
+        Last update - 10/18/2026
         
         .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
         
         
         
-        @ returns The `setup_database` method returns a boolean value `True` indicating that the
-        database setup was successful.
+        @ returns The `setup_database` method returns `True` when the schema is at `SCHEMA_VERSION`,
+        `False` if a migration failed (that migration was rolled back) or the database is newer than
+        this version of the app.
         
         .-.-.-.
         
         
         """
         conn: Connection = self.get_connection()
-        cursor: Cursor = conn.cursor()
+        try:
+            current = schema_version(conn)
+            if current == SCHEMA_VERSION:
+                return True
+            if current > SCHEMA_VERSION:
+                print(f"Database schema version {current} of {self.database_file} is newer than this version "
+                      f"of the app (latest {SCHEMA_VERSION}); refusing to use it.")
+                return False
+            has_tables = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='accounts'").fetchone() is not None
+            if has_tables:
+                backup_file = f"{self.database_file}.v{current}.bak"
+                backup_database(conn, backup_file)
+                print(f"Database backed up to {backup_file} before migrating from schema version {current}.")
+            applied = migrate(conn, SCHEMA_MIGRATIONS)
+            if applied:
+                print(f"Database schema migrated to version {applied[-1]}.")
+            return True
+        except (sqlite3.Error, MigrationError) as e:
+            print(f"Database migration failed for {self.database_file}: {e}")
+            return False
+        finally:
+            self.release_connection(conn)
+
+    @classmethod
+    def _backfill_normalized_tables(cls, cursor: Cursor):
+        """
+        The function `_backfill_normalized_tables` copies the comma-joined `accounts.games` and
+        `groups.members` of rows without normalized rows into 'account_games' and 'group_members'.
+        It covers databases from before these tables and rows written by an older version since.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param cursor (Cursor)  - A cursor inside the caller's transaction.
+        
+        .-.-.-.
+        
+        
+        """
         cursor.execute('''
-            CREATE TABLE IF NOT EXISTS accounts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                nickname TEXT NOT NULL,
-                username TEXT NOT NULL,
-                encrypted_password TEXT NOT NULL,
-                games TEXT NOT NULL,
-                cookie_daily_login TEXT,
-                cookie_codes TEXT,
-                passing INTEGER NOT NULL DEFAULT 0,
-                webhook TEXT
-            )
+            SELECT id, games FROM accounts
+            WHERE games != '' AND NOT EXISTS (SELECT 1 FROM account_games WHERE account_id = accounts.id)
         ''')
+        for account_id, games in cursor.fetchall():
+            # Runs inside migration 3, before account_games.game_key exists; migration 8 fills it in.
+            cls._write_account_games(cursor, account_id, games.split(','), with_keys=False)
         cursor.execute('''
-            CREATE TABLE IF NOT EXISTS groups (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                members TEXT
-            )
+            SELECT id, members FROM groups
+            WHERE members IS NOT NULL AND members != ''
+              AND NOT EXISTS (SELECT 1 FROM group_members WHERE group_id = groups.id)
         ''')
-        conn.commit()
-        conn.close()
-        return True
+        for group_id, members in cursor.fetchall():
+            cls._write_group_members(cursor, group_id, members.split(','))
+
+    @staticmethod
+    def _write_account_games(cursor: Cursor, account_id: int, games: List[str], with_keys: bool = True):
+        cursor.execute("DELETE FROM account_games WHERE account_id = ?", (account_id,))
+        unique_games: Dict[str, str] = {} # game_key -> display value, first spelling wins
+        for game in games:
+            if game and game.strip():
+                unique_games.setdefault(game_key(game), game.strip())
+        if with_keys:
+            cursor.executemany("INSERT INTO account_games (account_id, game, game_key, position) VALUES (?, ?, ?, ?)",
+                               [(account_id, game, key, position)
+                                for position, (key, game) in enumerate(unique_games.items())])
+        else:
+            cursor.executemany("INSERT INTO account_games (account_id, game, position) VALUES (?, ?, ?)",
+                               [(account_id, game, position) for position, game in enumerate(unique_games.values())])
+
+    @staticmethod
+    def _resolve_member(cursor: Cursor, member: str) -> Optional[int]:
+        """
+        The function `_resolve_member` finds the account a group member string refers to. Members
+        are matched by account id, then username, then nickname.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param cursor (Cursor)  - A database cursor.
+        
+        .-.-.-.
+        
+        @ param member (str)  - The member as stored in the group.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns The account id, or `None` if no account matches.
+        
+        .-.-.-.
+        
+        
+        """
+        if member.isdigit():
+            cursor.execute("SELECT id FROM accounts WHERE id = ?", (int(member),))
+            row = cursor.fetchone()
+            if row:
+                return row[0]
+        cursor.execute('''
+            SELECT id FROM accounts WHERE username = ? OR nickname = ?
+            ORDER BY username = ? DESC, id LIMIT 1
+        ''', (member, member, member))
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+    @classmethod
+    def _write_group_members(cls, cursor: Cursor, group_id: int, members: List[str]):
+        cursor.execute("DELETE FROM group_members WHERE group_id = ?", (group_id,))
+        unique_members = list(dict.fromkeys(member for member in members if member))
+        cursor.executemany("INSERT INTO group_members (group_id, member, account_id, position) VALUES (?, ?, ?, ?)",
+                           [(group_id, member, cls._resolve_member(cursor, member), position)
+                            for position, member in enumerate(unique_members)])
+
+    @staticmethod
+    def _link_group_members(cursor: Cursor, account_id: int, account_data: Account):
+        # Members added before their account existed get linked once it is saved.
+        cursor.execute('''
+            UPDATE group_members SET account_id = ?
+            WHERE account_id IS NULL AND member IN (?, ?, ?)
+        ''', (account_id, str(account_id), account_data['username'], account_data['nickname']))
+
+    @staticmethod
+    def _sync_group_members_column(cursor: Cursor, group_id: int):
+        # Keeps the legacy comma-joined column readable by older versions of the app.
+        cursor.execute('''
+            UPDATE groups SET members = (
+                SELECT COALESCE(group_concat(member, ','), '')
+                FROM (SELECT member FROM group_members WHERE group_id = ? ORDER BY position)
+            ) WHERE id = ?
+        ''', (group_id, group_id))
+
+    @staticmethod
+    def _games_by_account(cursor: Cursor, account_ids: Optional[List[int]] = None) -> Dict[int, List[str]]:
+        if account_ids is None:
+            cursor.execute("SELECT account_id, game FROM account_games ORDER BY account_id, position")
+        else:
+            placeholders = ','.join('?' * len(account_ids))
+            cursor.execute(f"SELECT account_id, game FROM account_games WHERE account_id IN ({placeholders}) "
+                           "ORDER BY account_id, position", account_ids)
+        games: Dict[int, List[str]] = {}
+        for account_id, game in cursor.fetchall():
+            games.setdefault(account_id, []).append(game)
+        return games
+
+    @staticmethod
+    def _account_from_row(row, games: Dict[int, List[str]], secret_key: Optional[str] = None,
+                          rehash: Optional[Callable[[int, str, bytes, bytes], bool]] = None) -> Account:
+        password, cookie_daily_login, cookie_codes, webhook = row[3], row[5], row[6], row[8]
+        if secret_key is not None:
+            def on_rehash(column: str) -> Optional[Callable[[bytes, bytes], bool]]:
+                return partial(rehash, row[0], column) if rehash is not None else None
+            password = LazySecret(password, secret_key, on_rehash("encrypted_password"))
+            cookie_daily_login = LazySecret(cookie_daily_login, secret_key, on_rehash("cookie_daily_login"))
+            cookie_codes = LazySecret(cookie_codes, secret_key, on_rehash("cookie_codes"))
+            webhook = LazySecret(webhook, secret_key, on_rehash("webhook"))
+        account: Account = {
+            "id": row[0],
+            "nickname": row[1],
+            "username": row[2],
+            "encrypted_password": password,
+            # Rows saved by an older version may only have the legacy column.
+            "games": games.get(row[0]) or (row[4].split(',') if row[4] else []),
+            "cookie_daily_login": cookie_daily_login,
+            "cookie_codes": cookie_codes,
+            "passing": bool(row[7]),
+            "webhook": webhook
+        }
+        return account
+
+    @staticmethod
+    def _stored(value: Any) -> Any:
+        return value.stored if isinstance(value, LazySecret) else value
+
+    def _load_accounts_where(self, where: str, params: tuple) -> List[Account]:
+        conn: Connection = self.get_connection()
+        try:
+            cursor: Cursor = conn.cursor()
+            cursor.execute(f"SELECT {self.ACCOUNT_COLUMNS} FROM accounts {where}", params)
+            rows = cursor.fetchall()
+            games = self._games_by_account(cursor, [row[0] for row in rows]) if rows else {}
+        except sqlite3.Error as e:
+            print(f"Database error while loading accounts: {e}")
+            return []
+        finally:
+            self.release_connection(conn)
+        return [self._account_from_row(row, games) for row in rows]
 
-    def load_accounts(self) -> List[Account]:
+    def load_accounts(self, secret_key: Optional[str] = None, rehash: bool = True) -> List[Account]:
         """
         This function loads account information from a database and returns a list of Account objects.
         
         .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
         
         Author - Liam Scott
-        Last update - 05/26/2025
+        Last update - 10/18/2026
         
         .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
         
+        @ param secret_key (Optional[str])  - The master key. When given, `encrypted_password`, the
+        cookie fields and the webhook are returned as `LazySecret`s that decrypt on first use.
+        
+        .-.-.-.
+        
+        @ param rehash (bool)  - Write a secret back with the current key derivation (see
+        `encrypt.needs_rehash`) the first time it decrypts with outdated parameters.
+        
+        .-.-.-.
+        
         
         
         @ returns A list of Account objects is being returned. Each Account object contains the
@@ -198,23 +538,15 @@ class DatabaseManager:
         
         conn: Connection = self.get_connection()
         cursor: Cursor = conn.cursor()
-        cursor.execute("SELECT id, nickname, username, encrypted_password, games, cookie_daily_login, cookie_codes, passing, webhook FROM accounts")
+        cursor.execute(f"SELECT {self.ACCOUNT_COLUMNS} FROM accounts")
         rows = cursor.fetchall()
-        conn.close()
+        games = self._games_by_account(cursor)
+        self.release_connection(conn)
         
         accounts: List[Account] = []
         for row in rows:
-            account: Account = {
-                "id": row[0],
-                "nickname": row[1],
-                "username": row[2],
-                "encrypted_password": row[3],
-                "games": row[4].split(',') if row[4] else [],
-                "cookie_daily_login": row[5],
-                "cookie_codes": row[6],
-                "passing": bool(row[7]),
-                "webhook": row[8]
-            }
+            account: Account = self._account_from_row(row, games, secret_key,
+                                                      self.rehash_secret if rehash else None)
             accounts.append(account)
         return accounts
 
@@ -255,20 +587,23 @@ class DatabaseManager:
             ''', (
                 account_data['nickname'], 
                 account_data['username'], 
-                account_data['encrypted_password'], 
+                self._stored(account_data['encrypted_password']), 
                 ','.join(account_data['games']), 
-                account_data.get('cookie_daily_login'), 
-                account_data.get('cookie_codes'), 
+                self._stored(account_data.get('cookie_daily_login')), 
+                self._stored(account_data.get('cookie_codes')), 
                 int(account_data['passing']), 
-                account_data.get('webhook')
+                self._stored(account_data.get('webhook'))
             ))
+            account_id = cursor.lastrowid
+            self._write_account_games(cursor, account_id, account_data['games'])
+            self._link_group_members(cursor, account_id, account_data)
             conn.commit()
-            return cursor.lastrowid
+            return account_id
         except sqlite3.Error as e:
             print(f"Database error in save_account: {e}")
             return None
         finally:
-            conn.close()
+            self.release_connection(conn)
 
 
     def update_account(self, account_data: Account) -> bool:
@@ -291,6 +626,7 @@ class DatabaseManager:
         
         
         
+        
         @ returns The `update_account` method returns a boolean value. It returns `True` if the account
         update was successful (if `cursor.rowcount` is greater than 0), and `False` if there was an
         error during the update process or if the account data does not have an 'id' key.
@@ -302,6 +638,7 @@ class DatabaseManager:
         if account_data.get('id') is None:
             return False 
             
+        secrets = {column: self._stored(account_data.get(column)) for column in self.SECRET_COLUMNS}
         conn: Connection = self.get_connection()
         cursor: Cursor = conn.cursor()
         try:
@@ -313,21 +650,25 @@ class DatabaseManager:
             ''', (
                 account_data['nickname'], 
                 account_data['username'], 
-                account_data['encrypted_password'], 
+                secrets['encrypted_password'], 
                 ','.join(account_data['games']), 
-                account_data.get('cookie_daily_login'), 
-                account_data.get('cookie_codes'), 
+                secrets['cookie_daily_login'], 
+                secrets['cookie_codes'], 
                 int(account_data['passing']), 
-                account_data.get('webhook'), 
+                secrets['webhook'], 
                 account_data['id']
             ))
+            if cursor.rowcount == 0:
+                return False
+            self._write_account_games(cursor, account_data['id'], account_data['games'])
+            self._link_group_members(cursor, account_data['id'], account_data)
             conn.commit()
-            return cursor.rowcount > 0
+            return True
         except sqlite3.Error as e:
             print(f"Database error in update_account: {e}")
             return False
         finally:
-            conn.close()
+            self.release_connection(conn)
 
 
     def delete_account(self, account_id: int) -> bool:
@@ -368,7 +709,7 @@ class DatabaseManager:
             print(f"Database error in delete_account: {e}")
             return False
         finally:
-            conn.close()
+            self.release_connection(conn)
 
     def load_groups(self) -> List[Group]:
         """
@@ -398,14 +739,18 @@ class DatabaseManager:
         cursor: Cursor = conn.cursor()
         cursor.execute("SELECT id, name, members FROM groups")
         rows = cursor.fetchall()
-        conn.close()
+        cursor.execute("SELECT group_id, member FROM group_members ORDER BY group_id, position")
+        members_by_group: Dict[int, List[str]] = {}
+        for group_id, member in cursor.fetchall():
+            members_by_group.setdefault(group_id, []).append(member)
+        self.release_connection(conn)
         
         groups: List[Group] = []
         for row in rows:
             group: Group = {
                 "id": row[0],
                 "name": row[1],
-                "members": row[2].split(',') if row[2] else []
+                "members": members_by_group.get(row[0]) or (row[2].split(',') if row[2] else [])
             }
             groups.append(group)
         return groups
@@ -450,13 +795,15 @@ class DatabaseManager:
                 group_data['name'], 
                 ','.join(group_data['members'])
             ))
+            group_id = cursor.lastrowid
+            self._write_group_members(cursor, group_id, group_data['members'])
             conn.commit()
-            return cursor.lastrowid
+            return group_id
         except sqlite3.Error as e:
             print(f"Database error in save_group: {e}")
             return None
         finally:
-            conn.close()
+            self.release_connection(conn)
 
     def update_group(self, group_data: Group) -> bool:
         """
@@ -503,13 +850,16 @@ class DatabaseManager:
                 ','.join(group_data['members']),
                 group_data['id']
             ))
+            if cursor.rowcount == 0:
+                return False
+            self._write_group_members(cursor, group_data['id'], group_data['members'])
             conn.commit()
-            return cursor.rowcount > 0
+            return True
         except sqlite3.Error as e:
             print(f"Database error in update_group: {e}")
             return False
         finally:
-            conn.close()
+            self.release_connection(conn)
 
 
     def remove_group_member(self, group_id: int, member_to_remove: str) -> bool:
@@ -548,23 +898,17 @@ class DatabaseManager:
         conn: Connection = self.get_connection()
         cursor: Cursor = conn.cursor()
         try:
-            cursor.execute("SELECT members FROM groups WHERE id=?", (group_id,))
-            row = cursor.fetchone()
-            if row is None:
+            cursor.execute("DELETE FROM group_members WHERE group_id=? AND member=?", (group_id, member_to_remove))
+            if cursor.rowcount == 0:
                 return False
-            
-            members = row[0].split(',') if row[0] else []
-            if member_to_remove in members:
-                members.remove(member_to_remove)
-                cursor.execute("UPDATE groups SET members=? WHERE id=?", (','.join(members), group_id))
-                conn.commit()
-                return cursor.rowcount > 0
-            return False
+            self._sync_group_members_column(cursor, group_id)
+            conn.commit()
+            return True
         except sqlite3.Error as e:
             print(f"Database error in remove_group_member: {e}")
             return False
         finally:
-            conn.close()
+            self.release_connection(conn)
 
     def add_group_member(self, group_id: int, member_to_add: str) -> bool:
         """
@@ -602,25 +946,25 @@ class DatabaseManager:
         conn: Connection = self.get_connection()
         cursor: Cursor = conn.cursor()
         try:
-            cursor.execute("SELECT members FROM groups WHERE id=?", (group_id,))
-            row = cursor.fetchone()
-            if row is None:
+            if not member_to_add:
                 return False
-            
-            members = row[0].split(',') if row[0] else []
-            if member_to_add not in members:
-                members.append(member_to_add)
-                # Filter out empty strings if members list was empty initially and resulted in ['']
-                members = [m for m in members if m] 
-                cursor.execute("UPDATE groups SET members=? WHERE id=?", (','.join(members), group_id))
-                conn.commit()
-                return cursor.rowcount > 0
-            return False
+            cursor.execute("SELECT 1 FROM groups WHERE id=?", (group_id,))
+            if cursor.fetchone() is None:
+                return False
+            cursor.execute('''
+                INSERT OR IGNORE INTO group_members (group_id, member, account_id, position)
+                VALUES (?, ?, ?, (SELECT COALESCE(MAX(position) + 1, 0) FROM group_members WHERE group_id = ?))
+            ''', (group_id, member_to_add, self._resolve_member(cursor, member_to_add), group_id))
+            if cursor.rowcount == 0:
+                return False
+            self._sync_group_members_column(cursor, group_id)
+            conn.commit()
+            return True
         except sqlite3.Error as e:
             print(f"Database error in add_group_member: {e}")
             return False
         finally:
-            conn.close()
+            self.release_connection(conn)
 
     def delete_group(self, group_id: int) -> bool:
         """
@@ -661,107 +1005,1369 @@ class DatabaseManager:
             print(f"Database error in delete_group: {e}")
             return False
         finally:
-            conn.close()
+            self.release_connection(conn)
         
-    def check_database(self) -> bool:
+    def load_accounts_by_game(self, game: str) -> List[Account]:
         """
-        The function `check_database` checks if a database directory and file exist, creates them if
-        necessary, and verifies the database tables.
+        The function `load_accounts_by_game` loads the accounts that have `game` linked, through the
+        `account_games` index instead of loading and filtering every account. Codes are matched on
+        `game_key`, so 'GI', ' gi' and 'gi' are the same game.
         
         .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
         
         Author - Liam Scott
-        Last update - 05/26/2025
+        Last update - 10/18/2026
         
         .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
         
+        @ param game (str)  - The game code, e.g. 'hsr'.
         
+        .-.-.-.
         
-        @ returns The `check_database` method returns a boolean value. It returns `True` if the database
-        check is successful, and `False` if there is an error during the process.
+        
+        
+        @ returns A list of Account objects, in id order.
         
         .-.-.-.
         
         
         """
-        db_dir = os.path.dirname(self.database_file)
-        if not os.path.exists(db_dir):
-            try:
-                os.makedirs(db_dir, exist_ok=True)
-            except OSError as e:
-                print(f"Error creating database directory {db_dir}: {e}")
-                return False
+        return self._load_accounts_where(
+            "WHERE id IN (SELECT account_id FROM account_games WHERE game_key = ?) ORDER BY id", (game_key(game),))
 
-        if not os.path.exists(self.database_file):
-            self.setup_database()
+    def load_accounts_by_group(self, group_id: int) -> List[Account]:
+        """
+        The function `load_accounts_by_group` loads the accounts that are members of a group, in
+        member order. Members that do not match an account are left out.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param group_id (int)  - The id of the group.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns A list of Account objects.
+        
+        .-.-.-.
+        
+        
+        """
+        return self._load_accounts_where(
+            "JOIN group_members ON group_members.account_id = accounts.id "
+            "WHERE group_members.group_id = ? ORDER BY group_members.position", (group_id,))
+
+    def load_group_ids_for_account(self, account_id: int) -> List[int]:
+        """
+        The function `load_group_ids_for_account` returns the ids of the groups an account is a
+        member of.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param account_id (int)  - The id of the account.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns A list of group ids, empty on a database error.
+        
+        .-.-.-.
+        
         
+        """
+        conn: Connection = self.get_connection()
         try:
-            conn: Connection = self.get_connection()
-            self.check_tables(conn)
-            conn.close()
-            return True
+            cursor: Cursor = conn.execute(
+                "SELECT group_id FROM group_members WHERE account_id = ? ORDER BY group_id", (account_id,))
+            return [row[0] for row in cursor.fetchall()]
         except sqlite3.Error as e:
-            print(f"Database check failed for {self.database_file}: {e}")
-            return False
+            print(f"Database error in load_group_ids_for_account: {e}")
+            return []
+        finally:
+            self.release_connection(conn)
 
-    def check_tables(self, conn: Optional[Connection] = None) -> bool:
+    def upgrade_account_encryption(self, master_key: str) -> Tuple[int, int]:
         """
-        The function `check_tables` checks if specific tables exist in a SQLite database and creates
-        them if they do not.
+        The function `upgrade_account_encryption` rewrites every account password still stored in the
+        version 1 format as a version 2 envelope, so later decrypts share one key derivation per
+        session. All rewrites are committed together.
         
         .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
         
         Author - Liam Scott
-        Last update - 05/26/2025
+        Last update - 10/18/2026
         
         .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
         
-        @ param conn (Optional[Connection])  - The `conn` parameter in the `check_tables` method is a
-        connection object to a SQLite database. It is an optional parameter, meaning it can be provided
-        by the caller, but if not provided, the method will attempt to obtain a connection using the
-        `self.get_connection()` method.
+        @ param master_key (str)  - The key the passwords are encrypted with.
         
         .-.-.-.
         
         
         
-        @ returns The `check_tables` method returns a boolean value. It returns `True` if the 'accounts'
-        and 'groups' tables exist in the database, or if they do not exist but were successfully created
-        by calling `self.setup_database()`. It returns `False` if there was an error checking the tables
-        or if the tables do not exist and could not be created.
+        @ returns A tuple of (upgraded, failed) row counts. Rows that do not decrypt with `master_key`
+        are left as they are and counted as failed.
         
         .-.-.-.
         
         
         """
-        close_conn_here = False
-        if conn is None:
-            conn = self.get_connection()
-            close_conn_here = True
-        
+        conn: Connection = self.get_connection()
         try:
-            cursor: Cursor = conn.cursor()
-            
-            table_exists = True
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='accounts'")
-            if cursor.fetchone() is None:
-                table_exists = False
-            
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='groups'")
-            if cursor.fetchone() is None:
-                table_exists = False
-
-            if not table_exists:
-                if close_conn_here:
-                    conn.close()
-                    close_conn_here = False 
-                self.setup_database() 
-                return True
+            rows = conn.execute("SELECT id, encrypted_password FROM accounts").fetchall()
+            upgraded: List[Tuple[bytes, int]] = []
+            failed = 0
+            for account_id, encrypted_password in rows:
+                if not encrypted_password or isinstance(encrypted_password, str):
+                    continue
+                if blob_version(encrypted_password) != FORMAT_V1:
+                    continue
+                try:
+                    upgraded.append((upgrade_blob(master_key, encrypted_password), account_id))
+                except ValueError:
+                    failed += 1
+            if upgraded:
+                conn.executemany("UPDATE accounts SET encrypted_password = ? WHERE id = ?", upgraded)
+                conn.commit()
+            return len(upgraded), failed
+        except sqlite3.Error as e:
+            print(f"Database error in upgrade_account_encryption: {e}")
+            return 0, 0
+        finally:
+            self.release_connection(conn)
 
-            return True
+    def rehash_secret(self, account_id: int, column: str, old: bytes, new: bytes) -> bool:
+        """
+        The function `rehash_secret` replaces one encrypted account secret with the same value
+        encrypted under the current key derivation. The row is only written if it still holds `old`,
+        so a secret changed in the meantime is never overwritten.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param account_id (int)  - The id of the account.
+        
+        .-.-.-.
+        
+        @ param column (str)  - One of `SECRET_COLUMNS`.
+        
+        .-.-.-.
+        
+        @ param old (bytes)  - The blob that was decrypted.
+        
+        .-.-.-.
+        
+        @ param new (bytes)  - The re-encrypted blob.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns `True` if the row was updated.
+        
+        .-.-.-.
+        
+        
+        """
+        if column not in self.SECRET_COLUMNS:
+            raise ValueError(f"{column} is not a secret column.")
+        conn: Connection = self.get_connection()
+        try:
+            cursor = conn.execute(f"UPDATE accounts SET {column} = ? WHERE id = ? AND {column} IS ?",
+                                  (new, account_id, old))
+            conn.commit()
+            return cursor.rowcount == 1
         except sqlite3.Error as e:
-            print(f"Error checking tables: {e}")
+            print(f"Database error in rehash_secret: {e}")
             return False
         finally:
-            if close_conn_here and conn:
-                conn.close()
\ No newline at end of file
+            self.release_connection(conn)
+
+    @staticmethod
+    def _crypto_transform(operation: str, key: str, new_key: Optional[str]) -> Callable[[Any], Any]:
+        def transform(value: Any) -> Any:
+            if operation == "encrypt":
+                return encrypt(key, value) if isinstance(value, str) and value else value
+            if not isinstance(value, (bytes, bytearray)) or not value:
+                return value # Plain text is already decrypted
+            if operation == "decrypt":
+                return decrypt_bytes(key, value).decode('utf-8')
+            if operation == "rekey":
+                return encrypt(new_key, decrypt_bytes(key, value).decode('utf-8'))
+            return upgrade_blob(key, value) if blob_version(value) == FORMAT_V1 else value
+        return transform
+
+    @staticmethod
+    def _transform_row(row: tuple, transform: Callable[[Any], Any]) -> Optional[tuple]:
+        try:
+            return tuple(transform(value) for value in row[1:])
+        except ValueError: # Wrong key, corrupted blob or non UTF-8 plaintext
+            return None
+
+    def run_crypto_job(self, operation: str, key: str, new_key: Optional[str] = None,
+                       columns: Optional[Iterable[str]] = None, chunk_size: int = 200, workers: int = 4,
+                       progress: Optional[Callable[[CryptoJobProgress], None]] = None) -> CryptoJobProgress:
+        """
+        The function `run_crypto_job` encrypts, decrypts, re-keys or upgrades the secret columns of
+        every account. Rows are streamed in id order, `chunk_size` at a time; a chunk is transformed in
+        a pool of `workers` threads and written in one transaction together with the job's position
+        in `crypto_jobs`. An interrupted job is resumed from the last committed chunk by calling this
+        again with the same operation and columns.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param operation (str)  - 'encrypt' (plain text values to v2 blobs), 'decrypt' (blobs to plain
+        text), 'rekey' (blobs under `key` to blobs under `new_key`) or 'upgrade' (v1 blobs to v2).
+        Values already in the target form are left alone.
+        
+        .-.-.-.
+        
+        @ param key (str)  - The master key to encrypt with, or that the blobs are encrypted with.
+        
+        .-.-.-.
+        
+        @ param new_key (Optional[str])  - The new master key, only for 'rekey'.
+        
+        .-.-.-.
+        
+        @ param columns (Optional[Iterable[str]])  - The columns to process, all of `SECRET_COLUMNS`
+        when `None`.
+        
+        .-.-.-.
+        
+        @ param chunk_size (int)  - Rows per transaction.
+        
+        .-.-.-.
+        
+        @ param workers (int)  - Threads that encrypt or decrypt the rows of a chunk.
+        
+        .-.-.-.
+        
+        @ param progress (Optional[Callable[[CryptoJobProgress], None]])  - Called after every chunk.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns The final `CryptoJobProgress`. Rows that do not decrypt with `key`, or that changed
+        while the job ran, are left as they are and counted in `rows_failed`. Raises `CryptoJobError`
+        if a different job is unfinished or a database error stops the job.
+        
+        .-.-.-.
+        
+        
+        """
+        if operation not in self.CRYPTO_OPERATIONS:
+            raise ValueError(f"Unknown crypto job operation '{operation}'.")
+        if operation == "rekey" and not new_key:
+            raise ValueError("A 'rekey' job needs new_key.")
+        columns = tuple(columns) if columns else self.SECRET_COLUMNS
+        unknown = [column for column in columns if column not in self.SECRET_COLUMNS]
+        if unknown:
+            raise ValueError(f"Not secret account columns: {', '.join(unknown)}.")
+        column_list = ", ".join(columns)
+        set_clause = ", ".join(f"{column} = ?" for column in columns)
+        guard_clause = " AND ".join(f"{column} IS ?" for column in columns)
+
+        conn: Connection = self.get_connection()
+        job_id: Optional[int] = None
+        try:
+            job = conn.execute("SELECT id, operation, columns, last_id, rows_done, rows_failed FROM crypto_jobs "
+                               "WHERE status = 'running' ORDER BY id DESC LIMIT 1").fetchone()
+            if job is not None and (job[1], job[2]) != (operation, column_list):
+                raise CryptoJobError(f"The '{job[1]}' job on {job[2]} is unfinished; run it again to resume it "
+                                     f"before starting another.", job_id=job[0])
+            if job is None:
+                now = time.time()
+                cursor: Cursor = conn.execute('''
+                    INSERT INTO crypto_jobs (operation, columns, last_id, rows_done, rows_failed, status, started_at, updated_at)
+                    VALUES (?, ?, 0, 0, 0, 'running', ?, ?)
+                ''', (operation, column_list, now, now))
+                conn.commit()
+                job = (cursor.lastrowid, operation, column_list, 0, 0, 0)
+            job_id, _, _, last_id, rows_done, rows_failed = job
+            remaining = conn.execute("SELECT COUNT(*) FROM accounts WHERE id > ?", (last_id,)).fetchone()[0]
+            report: CryptoJobProgress = {
+                "job_id": job_id,
+                "operation": operation,
+                "rows_total": rows_done + remaining,
+                "rows_done": rows_done,
+                "rows_failed": rows_failed,
+                "elapsed_seconds": 0.0,
+                "finished": False
+            }
+
+            transform = self._crypto_transform(operation, key, new_key)
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+                while True:
+                    rows = conn.execute(f"SELECT id, {column_list} FROM accounts WHERE id > ? ORDER BY id LIMIT ?",
+                                        (last_id, max(1, chunk_size))).fetchall()
+                    if not rows:
+                        break
+                    results = list(pool.map(lambda row: self._transform_row(row, transform), rows))
+                    conn.execute("BEGIN IMMEDIATE")
+                    for row, new_values in zip(rows, results):
+                        if new_values is None:
+                            rows_failed += 1
+                        elif new_values != tuple(row[1:]):
+                            # Only overwrite what was read, a row edited meanwhile is left alone
+                            cursor = conn.execute(f"UPDATE accounts SET {set_clause} WHERE id = ? AND {guard_clause}",
+                                                  (*new_values, row[0], *row[1:]))
+                            rows_failed += cursor.rowcount == 0
+                    last_id = rows[-1][0]
+                    rows_done += len(rows)
+                    conn.execute("UPDATE crypto_jobs SET last_id = ?, rows_done = ?, rows_failed = ?, updated_at = ? "
+                                 "WHERE id = ?", (last_id, rows_done, rows_failed, time.time(), job_id))
+                    conn.commit()
+                    report.update(rows_done=rows_done, rows_failed=rows_failed,
+                                  rows_total=max(report["rows_total"], rows_done),
+                                  elapsed_seconds=time.perf_counter() - started)
+                    if progress is not None:
+                        progress(dict(report))
+
+            conn.execute("UPDATE crypto_jobs SET status = 'done', updated_at = ? WHERE id = ?", (time.time(), job_id))
+            conn.commit()
+            report.update(finished=True, elapsed_seconds=time.perf_counter() - started)
+            return report
+        except sqlite3.Error as e:
+            raise CryptoJobError(f"Database error in the '{operation}' job.", job_id=job_id,
+                                 original_exception=e) from e
+        finally:
+            self.release_connection(conn)
+
+    def check_database(self) -> bool:
+        """
+        The function `check_database` checks if a database directory and file exist, creates them if
+        necessary, and verifies the database tables.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 05/26/2025
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        
+        
+        @ returns The `check_database` method returns a boolean value. It returns `True` if the database
+        check is successful, and `False` if there is an error during the process or the schema is
+        newer than this version of the app.
+        
+        .-.-.-.
+        
+        
+        """
+        db_dir = os.path.dirname(self.database_file)
+        if not os.path.exists(db_dir):
+            try:
+                os.makedirs(db_dir, exist_ok=True)
+            except OSError as e:
+                print(f"Error creating database directory {db_dir}: {e}")
+                return False
+
+        if not os.path.exists(self.database_file):
+            self.setup_database()
+        
+        try:
+            conn: Connection = self.get_connection()
+            try:
+                return self.check_tables(conn)
+            finally:
+                self.release_connection(conn)
+        except sqlite3.Error as e:
+            print(f"Database check failed for {self.database_file}: {e}")
+            return False
+
+    def check_tables(self, conn: Optional[Connection] = None) -> bool:
+        """
+        The function `check_tables` checks the schema version of a SQLite database with a single
+        `PRAGMA user_version` query and migrates it when it is behind.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param conn (Optional[Connection])  - The `conn` parameter in the `check_tables` method is a
+        connection object to a SQLite database. It is an optional parameter, meaning it can be provided
+        by the caller, but if not provided, the method will attempt to obtain a connection using the
+        `self.get_connection()` method.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns The `check_tables` method returns a boolean value. It returns `True` if the schema is
+        up to date, or was brought up to date by calling `self.setup_database()`. It returns `False` if
+        there was an error checking the version, a migration failed or the schema is newer than this
+        version of the app.
+        
+        .-.-.-.
+        
+        
+        """
+        close_conn_here = False
+        if conn is None:
+            conn = self.get_connection()
+            close_conn_here = True
+        
+        try:
+            if schema_version(conn) != SCHEMA_VERSION:
+                return self.setup_database()
+            return True
+        except sqlite3.Error as e:
+            print(f"Error checking tables: {e}")
+            return False
+        finally:
+            if close_conn_here and conn:
+                self.release_connection(conn)
+
+    def record_game_status(self, account_id: int, game: str, sign_date: Optional[str], total_sign_day: Optional[int],
+                           error: Optional[str], latency: Optional[float]) -> bool:
+        """
+        The function `record_game_status` stores the result of processing one game of an account.
+        The sign date and day count are only replaced when the new run has them, so a failed run
+        keeps the last known good values next to its error.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param account_id (int)  - The id of the account.
+        
+        .-.-.-.
+        
+        @ param game (str)  - The game code, e.g. 'hsr'.
+        
+        .-.-.-.
+        
+        @ param sign_date (Optional[str])  - The check-in day ('YYYY-MM-DD', server reset timezone) the
+        account is known to be signed in for, `None` if it is not.
+        
+        .-.-.-.
+        
+        @ param total_sign_day (Optional[int])  - The `total_sign_day` reported by the API.
+        
+        .-.-.-.
+        
+        @ param error (Optional[str])  - The error of this run, `None` on success.
+        
+        .-.-.-.
+        
+        @ param latency (Optional[float])  - Seconds the run took.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns `True` on success, `False` if there was a database error.
+        
+        .-.-.-.
+        
+        
+        """
+        conn: Connection = self.get_connection()
+        try:
+            conn.execute('''
+                INSERT INTO account_game_status (account_id, game, last_sign_date, total_sign_day, last_error, last_latency, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (account_id, game) DO UPDATE SET
+                    last_sign_date = COALESCE(excluded.last_sign_date, last_sign_date),
+                    total_sign_day = COALESCE(excluded.total_sign_day, total_sign_day),
+                    last_error = excluded.last_error,
+                    last_latency = excluded.last_latency,
+                    updated_at = excluded.updated_at
+            ''', (account_id, game, sign_date, total_sign_day, error[:500] if error else None, latency, time.time()))
+            conn.commit()
+            return True
+        except sqlite3.Error as e:
+            print(f"Database error in record_game_status: {e}")
+            return False
+        finally:
+            self.release_connection(conn)
+
+    def load_signed_games(self, sign_date: str) -> Set[Tuple[int, str]]:
+        """
+        The function `load_signed_games` returns the account and game pairs known to be signed in for
+        a check-in day, so a run can skip them.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param sign_date (str)  - The check-in day, 'YYYY-MM-DD' in the server reset timezone.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns A set of `(account_id, game)` tuples, empty on a database error.
+        
+        .-.-.-.
+        
+        
+        """
+        conn: Connection = self.get_connection()
+        try:
+            cursor: Cursor = conn.execute(
+                "SELECT account_id, game FROM account_game_status WHERE last_sign_date = ?", (sign_date,))
+            return {(row[0], row[1]) for row in cursor.fetchall()}
+        except sqlite3.Error as e:
+            print(f"Database error in load_signed_games: {e}")
+            return set()
+        finally:
+            self.release_connection(conn)
+
+    def load_game_status(self, account_id: Optional[int] = None) -> List[GameStatus]:
+        """
+        The function `load_game_status` loads the stored run status of every game of one account, or
+        of all accounts.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param account_id (Optional[int])  - The id of the account, all accounts when `None`.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns A list of `GameStatus` dictionaries, empty on a database error.
+        
+        .-.-.-.
+        
+        
+        """
+        query = ("SELECT account_id, game, last_sign_date, total_sign_day, last_error, last_latency, updated_at "
+                 "FROM account_game_status")
+        params: tuple = ()
+        if account_id is not None:
+            query += " WHERE account_id = ?"
+            params = (account_id,)
+        conn: Connection = self.get_connection()
+        try:
+            rows = conn.execute(query + " ORDER BY account_id, game", params).fetchall()
+        except sqlite3.Error as e:
+            print(f"Database error in load_game_status: {e}")
+            return []
+        finally:
+            self.release_connection(conn)
+
+        statuses: List[GameStatus] = []
+        for row in rows:
+            status: GameStatus = {
+                "account_id": row[0],
+                "game": row[1],
+                "last_sign_date": row[2],
+                "total_sign_day": row[3],
+                "last_error": row[4],
+                "last_latency": row[5],
+                "updated_at": row[6]
+            }
+            statuses.append(status)
+        return statuses
+
+    def start_run(self, started_at: float, max_concurrency: int) -> Optional[int]:
+        """
+        The function `start_run` opens a row in the run journal for a headless run.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param started_at (float)  - Unix time the run started.
+        
+        .-.-.-.
+        
+        @ param max_concurrency (int)  - How many accounts the run processes at once.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns The id of the new run, or `None` if there was a database error.
+        
+        .-.-.-.
+        
+        
+        """
+        conn: Connection = self.get_connection()
+        try:
+            cursor: Cursor = conn.execute("INSERT INTO runs (started_at, max_concurrency) VALUES (?, ?)",
+                                          (started_at, max_concurrency))
+            conn.commit()
+            return cursor.lastrowid
+        except sqlite3.Error as e:
+            print(f"Database error in start_run: {e}")
+            return None
+        finally:
+            self.release_connection(conn)
+
+    def finish_run(self, run_id: int, ended_at: float, accounts: int, failed: int) -> bool:
+        """
+        The function `finish_run` closes a run journal row with its end time and account counts.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param run_id (int)  - The id returned by `start_run`.
+        
+        .-.-.-.
+        
+        @ param ended_at (float)  - Unix time the run ended.
+        
+        .-.-.-.
+        
+        @ param accounts (int)  - How many accounts the run processed.
+        
+        .-.-.-.
+        
+        @ param failed (int)  - How many of them raised an error.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns `True` on success, `False` if there was a database error.
+        
+        .-.-.-.
+        
+        
+        """
+        conn: Connection = self.get_connection()
+        try:
+            conn.execute("UPDATE runs SET ended_at = ?, accounts = ?, failed = ? WHERE id = ?",
+                         (ended_at, accounts, failed, run_id))
+            conn.commit()
+            return True
+        except sqlite3.Error as e:
+            print(f"Database error in finish_run: {e}")
+            return False
+        finally:
+            self.release_connection(conn)
+
+    def record_run_events(self, run_id: int, events: List[RunEvent]) -> bool:
+        """
+        The function `record_run_events` writes a batch of per-game journal entries in one
+        transaction.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param run_id (int)  - The run the entries belong to.
+        
+        .-.-.-.
+        
+        @ param events (List[RunEvent])  - The entries to write.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns `True` on success, `False` if there was a database error and nothing was written.
+        
+        .-.-.-.
+        
+        
+        """
+        conn: Connection = self.get_connection()
+        try:
+            conn.executemany('''
+                INSERT INTO run_events (run_id, account_id, game, started_at, ended_at, http_calls, retries, retcode,
+                                        render_ms, success, error)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', [(run_id, event["account_id"], event["game"], event["started_at"], event["ended_at"],
+                   event["http_calls"], event["retries"], event["retcode"], event["render_ms"],
+                   int(event["success"]), event["error"][:500] if event["error"] else None) for event in events])
+            conn.commit()
+            return True
+        except sqlite3.Error as e:
+            print(f"Database error in record_run_events: {e}")
+            return False
+        finally:
+            self.release_connection(conn)
+
+    def load_runs(self, since: float) -> List[RunSummary]:
+        """
+        The function `load_runs` loads the runs that started at or after `since`, oldest first.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param since (float)  - Unix time of the oldest run to return.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns A list of `RunSummary` dictionaries, empty on a database error.
+        
+        .-.-.-.
+        
+        
+        """
+        conn: Connection = self.get_connection()
+        try:
+            rows = conn.execute("SELECT id, started_at, ended_at, max_concurrency, accounts, failed FROM runs "
+                                "WHERE started_at >= ? ORDER BY started_at", (since,)).fetchall()
+        except sqlite3.Error as e:
+            print(f"Database error in load_runs: {e}")
+            return []
+        finally:
+            self.release_connection(conn)
+
+        runs: List[RunSummary] = []
+        for row in rows:
+            run: RunSummary = {
+                "id": row[0],
+                "started_at": row[1],
+                "ended_at": row[2],
+                "max_concurrency": row[3],
+                "accounts": row[4],
+                "failed": row[5]
+            }
+            runs.append(run)
+        return runs
+
+    def load_run_events(self, since: float) -> List[RunEvent]:
+        """
+        The function `load_run_events` loads the per-game journal entries that started at or after
+        `since`, oldest first.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param since (float)  - Unix time of the oldest entry to return.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns A list of `RunEvent` dictionaries, empty on a database error.
+        
+        .-.-.-.
+        
+        
+        """
+        conn: Connection = self.get_connection()
+        try:
+            rows = conn.execute('''
+                SELECT run_id, account_id, game, started_at, ended_at, http_calls, retries, retcode, render_ms,
+                       success, error
+                FROM run_events WHERE started_at >= ? ORDER BY started_at
+            ''', (since,)).fetchall()
+        except sqlite3.Error as e:
+            print(f"Database error in load_run_events: {e}")
+            return []
+        finally:
+            self.release_connection(conn)
+
+        events: List[RunEvent] = []
+        for row in rows:
+            event: RunEvent = {
+                "run_id": row[0],
+                "account_id": row[1],
+                "game": row[2],
+                "started_at": row[3],
+                "ended_at": row[4],
+                "http_calls": row[5],
+                "retries": row[6],
+                "retcode": row[7],
+                "render_ms": row[8],
+                "success": bool(row[9]),
+                "error": row[10]
+            }
+            events.append(event)
+        return events
+
+    def purge_runs(self, older_than: float = 90 * 24 * 3600) -> int:
+        """
+        The function `purge_runs` deletes journal runs older than `older_than` seconds together with
+        their entries.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param older_than (float)  - Age in seconds after which runs are removed.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns The number of deleted runs.
+        
+        .-.-.-.
+        
+        
+        """
+        conn: Connection = self.get_connection()
+        try:
+            cursor: Cursor = conn.execute("DELETE FROM runs WHERE started_at < ?", (time.time() - older_than,))
+            conn.commit()
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            print(f"Database error in purge_runs: {e}")
+            return 0
+        finally:
+            self.release_connection(conn)
+
+    def enqueue_webhook(self, url: str, content: str, attachment: Optional[bytes] = None,
+                        attachment_name: Optional[str] = None, attachment_type: Optional[str] = None,
+                        secret_key: Optional[str] = None) -> Optional[int]:
+        """
+        The function `enqueue_webhook` stores a webhook message in the outbox table so it survives a
+        crash or restart until it is delivered. A webhook URL is a credential, so with `secret_key`
+        it is stored encrypted like `accounts.webhook`; rows to the same URL are matched on a hash of
+        it instead.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param url (str)  - The webhook URL.
+        
+        .-.-.-.
+        
+        @ param content (str)  - The message content.
+        
+        .-.-.-.
+        
+        @ param attachment (Optional[bytes])  - Encoded file attached to the message, e.g. the card PNG.
+        
+        .-.-.-.
+        
+        @ param attachment_name (Optional[str])  - File name of the attachment.
+        
+        .-.-.-.
+        
+        @ param attachment_type (Optional[str])  - MIME type of the attachment.
+        
+        .-.-.-.
+        
+        @ param secret_key (Optional[str])  - The master key to encrypt the URL with, plain text when `None`.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns The id of the outbox row, or `None` if the insert failed.
+        
+        .-.-.-.
+        
+        
+        """
+        now = time.time()
+        stored_url = encrypt(secret_key, url) if secret_key else url
+        conn: Connection = self.get_connection()
+        try:
+            cursor: Cursor = conn.cursor()
+            cursor.execute('''
+                INSERT INTO webhook_outbox (url, url_key, content, attachment, attachment_name, attachment_type,
+                                            created_at, next_attempt_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (stored_url, _outbox_url_key(url), content, attachment, attachment_name, attachment_type, now, now))
+            conn.commit()
+            return cursor.lastrowid
+        except sqlite3.Error as e:
+            print(f"Database error in enqueue_webhook: {e}")
+            return None
+        finally:
+            self.release_connection(conn)
+
+    def load_pending_webhooks(self, after_id: int = 0, limit: int = 500, now: Optional[float] = None,
+                              secret_key: Optional[str] = None) -> List[OutboxMessage]:
+        """
+        The function `load_pending_webhooks` reads one page of due outbox rows in id order. Paging on
+        `id > after_id` uses the primary key, so draining a large backlog stays cheap. Rows whose URL
+        does not decrypt with `secret_key` can never be delivered and are marked 'failed'.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param after_id (int)  - Only rows with a larger id are returned.
+        
+        .-.-.-.
+        
+        @ param limit (int)  - Page size.
+        
+        .-.-.-.
+        
+        @ param now (Optional[float])  - Rows whose `next_attempt_at` is later than this are skipped.
+        
+        .-.-.-.
+        
+        @ param secret_key (Optional[str])  - The master key encrypted URLs are decrypted with.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns A list of `OutboxMessage` dictionaries, empty when nothing is due.
+        
+        .-.-.-.
+        
+        
+        """
+        now = time.time() if now is None else now
+        messages: List[OutboxMessage] = []
+        conn: Connection = self.get_connection()
+        try:
+            while not messages:
+                cursor: Cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT id, url, content, attachment, attachment_name, attachment_type, attempts, next_attempt_at
+                    FROM webhook_outbox
+                    WHERE status = 'pending' AND next_attempt_at <= ? AND id > ?
+                    ORDER BY id
+                    LIMIT ?
+                ''', (now, after_id, limit))
+                rows = cursor.fetchall()
+                if not rows:
+                    break
+                after_id = rows[-1][0]
+                undeliverable = self._outbox_messages(rows, secret_key, messages)
+                if undeliverable:
+                    conn.executemany("UPDATE webhook_outbox SET status = 'failed', last_error = ? WHERE id = ?",
+                                     [("The webhook URL could not be decrypted.", message_id) for message_id in undeliverable])
+                    conn.commit()
+        except sqlite3.Error as e:
+            print(f"Database error in load_pending_webhooks: {e}")
+            return []
+        finally:
+            self.release_connection(conn)
+        return messages
+
+    @staticmethod
+    def _outbox_messages(rows: list, secret_key: Optional[str], messages: List[OutboxMessage]) -> List[int]:
+        undeliverable: List[int] = []
+        for row in rows:
+            url = row[1]
+            if isinstance(url, bytes):
+                try:
+                    if secret_key is None:
+                        raise ValueError("No key to decrypt the webhook URL.")
+                    url = decrypt_bytes(secret_key, url).decode('utf-8')
+                except (ValueError, UnicodeDecodeError) as e:
+                    print(f"Outbox message {row[0]} cannot be delivered: {e}")
+                    undeliverable.append(row[0])
+                    continue
+            message: OutboxMessage = {
+                "id": row[0],
+                "url": url,
+                "content": row[2],
+                "attachment": row[3],
+                "attachment_name": row[4],
+                "attachment_type": row[5],
+                "attempts": row[6],
+                "next_attempt_at": row[7]
+            }
+            messages.append(message)
+        return undeliverable
+
+    def mark_webhooks_sent(self, message_ids: Iterable[int]) -> bool:
+        """
+        The function `mark_webhooks_sent` marks delivered outbox rows as sent in one transaction.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param message_ids (Iterable[int])  - The ids of the delivered rows.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns `True` on success, `False` if there was a database error.
+        
+        .-.-.-.
+        
+        
+        """
+        now = time.time()
+        conn: Connection = self.get_connection()
+        try:
+            conn.executemany("UPDATE webhook_outbox SET status = 'sent', sent_at = ?, last_error = NULL WHERE id = ?",
+                             [(now, message_id) for message_id in message_ids])
+            conn.commit()
+            return True
+        except sqlite3.Error as e:
+            print(f"Database error in mark_webhooks_sent: {e}")
+            return False
+        finally:
+            self.release_connection(conn)
+
+    def reschedule_webhooks(self, message_ids: Iterable[int], delay: float, error: str, max_attempts: int = 20) -> bool:
+        """
+        The function `reschedule_webhooks` records a failed delivery and pushes the next attempt back
+        by `delay` seconds. Rows that failed `max_attempts` times are marked 'failed' and no longer
+        retried. Later pending rows for the same URL are held back too, so delivery order is kept.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param message_ids (Iterable[int])  - The ids of the rows that failed.
+        
+        .-.-.-.
+        
+        @ param delay (float)  - Seconds until the next attempt.
+        
+        .-.-.-.
+        
+        @ param error (str)  - Description of the failure, stored in `last_error`.
+        
+        .-.-.-.
+        
+        @ param max_attempts (int)  - Attempts after which a row is given up on.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns `True` on success, `False` if there was a database error.
+        
+        .-.-.-.
+        
+        
+        """
+        next_attempt_at = time.time() + delay
+        ids = list(message_ids)
+        conn: Connection = self.get_connection()
+        try:
+            conn.executemany('''
+                UPDATE webhook_outbox
+                SET attempts = attempts + 1, next_attempt_at = ?, last_error = ?,
+                    status = CASE WHEN attempts + 1 >= ? THEN 'failed' ELSE status END
+                WHERE id = ?
+            ''', [(next_attempt_at, error[:500], max_attempts, message_id) for message_id in ids])
+            conn.executemany('''
+                UPDATE webhook_outbox SET next_attempt_at = MAX(next_attempt_at, ?)
+                WHERE status = 'pending' AND id > ? AND url_key = (SELECT url_key FROM webhook_outbox WHERE id = ?)
+            ''', [(next_attempt_at, message_id, message_id) for message_id in ids])
+            conn.commit()
+            return True
+        except sqlite3.Error as e:
+            print(f"Database error in reschedule_webhooks: {e}")
+            return False
+        finally:
+            self.release_connection(conn)
+
+    def purge_sent_webhooks(self, older_than: float = 7 * 24 * 3600) -> int:
+        """
+        The function `purge_sent_webhooks` deletes delivered outbox rows older than `older_than`
+        seconds, and rows given up on ('failed') that were queued that long ago, so card blobs and
+        webhook URLs do not pile up in the database.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param older_than (float)  - Age in seconds after which sent and failed rows are removed.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns The number of deleted rows.
+        
+        .-.-.-.
+        
+        
+        """
+        conn: Connection = self.get_connection()
+        try:
+            cutoff = time.time() - older_than
+            cursor: Cursor = conn.execute('''
+                DELETE FROM webhook_outbox
+                WHERE (status = 'sent' AND sent_at < ?) OR (status = 'failed' AND created_at < ?)
+            ''', (cutoff, cutoff))
+            conn.commit()
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            print(f"Database error in purge_sent_webhooks: {e}")
+            return 0
+        finally:
+            self.release_connection(conn)
+
+
+def _create_base_tables(cursor: Cursor):
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS accounts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nickname TEXT NOT NULL,
+            username TEXT NOT NULL,
+            encrypted_password TEXT NOT NULL,
+            games TEXT NOT NULL,
+            cookie_daily_login TEXT,
+            cookie_codes TEXT,
+            passing INTEGER NOT NULL DEFAULT 0,
+            webhook TEXT
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS groups (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            members TEXT
+        )
+    ''')
+
+
+def _create_webhook_outbox(cursor: Cursor):
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS webhook_outbox (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            url TEXT NOT NULL,
+            content TEXT NOT NULL,
+            attachment BLOB,
+            attachment_name TEXT,
+            attachment_type TEXT,
+            created_at REAL NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at REAL NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            sent_at REAL,
+            last_error TEXT
+        )
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_webhook_outbox_status_next
+        ON webhook_outbox (status, next_attempt_at)
+    ''')
+
+
+def game_key(game: str) -> str:
+    # The form game codes are compared in everywhere: the headless runner, account_game_status, account_games.
+    return game.strip().lower()
+
+
+def _add_account_games_key(cursor: Cursor):
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(account_games)")}
+    if "game_key" not in columns:
+        cursor.execute("ALTER TABLE account_games ADD COLUMN game_key TEXT")
+    cursor.execute("UPDATE account_games SET game_key = lower(trim(game)) WHERE game_key IS NULL")
+    # 'GI' and ' gi' on one account were two rows; keep the first one listed.
+    cursor.execute('''
+        DELETE FROM account_games
+        WHERE EXISTS (SELECT 1 FROM account_games AS earlier
+                      WHERE earlier.account_id = account_games.account_id AND earlier.game_key = account_games.game_key
+                        AND (earlier.position < account_games.position
+                             OR (earlier.position = account_games.position AND earlier.game < account_games.game)))
+    ''')
+    cursor.execute("DROP INDEX IF EXISTS idx_account_games_game")
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_account_games_key
+        ON account_games (game_key, account_id)
+    ''')
+
+
+def _outbox_url_key(url: str) -> str:
+    # Groups outbox rows by target without storing the URL; webhook tokens are too long to guess from it.
+    return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+
+def _add_outbox_url_key(cursor: Cursor):
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(webhook_outbox)")}
+    if "url_key" not in columns:
+        cursor.execute("ALTER TABLE webhook_outbox ADD COLUMN url_key TEXT")
+    rows = cursor.execute("SELECT id, url FROM webhook_outbox WHERE url_key IS NULL AND typeof(url) = 'text'").fetchall()
+    cursor.executemany("UPDATE webhook_outbox SET url_key = ? WHERE id = ?",
+                       [(_outbox_url_key(url), message_id) for message_id, url in rows])
+
+
+def _create_normalized_tables(cursor: Cursor):
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS account_games (
+            account_id INTEGER NOT NULL REFERENCES accounts (id) ON DELETE CASCADE,
+            game TEXT NOT NULL,
+            position INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (account_id, game)
+        ) WITHOUT ROWID
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_account_games_game
+        ON account_games (game, account_id)
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS group_members (
+            group_id INTEGER NOT NULL REFERENCES groups (id) ON DELETE CASCADE,
+            member TEXT NOT NULL,
+            account_id INTEGER REFERENCES accounts (id) ON DELETE SET NULL,
+            position INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (group_id, member)
+        ) WITHOUT ROWID
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_group_members_account
+        ON group_members (account_id, group_id)
+    ''')
+    DatabaseManager._backfill_normalized_tables(cursor)
+
+
+def _create_account_game_status(cursor: Cursor):
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS account_game_status (
+            account_id INTEGER NOT NULL REFERENCES accounts (id) ON DELETE CASCADE,
+            game TEXT NOT NULL,
+            last_sign_date TEXT,
+            total_sign_day INTEGER,
+            last_error TEXT,
+            last_latency REAL,
+            updated_at REAL NOT NULL,
+            PRIMARY KEY (account_id, game)
+        ) WITHOUT ROWID
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_account_game_status_date
+        ON account_game_status (last_sign_date)
+    ''')
+
+
+def _create_run_journal(cursor: Cursor):
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY,
+            started_at REAL NOT NULL,
+            ended_at REAL,
+            max_concurrency INTEGER,
+            accounts INTEGER,
+            failed INTEGER
+        )
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_runs_started_at
+        ON runs (started_at)
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS run_events (
+            id INTEGER PRIMARY KEY,
+            run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+            account_id INTEGER REFERENCES accounts (id) ON DELETE SET NULL,
+            game TEXT NOT NULL,
+            started_at REAL NOT NULL,
+            ended_at REAL NOT NULL,
+            http_calls INTEGER NOT NULL DEFAULT 0,
+            retries INTEGER NOT NULL DEFAULT 0,
+            retcode INTEGER,
+            render_ms REAL,
+            success INTEGER NOT NULL,
+            error TEXT
+        )
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_run_events_run
+        ON run_events (run_id)
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_run_events_started_at
+        ON run_events (started_at)
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_run_events_account
+        ON run_events (account_id)
+    ''')
+
+
+def _create_crypto_jobs(cursor: Cursor):
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS crypto_jobs (
+            id INTEGER PRIMARY KEY,
+            operation TEXT NOT NULL,
+            columns TEXT NOT NULL,
+            last_id INTEGER NOT NULL DEFAULT 0,
+            rows_done INTEGER NOT NULL DEFAULT 0,
+            rows_failed INTEGER NOT NULL DEFAULT 0,
+            status TEXT NOT NULL DEFAULT 'running',
+            started_at REAL NOT NULL,
+            updated_at REAL NOT NULL
+        )
+    ''')
+
+
+# Append new migrations with the next version number; never edit or reorder shipped ones. Every
+# step must also work on databases from before versioning (user_version 0), hence IF NOT EXISTS.
+SCHEMA_MIGRATIONS: List[Migration] = [
+    Migration(1, "accounts and groups", _create_base_tables),
+    Migration(2, "webhook outbox", _create_webhook_outbox),
+    Migration(3, "account_games and group_members", _create_normalized_tables),
+    Migration(4, "account_game_status", _create_account_game_status),
+    Migration(5, "runs and run_events", _create_run_journal),
+    Migration(6, "crypto_jobs", _create_crypto_jobs),
+    Migration(7, "webhook_outbox.url_key", _add_outbox_url_key),
+    Migration(8, "account_games.game_key", _add_account_games_key),
+]
+SCHEMA_VERSION = SCHEMA_MIGRATIONS[-1].version
@@ -25,20 +25,262 @@
 
 import os
 import base64
+import hashlib
+import hmac
+import threading
+import time
+from collections import OrderedDict
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+from cryptography.hazmat.primitives.kdf.argon2 import Argon2id
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.exceptions import InvalidTag, UnsupportedAlgorithm
 from cryptography.hazmat.primitives import padding
 from cryptography.hazmat.backends import default_backend
-from typing import Tuple
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
 
-def derive_key(password: str, salt: bytes) -> bytes:
+KDF_ITERATIONS = 100_000
+KEY_CACHE_SIZE = 4096
+
+# Blob formats. v1: salt16 | iv16 | AES-256-CBC. v2: 0x02 | kdf_id | params_len | params | kek_salt16 |
+# wrap_nonce12 | wrapped_key48 | nonce12 | AES-256-GCM ciphertext and tag. The bytes up to kek_salt
+# are authenticated as associated data of both GCM operations.
+FORMAT_V1 = 0x01
+FORMAT_V2 = 0x02
+KDF_PBKDF2_SHA256 = 0x01
+KDF_SCRYPT = 0x02
+KDF_ARGON2ID = 0x03
+
+# Derived keys are cached per (master key fingerprint, KDF parameters, salt). The fingerprint is an HMAC
+# with a per-process secret, so the cache never holds the master key itself and its entries are
+# useless outside this process. Values are bytearrays so wipe_key_cache can zero them.
+_key_cache: "OrderedDict[bytes, bytearray]" = OrderedDict()
+_key_cache_lock = threading.Lock()
+_key_cache_secret = os.urandom(32)
+_key_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+_session_kek_salt: Optional[bytes] = None # Shared by every v2 blob written this session
+
+
+def _cache_key(password: str, salt: bytes, params: "KdfParams") -> bytes:
+    fingerprint = hmac.new(_key_cache_secret, password.encode(), hashlib.sha256).digest()
+    kdf_id, packed = params.pack()
+    return fingerprint + bytes([kdf_id, len(packed)]) + packed + bytes(salt)
+
+
+def _evict_over_limit():
+    # Caller holds _key_cache_lock.
+    while len(_key_cache) > KEY_CACHE_SIZE:
+        _, evicted = _key_cache.popitem(last=False)
+        evicted[:] = bytes(len(evicted))
+        _key_cache_stats["evictions"] += 1
+
+
+def set_key_cache_size(size: int):
+    """
+    The function `set_key_cache_size` changes how many derived keys are kept, 0 turns the cache off.
+    Entries over the new size are wiped, least recently used first.
+    
+    Author - Liam Scott
+    Last update - 10/18/2026
+    
+    @ param size (int)  - The maximum number of cached keys, one per encrypted value in use.
+    
+    """
+    global KEY_CACHE_SIZE
+    with _key_cache_lock:
+        KEY_CACHE_SIZE = max(0, int(size))
+        _evict_over_limit()
+
+
+def wipe_key_cache():
+    """
+    The function `wipe_key_cache` zeroes and drops every cached derived key and starts a new
+    encryption session. Call it when the master key is locked or replaced and when the app shuts
+    down.
+    
+    Author - Liam Scott
+    Last update - 10/18/2026
+    
+    """
+    global _session_kek_salt
+    with _key_cache_lock:
+        _session_kek_salt = None
+        for key in _key_cache.values():
+            key[:] = bytes(len(key))
+        _key_cache.clear()
+
+
+def key_cache_stats() -> Dict[str, int]:
+    with _key_cache_lock:
+        return dict(_key_cache_stats, entries=len(_key_cache), max_entries=KEY_CACHE_SIZE)
+
+
+class KdfParams(NamedTuple):
+    algorithm: str = "pbkdf2"
+    iterations: int = KDF_ITERATIONS
+    memory_kib: int = 0
+    parallelism: int = 1
+
+    def pack(self) -> Tuple[int, bytes]:
+        """
+        The function `pack` encodes the parameters for the header of a v2 blob. scrypt stores
+        log2(N) and p with r fixed at 8, so its memory is N KiB; Argon2id stores its time cost, memory
+        and lanes.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        @ returns A tuple of (kdf_id, parameter bytes). Raises `ValueError` for invalid parameters or
+        parameters above `KDF_MAXIMUMS`, which could not be decrypted again.
+        
+        """
+        if not self.within_limits():
+            raise ValueError(f"Key derivation parameters {self} exceed {KDF_MAXIMUMS.get(self.algorithm)}.")
+        if self.algorithm == "pbkdf2" and 1 <= self.iterations < 2 ** 32:
+            return KDF_PBKDF2_SHA256, self.iterations.to_bytes(4, "big")
+        if (self.algorithm == "scrypt" and self.iterations >= 2 and self.iterations & (self.iterations - 1) == 0
+                and 1 <= self.parallelism < 256):
+            return KDF_SCRYPT, bytes([self.iterations.bit_length() - 1, self.parallelism])
+        if (self.algorithm == "argon2id" and 1 <= self.iterations < 2 ** 32 and 8 * self.parallelism <= self.memory_kib < 2 ** 32
+                and 1 <= self.parallelism < 256):
+            return KDF_ARGON2ID, self.iterations.to_bytes(4, "big") + self.memory_kib.to_bytes(4, "big") + bytes([self.parallelism])
+        raise ValueError(f"Invalid key derivation parameters {self}.")
+
+    @classmethod
+    def unpack(cls, kdf_id: int, params: bytes) -> "KdfParams":
+        """
+        The function `unpack` decodes the parameters from the header of a v2 blob. The header is read
+        before the blob is authenticated, and a v1 blob can parse as v2 by chance, so parameters above
+        `KDF_MAXIMUMS` are refused rather than run.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        @ param kdf_id (int)  - The KDF byte of the header.
+        @ param params (bytes)  - The parameter bytes of the header.
+        
+        @ returns The `KdfParams`. Raises `ValueError` for an unknown KDF or parameters out of bounds.
+        
+        """
+        if kdf_id == KDF_PBKDF2_SHA256 and len(params) == 4:
+            unpacked = cls("pbkdf2", int.from_bytes(params, "big"), 0, 1)
+        elif kdf_id == KDF_SCRYPT and len(params) == 2 and 1 <= params[0] < 32:
+            unpacked = cls("scrypt", 1 << params[0], 1 << params[0], params[1])
+        elif kdf_id == KDF_ARGON2ID and len(params) == 9:
+            unpacked = cls("argon2id", int.from_bytes(params[:4], "big"), int.from_bytes(params[4:8], "big"), params[8])
+        else:
+            raise ValueError(f"Unsupported key derivation {kdf_id} in encrypted data.")
+        try:
+            unpacked.pack() # Checks the lower bounds and KDF_MAXIMUMS
+        except ValueError as e:
+            raise ValueError(f"Key derivation parameters {unpacked} in encrypted data are out of bounds.") from e
+        return unpacked
+
+    def within_limits(self) -> bool:
+        maximum = KDF_MAXIMUMS.get(self.algorithm)
+        return (maximum is not None and self.iterations <= maximum.iterations
+                and self.memory_kib <= maximum.memory_kib and self.parallelism <= maximum.parallelism)
+
+    def describe(self) -> str:
+        if self.algorithm == "pbkdf2":
+            return f"PBKDF2-SHA256, {self.iterations:,} iterations"
+        if self.algorithm == "scrypt":
+            return f"scrypt, N=2^{self.iterations.bit_length() - 1} ({self.memory_kib // 1024} MiB), p={self.parallelism}"
+        return f"Argon2id, t={self.iterations}, {self.memory_kib // 1024} MiB, {self.parallelism} lane(s)"
+
+
+# Calibration never goes below these, whatever the host measures. The PBKDF2 floor is the iteration
+# count every blob used before calibration existed; the Argon2id one follows the OWASP minimum.
+KDF_MINIMUMS: Dict[str, KdfParams] = {
+    "pbkdf2": KdfParams("pbkdf2", KDF_ITERATIONS, 0, 1),
+    "scrypt": KdfParams("scrypt", 2 ** 15, 2 ** 15, 1),
+    "argon2id": KdfParams("argon2id", 2, 19 * 1024, 1),
+}
+
+# Nothing is derived above these: 200 times the PBKDF2 floor, 1 GiB for scrypt and Argon2id. They
+# bound the work a corrupted header or a v1 blob misread as v2 can cause.
+KDF_MAXIMUMS: Dict[str, KdfParams] = {
+    "pbkdf2": KdfParams("pbkdf2", 200 * KDF_ITERATIONS, 0, 1),
+    "scrypt": KdfParams("scrypt", 2 ** 20, 2 ** 20, 16),
+    "argon2id": KdfParams("argon2id", 64, 1024 * 1024, 16),
+}
+
+_kdf_params = KdfParams()
+
+
+def set_kdf_params(params: KdfParams):
+    """
+    The function `set_kdf_params` chooses the key derivation for v2 blobs written from now on.
+    Existing blobs keep the parameters in their header and are rehashed on their next successful
+    decrypt (see `needs_rehash`).
+    
+    Author - Liam Scott
+    Last update - 10/18/2026
+    
+    @ param params (KdfParams)  - The new parameters, for example from `calibrate_kdf`.
+    
+    """
+    global _kdf_params
+    params.pack()
+    _kdf_params = params
+
+
+def get_kdf_params() -> KdfParams:
+    return _kdf_params
+
+
+def _derive_key_uncached(password: str, salt: bytes, params: KdfParams) -> bytes:
+    if params.algorithm == "scrypt":
+        kdf = Scrypt(salt=salt, length=32, n=params.iterations, r=8, p=params.parallelism)
+    elif params.algorithm == "argon2id":
+        try:
+            kdf = Argon2id(salt=salt, length=32, iterations=params.iterations, lanes=params.parallelism,
+                           memory_cost=params.memory_kib)
+        except UnsupportedAlgorithm as e:
+            raise ValueError("Argon2id is not supported by this OpenSSL build.") from e
+    else:
+        kdf = PBKDF2HMAC(
+            algorithm=hashes.SHA256(),
+            length=32,       
+            salt=salt,
+            iterations=params.iterations,
+            backend=default_backend()
+        )
+    try:
+        return kdf.derive(password.encode())
+    except MemoryError as e:
+        raise ValueError(f"Not enough memory for {params.describe()}.") from e
+
+
+def _cached_derive(password: str, salt: bytes, params: KdfParams) -> bytes:
+    cache_key = _cache_key(password, salt, params)
+    with _key_cache_lock:
+        cached = _key_cache.get(cache_key)
+        if cached is not None:
+            _key_cache.move_to_end(cache_key)
+            _key_cache_stats["hits"] += 1
+            return bytes(cached)
+        _key_cache_stats["misses"] += 1
+
+    key = _derive_key_uncached(password, salt, params)
+    with _key_cache_lock:
+        if KEY_CACHE_SIZE:
+            _key_cache[cache_key] = bytearray(key)
+            _key_cache.move_to_end(cache_key)
+            _evict_over_limit()
+    return key
+
+
+def derive_key(password: str, salt: bytes, iterations: int = KDF_ITERATIONS) -> bytes:
     """
     The function `derive_key` takes a password and a salt, derives a key using PBKDF2HMAC with SHA256
-    algorithm, and returns the key as bytes.
+    algorithm, and returns the key as bytes. Derived keys are kept in a bounded LRU cache, so
+    decrypting the same value again does not pay for 100,000 PBKDF2 iterations.
     
     Author - Liam Scott
-    Last update - 10/28/2024
+    Last update - 10/18/2026
     
     @ param password (str)  - The `derive_key` function takes a password as a string and a salt as
     bytes. It uses the PBKDF2HMAC key derivation function with SHA256 hashing algorithm, a key length of
@@ -47,42 +289,122 @@ def derive_key(password: str, salt: bytes) -> bytes:
     a key derivation function (KDF). It helps protect against dictionary attacks and rainbow table
     attacks by ensuring that even if two users have the same password, their derived keys will be
     different due to the unique salt used during the
+    @ param iterations (int)  - PBKDF2 iterations, as stored in the blob.
     
     @ returns The function `derive_key` takes a password as a string and a salt as bytes, then uses
     PBKDF2HMAC with SHA256 hashing algorithm to derive a key of length 32 bytes using 100,000
-    iterations. The derived key is then printed in hexadecimal format and returned as bytes.
-    
-    """
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=32,       
-        salt=salt,
-        iterations=100_000,
-        backend=default_backend()
-    )
-    key = kdf.derive(password.encode())
-    print(f"Derived key: {key.hex()}")
-    return key
+    iterations, and returns it as bytes.
+    
+    """
+    return _cached_derive(password, salt, KdfParams("pbkdf2", iterations, 0, 1))
+
+
+def measure_kdf(params: KdfParams, rounds: int = 2) -> float:
+    """
+    The function `measure_kdf` times one key derivation with `params` on this machine, bypassing the
+    key cache.
+    
+    Author - Liam Scott
+    Last update - 10/18/2026
+    
+    @ param params (KdfParams)  - The parameters to time.
+    @ param rounds (int)  - How many derivations to run; the fastest is reported.
+    
+    @ returns The time of one derivation in seconds.
+    
+    """
+    salt = os.urandom(16)
+    timings = []
+    for _ in range(max(1, rounds)):
+        started = time.perf_counter()
+        _derive_key_uncached("calibration", salt, params)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
 
 
-def encrypt(password: str, plaintext: str) -> Tuple[bytes, bytes]:
+def calibrate_kdf(algorithm: str = "pbkdf2", target_ms: float = 250.0, max_memory_kib: int = 256 * 1024,
+                  parallelism: int = 1) -> KdfParams:
     """
-    The function encrypts plaintext using AES encryption with a given password and returns the salt, IV,
-    and ciphertext.
+    The function `calibrate_kdf` picks key derivation parameters that take about `target_ms` on this
+    machine. PBKDF2 and Argon2id scale their iteration count; scrypt doubles N (and its memory) while
+    it fits. The result never drops below `KDF_MINIMUMS`, so a slow host gets a slower derivation
+    rather than a weaker one.
     
     Author - Liam Scott
-    Last update - 10/28/2024
+    Last update - 10/18/2026
+    
+    @ param algorithm (str)  - 'pbkdf2', 'scrypt' or 'argon2id'.
+    @ param target_ms (float)  - The wanted time of one derivation, in milliseconds.
+    @ param max_memory_kib (int)  - Upper bound for the memory of scrypt and Argon2id.
+    @ param parallelism (int)  - scrypt p or Argon2id lanes.
+    
+    @ returns The calibrated `KdfParams`. Raises `ValueError` for an unknown algorithm or when Argon2id
+    is not available.
+    
+    """
+    target = max(1.0, target_ms) / 1000
+    minimum = KDF_MINIMUMS.get(algorithm)
+    if minimum is None:
+        raise ValueError(f"Unknown key derivation '{algorithm}', use one of {', '.join(KDF_MINIMUMS)}.")
+    maximum = KDF_MAXIMUMS[algorithm]
+    parallelism = max(1, min(parallelism, maximum.parallelism))
+    max_memory_kib = min(max_memory_kib, maximum.memory_kib)
+
+    if algorithm == "pbkdf2":
+        probe = KdfParams("pbkdf2", 20_000, 0, 1)
+        iterations = int(probe.iterations * target / measure_kdf(probe)) // 1000 * 1000
+        return KdfParams("pbkdf2", min(maximum.iterations, max(minimum.iterations, iterations)), 0, 1)
+
+    if algorithm == "scrypt":
+        params = minimum._replace(parallelism=parallelism)
+        while params.memory_kib * 2 <= max_memory_kib:
+            seconds = measure_kdf(params, rounds=1)
+            if seconds * 2 > target: # The next doubling would overshoot
+                break
+            params = params._replace(iterations=params.iterations * 2, memory_kib=params.memory_kib * 2)
+        return params
+
+    memory_kib = max(minimum.memory_kib, min(64 * 1024, max_memory_kib))
+    probe = KdfParams("argon2id", minimum.iterations, memory_kib, parallelism)
+    iterations = round(probe.iterations * target / measure_kdf(probe))
+    return probe._replace(iterations=min(maximum.iterations, max(minimum.iterations, iterations)))
+
+
+def encrypt(password: str, plaintext: str, version: int = FORMAT_V2) -> bytes:
+    """
+    The function encrypts plaintext with a given password. Version 2 (the default) writes an AES-GCM
+    envelope: the record is sealed with a random data key, and the data key is wrapped with the
+    session's key-encryption key, which is derived from the password once per session. Version 1
+    writes the old salt, IV and AES-CBC ciphertext with its own PBKDF2 run.
+    
+    Author - Liam Scott
+    Last update - 10/18/2026
     
     @ param password (str)  - The `password` parameter is a string that will be used to derive a key for
     encryption.
-    @ param plaintext (str)  - The `encrypt` function you provided seems to be encrypting the plaintext
-    using AES encryption in CBC mode with a randomly generated salt and IV. The key is derived from the
-    password using a function `derive_key` which is not shown in the code snippet.
+    @ param plaintext (str)  - The text to encrypt.
+    @ param version (int)  - The blob format to write, `FORMAT_V2` or `FORMAT_V1`.
     
-    @ returns The `encrypt` function returns a tuple containing two bytes objects: the `salt`, `iv`, and
-    `ciphertext` concatenated together.
+    @ returns The encrypted blob as bytes.
     
     """
+    if version == FORMAT_V1:
+        return _encrypt_v1(password, plaintext)
+    if version != FORMAT_V2:
+        raise ValueError(f"Unknown encryption format version {version}.")
+
+    kdf_id, params = _kdf_params.pack()
+    header = bytes([FORMAT_V2, kdf_id, len(params)]) + params + _session_salt()
+    kek = _key_encryption_key(password, kdf_id, params, header[-16:])
+    data_key = AESGCM.generate_key(bit_length=256)
+    wrap_nonce = os.urandom(12)
+    nonce = os.urandom(12)
+    wrapped_key = AESGCM(kek).encrypt(wrap_nonce, data_key, header)
+    ciphertext = AESGCM(data_key).encrypt(nonce, plaintext.encode('utf-8'), header)
+    return header + wrap_nonce + wrapped_key + nonce + ciphertext
+
+
+def _encrypt_v1(password: str, plaintext: str) -> bytes:
     backend = default_backend()
     salt = os.urandom(16) 
     key = derive_key(password, salt)
@@ -99,28 +421,104 @@ def encrypt(password: str, plaintext: str) -> Tuple[bytes, bytes]:
     return salt + iv + ciphertext
 
 
+def _session_salt() -> bytes:
+    global _session_kek_salt
+    with _key_cache_lock:
+        if _session_kek_salt is None:
+            _session_kek_salt = os.urandom(16)
+        return _session_kek_salt
 
-def decrypt(password: str, encrypted_data: bytes) -> str:
+
+def prime_session_key(password: str):
     """
-    The function decrypts encrypted data using a password and returns the decrypted plaintext.
+    The function `prime_session_key` derives the key-encryption key of this session's v2 blobs now,
+    so the next `encrypt` calls only pay for AES-GCM. Call it from a worker thread before code that
+    encrypts on the event loop.
     
     Author - Liam Scott
-    Last update - 10/28/2024
+    Last update - 10/18/2026
     
-    @ param password (str)  - The `decrypt` function you provided seems to be decrypting data using AES
-    encryption with CBC mode. It derives a key from the password and decrypts the encrypted data using
-    the key, salt, and IV.
-    @ param encrypted_data (bytes)  - The `decrypt` function you provided is used to decrypt data that
-    has been encrypted using AES encryption with a specific password. The function extracts the salt,
-    IV, and ciphertext from the encrypted data, derives a key using the provided password and salt, and
-    then decrypts the ciphertext using AES in CBC mode
+    @ param password (str)  - The master key.
     
-    @ returns The `decrypt` function returns a decrypted string obtained from the encrypted data using
-    the provided password. If the decryption is successful, it returns the decrypted plaintext as a
-    UTF-8 decoded string. If there are any errors during decryption, it prints an error message and
-    returns an empty string.
+    """
+    kdf_id, params = _kdf_params.pack()
+    _key_encryption_key(password, kdf_id, params, _session_salt())
+
+
+def _key_encryption_key(password: str, kdf_id: int, params: bytes, kek_salt: bytes) -> bytes:
+    return _cached_derive(password, kek_salt, KdfParams.unpack(kdf_id, params))
+
+
+def _parse_v2(encrypted_data: bytes) -> Tuple[bytes, int, bytes, bytes, bytes, bytes, bytes, bytes]:
+    if len(encrypted_data) < 3 or encrypted_data[0] != FORMAT_V2:
+        raise ValueError("Not a version 2 blob.")
+    params_end = 3 + encrypted_data[2]
+    header_end = params_end + 16
+    if len(encrypted_data) < header_end + 12 + 48 + 12 + 16:
+        raise ValueError("Version 2 blob is truncated.")
+    kdf_id = encrypted_data[1]
+    params = encrypted_data[3:params_end]
+    kek_salt = encrypted_data[params_end:header_end]
+    wrap_nonce = encrypted_data[header_end:header_end + 12]
+    wrapped_key = encrypted_data[header_end + 12:header_end + 60]
+    nonce = encrypted_data[header_end + 60:header_end + 72]
+    ciphertext = encrypted_data[header_end + 72:]
+    return encrypted_data[:header_end], kdf_id, params, kek_salt, wrap_nonce, wrapped_key, nonce, ciphertext
+
+
+def blob_version(encrypted_data: bytes) -> int:
+    """
+    The function `blob_version` tells which format an encrypted blob was written in, from its header
+    byte. Version 1 blobs start with a random salt, so a version 1 blob can look like version 2;
+    `decrypt` falls back to version 1 when a version 2 blob does not authenticate.
+    
+    Author - Liam Scott
+    Last update - 10/18/2026
+    
+    @ param encrypted_data (bytes)  - The blob.
+    
+    @ returns `FORMAT_V2` when the blob parses as version 2 with a known KDF within `KDF_MAXIMUMS`,
+    `FORMAT_V1` otherwise.
+    
+    """
+    try:
+        _, kdf_id, params, _, _, _, _, _ = _parse_v2(bytes(encrypted_data))
+        KdfParams.unpack(kdf_id, params)
+    except ValueError:
+        return FORMAT_V1
+    return FORMAT_V2
+
+
+def needs_rehash(encrypted_data: bytes) -> bool:
+    """
+    The function `needs_rehash` tells whether a blob should be written again: version 1 blobs and
+    version 2 blobs whose key derivation differs from the current `set_kdf_params`.
+    
+    Author - Liam Scott
+    Last update - 10/18/2026
+    
+    @ param encrypted_data (bytes)  - The blob.
+    
+    @ returns `True` if the blob is outdated.
     
     """
+    if blob_version(encrypted_data) != FORMAT_V2:
+        return True
+    _, kdf_id, params, _, _, _, _, _ = _parse_v2(bytes(encrypted_data))
+    return (kdf_id, params) != _kdf_params.pack()
+
+
+def _decrypt_v2(password: str, encrypted_data: bytes) -> bytes:
+    header, kdf_id, params, kek_salt, wrap_nonce, wrapped_key, nonce, ciphertext = _parse_v2(encrypted_data)
+    kek = _key_encryption_key(password, kdf_id, params, kek_salt)
+    try:
+        data_key = AESGCM(kek).decrypt(wrap_nonce, wrapped_key, header)
+        return AESGCM(data_key).decrypt(nonce, ciphertext, header)
+    except InvalidTag as e:
+        raise ValueError("Wrong key or corrupted data.") from e
+
+
+def _decrypt_v1(password: str, encrypted_data: bytes) -> bytes:
     backend = default_backend()
     salt = encrypted_data[:16]  
     iv = encrypted_data[16:32]  
@@ -129,118 +527,222 @@ def decrypt(password: str, encrypted_data: bytes) -> str:
     key = derive_key(password, salt)  
     cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=backend)
     decryptor = cipher.decryptor()
-    
-    #print(f"Decrypting with salt: {salt.hex()}, iv: {iv.hex()}, and derived key: {key.hex()}")
+    padded_plaintext = decryptor.update(ciphertext) + decryptor.finalize()
 
+    unpadder = padding.PKCS7(algorithms.AES.block_size).unpadder()
+    return unpadder.update(padded_plaintext) + unpadder.finalize()
+
+
+def decrypt_bytes(password: str, encrypted_data: bytes) -> bytes:
+    """
+    The function `decrypt_bytes` decrypts a blob of either format and returns the raw plaintext.
+    
+    Author - Liam Scott
+    Last update - 10/18/2026
+    
+    @ param password (str)  - The master key.
+    @ param encrypted_data (bytes)  - A version 1 or version 2 blob.
+    
+    @ returns The plaintext bytes. Raises `ValueError` when the key is wrong or the data is corrupted.
+    
+    """
+    encrypted_data = bytes(encrypted_data)
+    v2_error = None
+    if blob_version(encrypted_data) == FORMAT_V2:
+        try:
+            return _decrypt_v2(password, encrypted_data)
+        except ValueError as e:
+            if len(encrypted_data) < 48 or len(encrypted_data) % 16:
+                raise
+            v2_error = e
     try:
-        padded_plaintext = decryptor.update(ciphertext) + decryptor.finalize()
+        return _decrypt_v1(password, encrypted_data)
+    except ValueError:
+        # A version 1 blob only rarely starts with the version 2 magic; when it does not read as
+        # version 1 either, the version 2 error (usually a wrong key) is the one that applies
+        if v2_error is not None:
+            raise v2_error from None
+        raise
 
-        unpadder = padding.PKCS7(algorithms.AES.block_size).unpadder()
-        plaintext = unpadder.update(padded_plaintext) + unpadder.finalize()
 
+def decrypt(password: str, encrypted_data: bytes) -> str:
+    """
+    The function decrypts encrypted data using a password and returns the decrypted plaintext. Both
+    the version 2 envelope and the old salt + IV + AES-CBC blobs are read.
+    
+    Author - Liam Scott
+    Last update - 10/18/2026
+    
+    @ param password (str)  - The master key the data was encrypted with.
+    @ param encrypted_data (bytes)  - The encrypted blob, in either format.
+    
+    @ returns The `decrypt` function returns a decrypted string obtained from the encrypted data using
+    the provided password. If the decryption is successful, it returns the decrypted plaintext as a
+    UTF-8 decoded string. If there are any errors during decryption, it prints an error message and
+    returns an empty string.
+    
+    """
+    try:
+        plaintext = decrypt_bytes(password, encrypted_data)
+    except ValueError as e:
+        print(f"Decryption failed: {e}")
+        return ""
+    try:
         return plaintext.decode('utf-8')
     except UnicodeDecodeError:
         print("Decryption failed: Non-UTF-8 compatible bytes in decrypted data.")
         return plaintext
-    except ValueError as e:
-        print(f"Decryption failed: {e}")
-        return ""
 
-def database_decrypt(key: str, ciphertext: bytes) -> str:
+
+def upgrade_blob(password: str, encrypted_data: bytes) -> bytes:
     """
-    The function decrypts a ciphertext using AES encryption with a given key and returns the decrypted
-    plaintext.
+    The function `upgrade_blob` rewrites a version 1 blob in the version 2 format. Version 2 blobs
+    are returned unchanged.
     
     Author - Liam Scott
-    Last update - 09/5/2024
-    @ param key (str) - The `key` parameter is the encryption key used to decrypt the ciphertext. It
-    should be a string that represents the key in UTF-8 encoding.
-    @ param ciphertext (bytes) - It seems like you forgot to provide the value for the `ciphertext`
-    parameter. Please provide the ciphertext value so that I can assist you with decrypting it using the
-    given `decrypt` function.
-    @ returns The function decrypts the ciphertext using the provided key and returns the decrypted
-    plaintext as a string.
+    Last update - 10/18/2026
+    
+    @ param password (str)  - The master key.
+    @ param encrypted_data (bytes)  - The blob to upgrade.
+    
+    @ returns The version 2 blob. Raises `ValueError` when the blob cannot be decrypted with `password`.
     
     """
-    from .database import load_accounts, update_account
-    backend = default_backend()
-    key = key.encode('utf-8')
-    key = key.ljust(32)[:32]
-    
-    accounts = load_accounts()
-    for account in accounts:
-        account_id = account['id']
-        encrypted_password = account['encrypted_password']
-        encrypted_name = account['nickname']
-        encrypted_cookie = account['cookie']
-        encrypted_webhook = account['webhook']
-
-        encrypted_list = [encrypted_password, encrypted_name, encrypted_cookie, encrypted_webhook]
-
-        for encrypted in encrypted_list:
-            decripted_list = []
-            if encrypted:
-                iv = encrypted[:16] 
-                actual_ciphertext = encrypted[16:]
-                
-                cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=backend)
-                decryptor = cipher.decryptor()
-                
-                padded_plaintext = decryptor.update(actual_ciphertext) + decryptor.finalize()
-                
-                unpadder = padding.PKCS7(algorithms.AES.block_size).unpadder()
-                plaintext = unpadder.update(padded_plaintext) + unpadder.finalize()
-                
-                decripted_list.append(plaintext.decode('utf-8'))
-            else:
-                decripted_list.append(None)
-        update_account(account_id, decripted_list[0], decripted_list[1], decripted_list[2], decripted_list[3])
-    return True
-
-def database_encrypt(key: str) -> str:
-    """
-    The function decrypts a ciphertext using AES encryption with a given key and returns the decrypted
-    plaintext.
+    encrypted_data = bytes(encrypted_data)
+    v2_error = None
+    if blob_version(encrypted_data) == FORMAT_V2:
+        try:
+            _decrypt_v2(password, encrypted_data)
+            return encrypted_data
+        except ValueError as e:
+            if len(encrypted_data) < 48 or len(encrypted_data) % 16:
+                raise
+            v2_error = e
+    try:
+        plaintext = _decrypt_v1(password, encrypted_data).decode('utf-8')
+    except ValueError:
+        if v2_error is not None:
+            raise v2_error from None
+        raise
+    return encrypt(password, plaintext)
+
+
+class LazySecret:
+    total_decrypts = 0
+    total_rehashes = 0
+    _count_lock = threading.Lock()
+
+    def __init__(self, stored, key: str, on_rehash: Optional[Callable[[bytes, bytes], bool]] = None):
+        """
+        The function initializes a secret that is decrypted only when it is first read. The plain
+        text is memoized until `wipe` is called; `stored` keeps the value as it is in the database.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        @ param stored ()  - The stored value: an encrypted blob (bytes), plain text or `None`.
+        @ param key (str)  - The master key to decrypt with.
+        @ param on_rehash (Callable)  - Called with (old blob, new blob) when a successful decrypt finds
+        the blob outdated (see `needs_rehash`); it saves the new blob and returns `True` on success.
+        
+        """
+        self.stored = stored
+        self._key = key
+        self._on_rehash = on_rehash
+        self._value: Optional[str] = None
+        self._lock = threading.Lock()
+        self.decrypts = 0
+
+    @property
+    def is_encrypted(self) -> bool:
+        return isinstance(self.stored, (bytes, bytearray))
+
+    def reveal(self) -> Optional[str]:
+        """
+        The function `reveal` returns the plain text, decrypting it on the first call. Values stored
+        as plain text are returned as they are without counting a decrypt.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        @ returns The plain text, or `None` when nothing is stored. Raises `ValueError` when the key is
+        wrong or the data is corrupted.
+        
+        """
+        if not self.is_encrypted:
+            return self.stored
+        with self._lock:
+            if self._value is None:
+                self._value = decrypt_bytes(self._key, self.stored).decode('utf-8')
+                self.decrypts += 1
+                with LazySecret._count_lock:
+                    LazySecret.total_decrypts += 1
+                if self._on_rehash is not None and needs_rehash(self.stored):
+                    self._rehash()
+            return self._value
+
+    def _rehash(self):
+        try:
+            renewed = encrypt(self._key, self._value)
+            if self._on_rehash(bytes(self.stored), renewed):
+                self.stored = renewed
+                with LazySecret._count_lock:
+                    LazySecret.total_rehashes += 1
+        except Exception as e:  # A failed rehash must never fail the read; the old blob stays valid
+            print(f"Could not rehash a secret: {e}")
+
+    def peek(self) -> Optional[str]:
+        return self._value if self.is_encrypted else self.stored
+
+    def wipe(self):
+        with self._lock:
+            self._value = None
+
+    def __bool__(self) -> bool:
+        return bool(self.stored)
+
+    def __repr__(self) -> str:
+        state = "revealed" if self._value is not None else ("sealed" if self.is_encrypted else "plain")
+        return f"LazySecret({state})"
+
+
+def database_decrypt(key: str, database=None, progress=None) -> bool:
+    """
+    The function decrypts the password, cookie and webhook columns of every account in the database.
+    It is a thin wrapper around `DatabaseManager.run_crypto_job`, which streams the rows in chunks and
+    can resume an interrupted run.
     
     Author - Liam Scott
-    Last update - 09/5/2024
-    @ param key (str) - The `key` parameter is the encryption key used to decrypt the ciphertext. It
-    should be a string that represents the key in UTF-8 encoding.
-    @ param ciphertext (bytes) - It seems like you forgot to provide the value for the `ciphertext`
-    parameter. Please provide the ciphertext value so that I can assist you with decrypting it using the
-    given `decrypt` function.
-    @ returns The function decrypts the ciphertext using the provided key and returns the decrypted
-    plaintext as a string.
+    Last update - 10/18/2026
+    @ param key (str) - The master key the columns are encrypted with.
+    @ param database (DatabaseManager) - The database to process, the default database when `None`.
+    @ param progress (Callable) - Called with a `CryptoJobProgress` after every chunk.
+    @ returns `True` when every account was processed.
     
     """
-    from .database import load_accounts, update_account
-    backend = default_backend()
-    key = key.encode('utf-8')
-    key = key.ljust(32)[:32]
-    
-    accounts = load_accounts()
-    for account in accounts:
-        account_id = account['id']
-        encrypted_password = account['encrypted_password']
-        encrypted_name = account['nickname']
-        encrypted_cookie = account['cookie']
-        encrypted_webhook = account['webhook']
-
-        encrypted_list = [encrypted_password, encrypted_name, encrypted_cookie, encrypted_webhook]
-
-        for encrypted in encrypted_list:
-            encripted_list = []
-            if encrypted:
-                iv = os.urandom(16)  
-                cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=backend)
-                encryptor = cipher.encryptor()
-                
-                padder = padding.PKCS7(algorithms.AES.block_size).padder()
-                padded_data = padder.update(encrypted.encode('utf-8')) + padder.finalize()
-                
-                ciphertext = encryptor.update(padded_data) + encryptor.finalize()
-                encripted_list.append(iv + ciphertext)
-            else:
-                encripted_list.append(None)
-        update_account(account_id, encripted_list[0], encripted_list[1], encripted_list[2], encripted_list[3])
-    return True
+    return _run_database_job("decrypt", key, database, progress)
+
+
+def database_encrypt(key: str, database=None, progress=None) -> bool:
+    """
+    The function encrypts the password, cookie and webhook columns of every account in the database
+    with `key`. Values that are already encrypted are left alone. It is a thin wrapper around
+    `DatabaseManager.run_crypto_job`.
+    
+    Author - Liam Scott
+    Last update - 10/18/2026
+    @ param key (str) - The master key to encrypt with.
+    @ param database (DatabaseManager) - The database to process, the default database when `None`.
+    @ param progress (Callable) - Called with a `CryptoJobProgress` after every chunk.
+    @ returns `True` when every account was processed.
+    
+    """
+    return _run_database_job("encrypt", key, database, progress)
+
+
+def _run_database_job(operation: str, key: str, database, progress) -> bool:
+    from .database import DatabaseManager
+    if database is None:
+        database = DatabaseManager()
+    report = database.run_crypto_job(operation, key, progress=progress)
+    return report["finished"] and not report["rows_failed"]
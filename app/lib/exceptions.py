@@ -115,6 +115,127 @@ class WebhookError(HoyoHelperError):
         return msg
 
 
+
+class WebhookRateLimitError(WebhookError):
+    def __init__(self, message, url: str = None, retry_after: float = 0.0, is_global: bool = False, *args):
+        """
+        The function initializes the error raised when Discord answers a webhook post with HTTP 429.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param message ()  - The error message.
+        
+        .-.-.-.
+        
+        @ param url (str)  - The webhook URL that was rate limited.
+        
+        .-.-.-.
+        
+        @ param retry_after (float)  - Seconds Discord asked us to wait before trying again.
+        
+        .-.-.-.
+        
+        @ param is_global (bool)  - `True` when the global rate limit was hit rather than the
+        webhook's own bucket.
+        
+        .-.-.-.
+        
+        
+        """
+        super().__init__(message, url, None, *args)
+        self.retry_after = retry_after
+        self.is_global = is_global
+
+    def __str__(self):
+        scope = "global" if self.is_global else "bucket"
+        return f"{super().__str__()} | Retry after {self.retry_after:.2f}s ({scope})"
+
+
+class MigrationError(HoyoHelperError):
+    def __init__(self, message, version: int = None, original_exception: Exception = None, *args):
+        """
+        The function initializes the error raised when a database schema migration fails. The
+        migration's transaction has been rolled back, so the database is still at the previous version.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param message ()  - The error message.
+        
+        .-.-.-.
+        
+        @ param version (int)  - The schema version the failed migration would have moved to.
+        
+        .-.-.-.
+        
+        @ param original_exception (Exception)  - The `sqlite3` error that stopped the migration.
+        
+        .-.-.-.
+        
+        
+        """
+        super().__init__(message, *args)
+        self.version = version
+        self.original_exception = original_exception
+
+    def __str__(self):
+        msg = f"MigrationError: {self.message}"
+        if self.version is not None:
+            msg += f" (to version {self.version})"
+        if self.original_exception:
+            msg += f" | Original: {type(self.original_exception).__name__}: {self.original_exception}"
+        return msg
+
+
+class CryptoJobError(HoyoHelperError):
+    def __init__(self, message, job_id: int = None, original_exception: Exception = None, *args):
+        """
+        The function initializes the error raised when a bulk encryption job cannot start or stops
+        part way. Finished chunks stay committed and the job can be resumed.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param message ()  - The error message.
+        
+        .-.-.-.
+        
+        @ param job_id (int)  - The id of the job in the `crypto_jobs` table, if it was created.
+        
+        .-.-.-.
+        
+        @ param original_exception (Exception)  - The `sqlite3` error that stopped the job.
+        
+        .-.-.-.
+        
+        
+        """
+        super().__init__(message, *args)
+        self.job_id = job_id
+        self.original_exception = original_exception
+
+    def __str__(self):
+        msg = f"CryptoJobError: {self.message}"
+        if self.job_id is not None:
+            msg += f" (job {self.job_id})"
+        if self.original_exception:
+            msg += f" | Original: {type(self.original_exception).__name__}: {self.original_exception}"
+        return msg
+
+
 class LoginManagerError(HoyoHelperError):
     pass
 
@@ -0,0 +1,294 @@
+FILE_VERSION = "0.1.0"
+
+import threading
+import logging
+from typing import Callable, Dict, Optional, Sequence
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+
+class _CountingHTTPAdapter(HTTPAdapter):
+    def __init__(self, *args, **kwargs):
+        """
+        The function initializes an `HTTPAdapter` that remembers every urllib3 connection pool it
+        hands requests to, so connection statistics can be read back later. Pools are kept by
+        reference, so counters survive the pool manager evicting an idle host.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+
+        """
+        self._seen_pools: Dict[str, object] = {}
+        super().__init__(*args, **kwargs)
+
+    def _remember_pool(self, pool):
+        if pool is not None:
+            self._seen_pools.setdefault(f"{pool.scheme}://{pool.host}:{pool.port}", pool)
+        return pool
+
+    def get_connection_with_tls_context(self, *args, **kwargs):
+        """
+        The function `get_connection_with_tls_context` records the per-host urllib3 pool that
+        `HTTPAdapter.send` picked for the request so its counters can be read back later.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+
+
+        @ returns The urllib3 connection pool returned by the parent adapter.
+
+        .-.-.-.
+
+
+        """
+        return self._remember_pool(super().get_connection_with_tls_context(*args, **kwargs))
+
+    def pool_stats(self) -> Dict[str, int]:
+        """
+        The function `pool_stats` sums the connection counters of every pool this adapter has used.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+
+
+        @ returns A dictionary with the number of hosts, connections opened and requests sent.
+
+        .-.-.-.
+
+
+        """
+        pools = list(self._seen_pools.values())
+        opened = sum(getattr(pool, "num_connections", 0) for pool in pools)
+        requests_sent = sum(getattr(pool, "num_requests", 0) for pool in pools)
+        return {"hosts": len(pools), "opened": opened, "requests": requests_sent}
+
+
+class _CountingRetry(Retry):
+    # Called on every retry urllib3 makes (retryable statuses, dropped connections); requests never reports them.
+    on_retry: Optional[Callable[[], None]] = None
+
+    def new(self, **kwargs):
+        retry = super().new(**kwargs)
+        retry.on_retry = self.on_retry
+        return retry
+
+    def increment(self, *args, **kwargs):
+        retry = super().increment(*args, **kwargs) # Raises MaxRetryError when no retry is left
+        if self.on_retry is not None:
+            try:
+                self.on_retry()
+            except Exception as e:
+                logger.debug(f"Retry callback failed: {e}")
+        return retry
+
+
+class HTTPSessionPool:
+    DEFAULT_POOL_SIZE = 10
+    DEFAULT_RETRY_TOTAL = 3
+    DEFAULT_BACKOFF_FACTOR = 0.5
+    DEFAULT_RETRY_STATUSES = (500, 502, 503, 504)
+    DEFAULT_RETRY_METHODS = ("GET",)
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, keep_alive: bool = True,
+                 retry_total: int = DEFAULT_RETRY_TOTAL, backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+                 retry_statuses: Sequence[int] = DEFAULT_RETRY_STATUSES,
+                 retry_methods: Sequence[str] = DEFAULT_RETRY_METHODS,
+                 on_retry: Optional[Callable[[], None]] = None):
+        """
+        The function initializes a long-lived `requests.Session` whose adapter keeps one connection
+        pool per host, so repeated calls to the same HoYoLAB or CDN host reuse open TCP/TLS
+        connections instead of handshaking every time.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param pool_size (int)  - Maximum number of connections kept open per host. This is also the
+        number of hosts whose pools are kept alive at the same time.
+
+        .-.-.-.
+
+        @ param keep_alive (bool)  - When `False`, every request is sent with `Connection: close` and
+        nothing is reused. Useful behind proxies that drop idle connections.
+
+        .-.-.-.
+
+        @ param retry_total (int)  - Total number of urllib3 retries for a request.
+
+        .-.-.-.
+
+        @ param backoff_factor (float)  - The urllib3 backoff factor between retries.
+
+        .-.-.-.
+
+        @ param retry_statuses (Sequence[int])  - HTTP status codes that trigger a retry.
+
+        .-.-.-.
+
+        @ param retry_methods (Sequence[str])  - HTTP methods that are allowed to be retried. Sign-in
+        POSTs are not retried by default because they are not idempotent.
+
+        .-.-.-.
+
+        @ param on_retry (Optional[Callable])  - Called in the requesting thread before each retry.
+
+        .-.-.-.
+
+
+        """
+        self.pool_size = max(1, int(pool_size))
+        self.keep_alive = keep_alive
+        self.retry_strategy = _CountingRetry(
+            total=retry_total,
+            backoff_factor=backoff_factor,
+            status_forcelist=list(retry_statuses),
+            allowed_methods=list(retry_methods),
+        )
+        self.retry_strategy.on_retry = on_retry
+        self._lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+        self._adapter: Optional[_CountingHTTPAdapter] = None
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        The property `session` returns the shared session, creating it on first use.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+
+
+        @ returns The pooled `requests.Session` object.
+
+        .-.-.-.
+
+
+        """
+        with self._lock:
+            if self._session is None:
+                adapter = _CountingHTTPAdapter(
+                    pool_connections=self.pool_size,
+                    pool_maxsize=self.pool_size,
+                    max_retries=self.retry_strategy,
+                )
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                if not self.keep_alive:
+                    session.headers["Connection"] = "close"
+                self._adapter = adapter
+                self._session = session
+            return self._session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        The function `request` sends a request through the shared session.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param method (str)  - The HTTP method, for example "GET" or "POST".
+
+        .-.-.-.
+
+        @ param url (str)  - The URL the request is sent to.
+
+        .-.-.-.
+
+
+
+        @ returns The `requests.Response` object.
+
+        .-.-.-.
+
+
+        """
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        The function `stats` reports how many connections the pool opened and how many requests
+        reused an already open connection.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+
+
+        @ returns A dictionary with the keys `hosts`, `connections_opened`, `connections_reused` and
+        `requests`. Retries made by urllib3 count as requests.
+
+        .-.-.-.
+
+
+        """
+        if self._adapter is None:
+            return {"hosts": 0, "connections_opened": 0, "connections_reused": 0, "requests": 0}
+        raw = self._adapter.pool_stats()
+        return {
+            "hosts": raw["hosts"],
+            "connections_opened": raw["opened"],
+            "connections_reused": max(0, raw["requests"] - raw["opened"]),
+            "requests": raw["requests"],
+        }
+
+    def close(self):
+        """
+        The function `close` closes the shared session and all its pooled connections. The pool can
+        be used again afterwards, it will simply open new connections.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+
+        """
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+            self._session = None
+            self._adapter = None
@@ -0,0 +1,154 @@
+FILE_VERSION = "0.1.0"
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+
+def image_nbytes(image: Image.Image) -> int:
+    """
+    The function `image_nbytes` estimates how much memory a decoded image holds.
+
+    .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+    Author - Liam Scott
+    Last update - 10/18/2026
+
+    .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+    @ param image (Image.Image)  - A PIL image.
+
+    .-.-.-.
+
+
+
+    @ returns Width times height times the number of bands, in bytes.
+
+    .-.-.-.
+
+
+    """
+    width, height = image.size
+    return width * height * max(1, len(image.getbands()))
+
+
+class DecodedImageCache:
+    DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        The function initializes a bounded LRU of decoded `PIL.Image` objects. Keys are
+        `(url, size, mode)`, so the result of decoding, resizing and converting an asset is kept once
+        per process and every card starts from a copy of it.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param max_bytes (int)  - Upper bound on the estimated memory of all cached images. A value
+        of 0 disables the cache.
+
+        .-.-.-.
+
+
+        """
+        self.max_bytes = max(0, int(max_bytes))
+        self._images: "OrderedDict[Hashable, Image.Image]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(url: str, size: Optional[Tuple[int, int]] = None, mode: Optional[str] = None) -> Tuple:
+        return (url, tuple(size) if size else None, mode)
+
+    def get(self, key: Hashable) -> Optional[Image.Image]:
+        """
+        The function `get` returns a copy of a cached image, so callers are free to draw on it.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param key (Hashable)  - A key built with `make_key`.
+
+        .-.-.-.
+
+
+
+        @ returns A copy of the cached image, or `None` on a miss.
+
+        .-.-.-.
+
+
+        """
+        with self._lock:
+            image = self._images.get(key)
+            if image is None:
+                self.misses += 1
+                return None
+            self._images.move_to_end(key)
+            self.hits += 1
+        return image.copy()
+
+    def put(self, key: Hashable, image: Image.Image):
+        """
+        The function `put` stores a fully loaded image and evicts the least recently used ones until
+        the cache fits in `max_bytes`. Images larger than the whole budget are not cached.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param key (Hashable)  - A key built with `make_key`.
+
+        .-.-.-.
+
+        @ param image (Image.Image)  - The image to keep. It must not be modified afterwards.
+
+        .-.-.-.
+
+
+        """
+        size = image_nbytes(image)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._images:
+                self._bytes -= self._sizes.pop(key)
+                del self._images[key]
+            self._images[key] = image
+            self._sizes[key] = size
+            self._bytes += size
+            while self._bytes > self.max_bytes and self._images:
+                old_key, _ = self._images.popitem(last=False)
+                self._bytes -= self._sizes.pop(old_key)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._images.clear()
+            self._sizes.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._images), "bytes": self._bytes, "max_bytes": self.max_bytes,
+                    "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
@@ -2,27 +2,41 @@ FILE_VERSION = "0.1.1"
 
 import requests
 import os
-import time
+import asyncio
 import logging
 import random
+import time
 from PIL import Image, ImageDraw, ImageFont, UnidentifiedImageError, ImageFile
 from io import BytesIO
-from datetime import datetime, timezone
-from typing import List, Any, Dict, Optional
+from datetime import datetime, timezone, timedelta
+from typing import List, Any, Dict, Optional, Tuple, TypedDict
 import json
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
 from .webhook_manager import WebhookManager
+from .http_session import HTTPSessionPool
+from .asset_cache import AssetCache
+from .image_cache import DecodedImageCache
+from .card_pipeline import CardRenderPipeline
+from .scheduler import HostRateLimiter
+from .run_journal import current_metrics
+from .cache import RequestMemo, RewardCalendarCache, ResetTimeCache
 from .exceptions import (
     APIRequestError, APIDataError, AssetFetchError, 
-    CardGenerationError, SigninError, LoginManagerError
+    CardGenerationError, SigninError, LoginManagerError, WebhookError
 )
 
 ImageFile.LOAD_TRUNCATED_IMAGES = True
 logger = logging.getLogger(__name__)
 
 
+class ProcessOutcome(TypedDict):
+    success: bool
+    signed_in: bool
+    total_sign_day: Optional[int]
+    error: Optional[str]
+    latency: float
+
+
 class LoginManager:
     CDN_BASE_URL = "https://cdn.hoyohelper.com/"
     GAME_ASSET_PATHS = {
@@ -31,10 +45,21 @@ class LoginManager:
         "zzz": "zzz/", 
         "default_gi": "gi/" 
     }
+    CARD_BASE_COUNT = 9
+    SERVER_RESET_TZ = timezone(timedelta(hours=8)) # HoYoLAB check-ins reset at midnight UTC+8
+    CARD_FRAME_URL = "https://cdn.hoyohelper.com/frame/frame_1.png"
+    CARD_FRAME_POSITIONS = ((20, 68), (20, 284))
     
-    def __init__(self, webhook_manager: WebhookManager):
+    def __init__(self, webhook_manager: WebhookManager, pool_size: int = HTTPSessionPool.DEFAULT_POOL_SIZE,
+                 keep_alive: bool = True, retry_total: int = HTTPSessionPool.DEFAULT_RETRY_TOTAL,
+                 backoff_factor: float = HTTPSessionPool.DEFAULT_BACKOFF_FACTOR,
+                 cache_dir: Optional[str] = None,
+                 asset_cache_max_bytes: int = AssetCache.DEFAULT_MAX_BYTES,
+                 asset_revalidate_after: float = AssetCache.DEFAULT_REVALIDATE_AFTER,
+                 image_cache_max_bytes: int = DecodedImageCache.DEFAULT_MAX_BYTES):
         """
-        The function initializes various font attributes and loads the fonts.
+        The function initializes various font attributes, loads the fonts and creates the pooled
+        HTTP session shared by every API and asset request of this instance.
         
         .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
         
@@ -50,9 +75,55 @@ class LoginManager:
         
         .-.-.-.
         
+        @ param pool_size (int)  - Maximum number of kept-alive connections per host.
+        
+        .-.-.-.
+        
+        @ param keep_alive (bool)  - Whether connections are reused between requests.
+        
+        .-.-.-.
+        
+        @ param retry_total (int)  - Total urllib3 retries for GET requests.
+        
+        .-.-.-.
+        
+        @ param backoff_factor (float)  - The urllib3 backoff factor between retries.
+        
+        .-.-.-.
+        
+        @ param cache_dir (Optional[str])  - Folder for on-disk caches. When `None`, caches only live
+        in memory for the lifetime of this instance.
+        
+        .-.-.-.
+        
+        @ param asset_cache_max_bytes (int)  - Size limit of the CDN asset cache in `cache_dir/assets`.
+        
+        .-.-.-.
+        
+        @ param asset_revalidate_after (float)  - Seconds before a cached asset is revalidated.
+        
+        .-.-.-.
+        
+        @ param image_cache_max_bytes (int)  - Memory budget for decoded, resized and converted images.
+        
+        .-.-.-.
+        
         
         """
         self.webhook_manager = webhook_manager
+        self.http_pool = HTTPSessionPool(pool_size=pool_size, keep_alive=keep_alive,
+                                         retry_total=retry_total, backoff_factor=backoff_factor,
+                                         on_retry=self._count_transport_retry)
+        self.rate_limiter: Optional[HostRateLimiter] = None
+        self.render_pipeline: Optional[CardRenderPipeline] = None
+        self.request_memo = RequestMemo()
+        self.cache_dir = cache_dir
+        self.reward_cache = RewardCalendarCache(os.path.join(cache_dir, "reward_calendar.json") if cache_dir else None)
+        self.reset_time_cache = ResetTimeCache(os.path.join(cache_dir, "reset_times.json") if cache_dir else None)
+        self.asset_cache = AssetCache(os.path.join(cache_dir, "assets") if cache_dir else None, self.http_pool,
+                                      max_bytes=asset_cache_max_bytes, revalidate_after=asset_revalidate_after)
+        self.image_cache = DecodedImageCache(max_bytes=image_cache_max_bytes)
+        self.use_card_templates = True
         self.default_font: Optional[ImageFont.FreeTypeFont] = None
         self.reward_font: Optional[ImageFont.FreeTypeFont] = None
         self.day_title_font: Optional[ImageFont.FreeTypeFont] = None
@@ -182,46 +253,109 @@ class LoginManager:
             }
             return api_headers
 
-    @staticmethod
-    def _create_retry_session() -> requests.Session:
+    def connection_stats(self) -> Dict[str, int]:
         """
-        The function `_create_retry_session` creates a `requests.Session` object with retry
-        functionality for specific HTTP status codes and methods.
+        The function `connection_stats` returns the counters of the pooled HTTP session.
         
         .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
         
         Author - Liam Scott
-        Last update - 05/26/2025
+        Last update - 10/18/2026
         
         .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
         
         
         
-        @ returns A requests.Session object with a retry strategy configured to retry a request up to 3
-        times with a backoff factor of 0.5 seconds, for specific HTTP status codes (500, 502, 503, 504)
-        and allowed HTTP methods (GET).
+        @ returns A dictionary with the number of hosts, connections opened, connections reused and
+        requests sent through this LoginManager.
         
         .-.-.-.
         
         
         """
-        session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=0.5,
-            status_forcelist=[500, 502, 503, 504],  
-            allowed_methods=["GET"],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("https://", adapter)
-        session.mount("http://", adapter)
-        return session
+        return self.http_pool.stats()
+
+    def reset_run_cache(self):
+        """
+        The function `reset_run_cache` forgets every memoized API response. It is called at the start
+        of each run so state from a previous run is never reused.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        
+        """
+        self.request_memo.reset()
+
+    def close(self):
+        """
+        The function `close` stops the card render pipeline, releases the pooled HTTP connections held
+        by this LoginManager and writes pending asset cache bookkeeping to disk.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        
+        """
+        if self.render_pipeline is not None:
+            self.render_pipeline.shutdown()
+        self.asset_cache.flush()
+        self.http_pool.close()
 
     @staticmethod
-    def _get_assets_image(url: str) -> Image.Image:
+    def _prepare_image(image: Image.Image, size: Optional[tuple] = None, mode: Optional[str] = None) -> Image.Image:
+        """
+        The function `_prepare_image` decodes an opened image and applies the resize and mode
+        conversion the card needs, in the same order `_card_generator` always used.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param image (Image.Image)  - The image returned by `Image.open`.
+        
+        .-.-.-.
+        
+        @ param size (Optional[tuple])  - Target `(width, height)`, resized with LANCZOS.
+        
+        .-.-.-.
+        
+        @ param mode (Optional[str])  - Target PIL mode, for example 'RGBA'.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns A fully loaded image.
+        
+        .-.-.-.
+        
+        
+        """
+        image.load()
+        if size and image.size != tuple(size):
+            image = image.resize(tuple(size), Image.Resampling.LANCZOS)
+        if mode and image.mode != mode:
+            image = image.convert(mode)
+        return image
+
+    def _get_assets_image(self, url: str, size: Optional[tuple] = None, mode: Optional[str] = None) -> Image.Image:
         """
-        The function `_get_assets_image` retrieves an image from a specified URL using requests and
-        returns it as a PIL Image object, handling various exceptions that may occur during the process.
+        The function `_get_assets_image` retrieves an image from a specified URL through the disk
+        asset cache and returns it as a PIL Image object, handling various exceptions that may occur
+        during the process. Decoded results are kept in `image_cache`, so each variant is only
+        decoded once per process.
         
         .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
         
@@ -235,6 +369,14 @@ class LoginManager:
         
         .-.-.-.
         
+        @ param size (Optional[tuple])  - Optional `(width, height)` to resize the image to.
+        
+        .-.-.-.
+        
+        @ param mode (Optional[str])  - Optional PIL mode to convert the image to.
+        
+        .-.-.-.
+        
         
         
         @ returns The function `_get_assets_image` returns an `Image.Image` object, which is an image
@@ -244,26 +386,26 @@ class LoginManager:
         
         
         """
+        cache_key = self.image_cache.make_key(url, size, mode)
+        cached_image = self.image_cache.get(cache_key)
+        if cached_image is not None:
+            return cached_image
         headers = LoginManager._header_formater()
-        session = LoginManager._create_retry_session()
         try:
-            response = session.get(url, headers=headers, timeout=(5, 15))
-            response.raise_for_status()
-            return Image.open(BytesIO(response.content))
+            image = self._prepare_image(Image.open(BytesIO(self.asset_cache.get(url, headers=headers, timeout=(5, 15)))), size, mode)
         except UnidentifiedImageError as e:
             raise AssetFetchError(f"Unrecognized image format from assets: {url}", url=url, original_exception=e) from e
         except OSError as e:
             raise AssetFetchError(f"OS or PIL error opening image from assets: {url}", url=url, original_exception=e) from e
         except requests.exceptions.RequestException as e:
             raise AssetFetchError(f"Request failed for asset image: {url}", url=url, original_exception=e) from e
-        finally:
-            session.close()
+        self.image_cache.put(cache_key, image)
+        return image.copy()
 
-    @staticmethod
-    def _fetch_image_from_url(url: str) -> Image.Image:
+    def _fetch_image_from_url(self, url: str, size: Optional[tuple] = None, mode: Optional[str] = None) -> Image.Image:
         """
-        This function fetches an image from a given URL and handles various exceptions that may occur
-        during the process.
+        This function fetches an image from a given URL, reading the decoded image cache and then the
+        disk asset cache first, and handles various exceptions that may occur during the process.
         
         .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
         
@@ -277,6 +419,14 @@ class LoginManager:
         
         .-.-.-.
         
+        @ param size (Optional[tuple])  - Optional `(width, height)` to resize the image to.
+        
+        .-.-.-.
+        
+        @ param mode (Optional[str])  - Optional PIL mode to convert the image to.
+        
+        .-.-.-.
+        
         
         
         @ returns The function `_fetch_image_from_url` is returning an image object of type
@@ -286,16 +436,21 @@ class LoginManager:
         
         
         """
+        cache_key = self.image_cache.make_key(url, size, mode)
+        cached_image = self.image_cache.get(cache_key)
+        if cached_image is not None:
+            return cached_image
         try:
-            response = requests.get(url, timeout=(5,15), headers={'User-Agent': LoginManager._header_formater()['User-Agent']})
-            response.raise_for_status()
-            return Image.open(BytesIO(response.content))
+            image_bytes = self.asset_cache.get(url, timeout=(5,15), headers={'User-Agent': LoginManager._header_formater()['User-Agent']})
+            image = self._prepare_image(Image.open(BytesIO(image_bytes)), size, mode)
         except UnidentifiedImageError as e:
             raise AssetFetchError(f"Unrecognized image format from icon URL: {url}", url=url, original_exception=e) from e
         except OSError as e:
             raise AssetFetchError(f"OS or PIL error opening image from icon URL: {url}", url=url, original_exception=e) from e
         except requests.exceptions.RequestException as e:
             raise AssetFetchError(f"Request failed for icon image: {url}", url=url, original_exception=e) from e
+        self.image_cache.put(cache_key, image)
+        return image.copy()
     
     @staticmethod
     def _time_formater(time_unix_str: str) -> str:
@@ -421,12 +576,11 @@ class LoginManager:
         """
         headers = self._header_formater(cookie=cookie, links_for_game=links_for_game_ctx)
         response_text_preview = None
-        session = self._create_retry_session()
         try:
             if method.upper() == "GET":
-                response = session.get(url, headers=headers, params=params, timeout=(5,15))
+                response = self.http_pool.get(url, headers=headers, params=params, timeout=(5,15))
             elif method.upper() == "POST":
-                response = session.post(url, headers=headers, params=params, json=json_payload, timeout=(5,15))
+                response = self.http_pool.post(url, headers=headers, params=params, json=json_payload, timeout=(5,15))
             else:
                 raise ValueError(f"Unsupported HTTP method used in _api_request: {method}")
             
@@ -444,8 +598,165 @@ class LoginManager:
         except json.JSONDecodeError as e:
             raise APIRequestError("Failed to decode JSON response", url=url, 
                                   response_text=response_text_preview, original_exception=e) from e
-        finally:
-            session.close()
+
+    async def _api_request_async(self, method: str, url: str, cookie: Optional[str] = None,
+                                 links_for_game_ctx: Optional[Dict[str,str]] = None,
+                                 params: Optional[Dict] = None, json_payload: Optional[Dict] = None) -> Dict:
+        """
+        The async function `_api_request_async` runs `_api_request` in a worker thread so the pooled,
+        blocking HTTP call does not stall the event loop. Requests from many accounts can then overlap.
+        When `rate_limiter` is set, the call first waits for a free slot on the target host.
+        Successful GET responses are memoized per (cookie, URL, params) for the current run, so the
+        shared `/info` endpoint behind `signin_check` and `day_counter` is only fetched once. Calls
+        that reach the network are counted in the run journal's `current_metrics`.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param method (str)  - The HTTP method, "GET" or "POST".
+        
+        .-.-.-.
+        
+        @ param url (str)  - The URL the request is sent to.
+        
+        .-.-.-.
+        
+        @ param cookie (Optional[str])  - The cookie used to authenticate the request.
+        
+        .-.-.-.
+        
+        @ param links_for_game_ctx (Optional[Dict[str,str]])  - The links configuration of the game.
+        
+        .-.-.-.
+        
+        @ param params (Optional[Dict])  - Query string parameters.
+        
+        .-.-.-.
+        
+        @ param json_payload (Optional[Dict])  - JSON body for POST requests.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns A dictionary containing the JSON response.
+        
+        .-.-.-.
+        
+        
+        """
+        memoize = method.upper() == "GET"
+        if memoize:
+            memoized = self.request_memo.get(cookie, url, params)
+            if memoized is not None:
+                return memoized
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(url)
+        metrics = current_metrics()
+        try:
+            response_data = await asyncio.to_thread(self._api_request, method, url, cookie=cookie,
+                                                    links_for_game_ctx=links_for_game_ctx, params=params,
+                                                    json_payload=json_payload)
+        except APIRequestError:
+            if metrics is not None:
+                metrics.http_call()
+            raise
+        if metrics is not None:
+            metrics.http_call(response_data.get('retcode') if isinstance(response_data, dict) else None)
+        if memoize and isinstance(response_data, dict) and response_data.get('retcode') == 0:
+            self.request_memo.put(cookie, url, params, response_data)
+        return response_data
+
+    @staticmethod
+    def _count_retry():
+        metrics = current_metrics()
+        if metrics is not None:
+            metrics.retry()
+
+    @staticmethod
+    def _count_transport_retry():
+        # urllib3 retried a retryable status or a dropped connection: one more attempt on the wire. Runs in the
+        # worker thread of `_api_request_async`, which carries the caller's context.
+        metrics = current_metrics()
+        if metrics is not None:
+            metrics.http_call()
+            metrics.retry()
+
+    @staticmethod
+    def _run_sync(coro):
+        """
+        The function `_run_sync` drives a coroutine to completion for the synchronous API used by the
+        GUI. It must not be called from inside a running event loop.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param coro ()  - The coroutine to run.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns Whatever the coroutine returns.
+        
+        .-.-.-.
+        
+        
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        coro.close()
+        raise LoginManagerError("Synchronous LoginManager API called from a running event loop; use the *_async methods instead.")
+
+    async def _send_webhook_async(self, message: str, card: Optional[Image.Image] = None, url: Optional[str] = None) -> bool:
+        """
+        The async function `_send_webhook_async` queues a webhook message on the WebhookManager
+        outbox. It returns as soon as the message is queued; the outbox posts messages to the same
+        URL in order. A card is encoded (and stored in the outbox table) while queueing, so that part
+        runs in a thread.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param message (str)  - The message content.
+        
+        .-.-.-.
+        
+        @ param card (Optional[Image.Image])  - Optional card image attached to the message.
+        
+        .-.-.-.
+        
+        @ param url (Optional[str])  - Target webhook URL, the default URL is used when `None`.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns `True` once the message is queued, raises `WebhookError` if there is no target URL.
+        
+        .-.-.-.
+        
+        
+        """
+        if card is not None:
+            await asyncio.to_thread(self.webhook_manager.queue, message, card, url=url)
+        else:
+            self.webhook_manager.queue(message, url=url)
+        return True
 
     def _reward_info(self, cookie: str, links: Dict[str, str]) -> List[Dict[str, str]]:
         """
@@ -480,11 +791,54 @@ class LoginManager:
         .-.-.-.
         
         
+        """
+        return self._run_sync(self._reward_info_async(cookie, links))
+
+    async def _reward_info_async(self, cookie: str, links: Dict[str, str],
+                                 refresh_time_unix: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        The async function `_reward_info_async` fetches and validates the monthly reward list without
+        blocking the event loop. The list is the same for every account of a game, so it is served
+        from `reward_cache` (keyed on the game `act_id` and month) after the first fetch.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param cookie (str)  - The cookie string used to authenticate the request.
+        
+        .-.-.-.
+        
+        @ param links (Dict[str, str])  - The links configuration of the game being processed.
+        
+        .-.-.-.
+        
+        @ param refresh_time_unix (Optional[str])  - The refresh timestamp from `_time_info`, used to
+        expire the cached calendar when the month rolls over.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns The list of reward dictionaries from the 'awards' field.
+        
+        .-.-.-.
+        
+        
         """
         rewards_url = links.get('reward_info')
         if not rewards_url: raise APIDataError("'reward_info' URL missing in links configuration.")
+
+        act_id = links.get('id')
+        if act_id:
+            cached_awards = self.reward_cache.get(act_id)
+            if cached_awards is not None:
+                return cached_awards
         
-        response_data = self._api_request("GET", rewards_url, cookie=cookie, links_for_game_ctx=links)
+        response_data = await self._api_request_async("GET", rewards_url, cookie=cookie, links_for_game_ctx=links)
         
         if response_data.get('retcode') != 0:
             raise APIDataError(f"API error for reward_info", retcode=response_data.get('retcode'), 
@@ -497,6 +851,8 @@ class LoginManager:
         if not isinstance(data_payload['awards'], list):
             raise APIDataError("'awards' field is not a list in reward_info response",
                                api_response_preview=str(response_data)[:200])
+        if act_id:
+            self.reward_cache.put(act_id, data_payload['awards'], refresh_time_unix)
         return data_payload['awards']
 
     def _day_counter(self, cookie: str, links: Dict[str, str]) -> int:
@@ -532,11 +888,41 @@ class LoginManager:
         .-.-.-.
         
         
+        """
+        return self._run_sync(self._day_counter_async(cookie, links))
+
+    async def _day_counter_async(self, cookie: str, links: Dict[str, str]) -> int:
+        """
+        The async function `_day_counter_async` fetches the number of days signed in this month without
+        blocking the event loop.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param cookie (str)  - The cookie string used to authenticate the request.
+        
+        .-.-.-.
+        
+        @ param links (Dict[str, str])  - The links configuration of the game being processed.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns The `total_sign_day` value as an integer.
+        
+        .-.-.-.
+        
+        
         """
         day_count_url = links.get('day_counter')
         if not day_count_url: raise APIDataError("'day_counter' URL missing in links configuration.")
 
-        response_data = self._api_request("GET", day_count_url, cookie=cookie, links_for_game_ctx=links)
+        response_data = await self._api_request_async("GET", day_count_url, cookie=cookie, links_for_game_ctx=links)
         
         if response_data.get('retcode') != 0:
             raise APIDataError(f"API error for day_counter", retcode=response_data.get('retcode'), 
@@ -588,11 +974,47 @@ class LoginManager:
         .-.-.-.
         
         
+        """
+        return self._run_sync(self._time_info_async(cookie, links))
+
+    async def _time_info_async(self, cookie: str, links: Dict[str, str]) -> str:
+        """
+        The async function `_time_info_async` returns the next refresh timestamp of a game. The value
+        is server-wide, so it is served from `reset_time_cache` until that moment has passed and only
+        then fetched again.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param cookie (str)  - The cookie string used to authenticate the request.
+        
+        .-.-.-.
+        
+        @ param links (Dict[str, str])  - The links configuration of the game being processed.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns The refresh time as a Unix timestamp string.
+        
+        .-.-.-.
+        
+        
         """
         time_url = links.get('time_info')
         if not time_url: raise APIDataError("'time_info' URL missing in links configuration.")
 
-        response_data = self._api_request("GET", time_url, cookie=cookie, links_for_game_ctx=links)
+        cache_key = links.get('id') or time_url
+        cached_refresh_time = self.reset_time_cache.get(cache_key)
+        if cached_refresh_time is not None:
+            return cached_refresh_time
+
+        response_data = await self._api_request_async("GET", time_url, cookie=cookie, links_for_game_ctx=links)
         if response_data.get('retcode') != 0:
             raise APIDataError(f"API error for time_info", retcode=response_data.get('retcode'),
                                api_message=response_data.get('message'), api_response_preview=str(response_data)[:200])
@@ -600,11 +1022,13 @@ class LoginManager:
         if not data_payload or 'refresh_time' not in data_payload:
             if links.get("short_name") == "gi" and data_payload and 'resign_time' in data_payload:
                  logger.warning("Using 'resign_time' as 'refresh_time' for Genshin Impact time_info.")
+                 self.reset_time_cache.put(cache_key, data_payload['resign_time'])
                  return data_payload['resign_time']
             raise APIDataError("'data' or 'refresh_time' missing in time_info response",
                                api_response_preview=str(response_data)[:200])
+        self.reset_time_cache.put(cache_key, data_payload['refresh_time'])
         return data_payload['refresh_time']
-        
+
     def _signin_check(self, cookie: str, links: Dict[str, str]) -> bool:
         """
         The function `_signin_check` checks the sign-in status by making an API request and handling
@@ -639,13 +1063,43 @@ class LoginManager:
         
         
         """
-        signin_check_url = links.get('signin_check', links.get('day_counter'))
-        if not signin_check_url: raise APIDataError("'signin_check' or 'day_counter' URL missing in links configuration.")
+        return self._run_sync(self._signin_check_async(cookie, links))
 
-        max_retries = 2 # Try once, then retry once for specific error
-        for attempt in range(max_retries + 1):
+    async def _signin_check_async(self, cookie: str, links: Dict[str, str]) -> bool:
+        """
+        The async function `_signin_check_async` checks the sign-in status, retrying with non-blocking
+        sleeps on transient errors.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param cookie (str)  - The cookie string used to authenticate the request.
+        
+        .-.-.-.
+        
+        @ param links (Dict[str, str])  - The links configuration of the game being processed.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns `True` if the account already signed in today, `False` otherwise.
+        
+        .-.-.-.
+        
+        
+        """
+        signin_check_url = links.get('signin_check', links.get('day_counter'))
+        if not signin_check_url: raise APIDataError("'signin_check' or 'day_counter' URL missing in links configuration.")
+
+        max_retries = 2 # Try once, then retry once for specific error
+        for attempt in range(max_retries + 1):
             try:
-                response_data = self._api_request("GET", signin_check_url, cookie=cookie, links_for_game_ctx=links)
+                response_data = await self._api_request_async("GET", signin_check_url, cookie=cookie, links_for_game_ctx=links)
                 
                 if response_data.get('retcode') == 0:
                     data_payload = response_data.get('data')
@@ -662,7 +1116,8 @@ class LoginManager:
                 
                 elif response_data.get('retcode') == -500001 and attempt < max_retries :
                     logger.warning(f"Retrying signin_check for {links.get('name', 'game')} ({links.get('short_name')}) due to retcode -500001 (Attempt {attempt + 1}/{max_retries + 1})")
-                    time.sleep(3 * (attempt + 1)) 
+                    self._count_retry()
+                    await asyncio.sleep(3 * (attempt + 1)) 
                     continue
                 else:
                     raise APIDataError(f"API error for signin_check", retcode=response_data.get('retcode'),
@@ -670,7 +1125,8 @@ class LoginManager:
             except APIRequestError as e: 
                 if attempt < max_retries:
                     logger.warning(f"Retrying signin_check for {links.get('name', 'game')} ({links.get('short_name')}) due to APIRequestError: {e} (Attempt {attempt + 1}/{max_retries + 1})")
-                    time.sleep(3 * (attempt + 1))
+                    self._count_retry()
+                    await asyncio.sleep(3 * (attempt + 1))
                     continue
                 else:
                     raise 
@@ -709,6 +1165,35 @@ class LoginManager:
         .-.-.-.
         
         
+        """
+        return self._run_sync(self._signin_async(cookie, links))
+
+    async def _signin_async(self, cookie: str, links: Dict[str, str]) -> bool:
+        """
+        The async function `_signin_async` sends the sign-in POST without blocking the event loop.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param cookie (str)  - The cookie string used to authenticate the request.
+        
+        .-.-.-.
+        
+        @ param links (Dict[str, str])  - The links configuration of the game being processed.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns `True` if the sign-in succeeded or was already done, raises `SigninError` otherwise.
+        
+        .-.-.-.
+        
+        
         """
         signin_url = links.get('signin')
         act_id = links.get('id')
@@ -717,8 +1202,13 @@ class LoginManager:
         
         payload = {"act_id": act_id, "lang": links.get("lang", "en-us")} 
         
-        response_data = self._api_request("POST", signin_url, cookie=cookie, 
-                                          links_for_game_ctx=links, json_payload=payload)
+        try:
+            response_data = await self._api_request_async("POST", signin_url, cookie=cookie, 
+                                              links_for_game_ctx=links, json_payload=payload)
+        finally:
+            for status_key in ('signin_check', 'day_counter'):
+                if links.get(status_key):
+                    self.request_memo.invalidate(cookie, links[status_key])
         
         retcode = response_data.get('retcode')
         api_msg = response_data.get('message', '').lower()
@@ -820,7 +1310,8 @@ class LoginManager:
         return data_to_return
 
     def _get_asset_with_fallback(self, asset_category: str, asset_name_template: str, 
-                                item_identifier: Any, primary_game_short_name: str) -> Optional[Image.Image]:
+                                item_identifier: Any, primary_game_short_name: str,
+                                size: Optional[tuple] = None, mode: Optional[str] = None) -> Optional[Image.Image]:
         """
         This function retrieves an asset image with a fallback option if the primary asset fails to
         load.
@@ -859,6 +1350,14 @@ class LoginManager:
         
         .-.-.-.
         
+        @ param size (Optional[tuple])  - Optional `(width, height)` to resize the asset to.
+        
+        .-.-.-.
+        
+        @ param mode (Optional[str])  - Optional PIL mode to convert the asset to.
+        
+        .-.-.-.
+        
         
         
         @ returns The method `_get_asset_with_fallback` returns an optional `Image.Image` object or
@@ -867,6 +1366,32 @@ class LoginManager:
         .-.-.-.
         
         
+        """
+        return self._get_asset_and_origin(asset_category, asset_name_template, item_identifier,
+                                          primary_game_short_name, size, mode)[0]
+
+    def _get_asset_and_origin(self, asset_category: str, asset_name_template: str, item_identifier: Any,
+                              primary_game_short_name: str, size: Optional[tuple] = None,
+                              mode: Optional[str] = None) -> Tuple[Optional[Image.Image], bool]:
+        """
+        The function `_get_asset_and_origin` does the work of `_get_asset_with_fallback` and also says
+        whether the image is the GI fallback, so callers that cache a derived image can skip caching
+        one built from a fallback that may only be there because of a transient CDN failure.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        
+        
+        @ returns A tuple of (image or `None`, `True` if the image came from the GI fallback).
+        
+        .-.-.-.
+        
+        
         """
         primary_game_asset_folder = self.GAME_ASSET_PATHS.get(primary_game_short_name, self.GAME_ASSET_PATHS["default_gi"])
         gi_asset_folder = self.GAME_ASSET_PATHS["gi"]
@@ -875,19 +1400,105 @@ class LoginManager:
         gi_fallback_url_template = f'{self.CDN_BASE_URL}{gi_asset_folder}{asset_category}/{asset_name_template}'
         
         primary_url = primary_url_template.format(game=primary_game_short_name, id=item_identifier)
+        gi_fallback_url = gi_fallback_url_template.format(game="gi", id=item_identifier)
+        if primary_url != gi_fallback_url and self.asset_cache.is_known_missing(primary_url):
+            logger.debug(f"Primary asset '{primary_url}' is known to be missing, using GI fallback.")
+            try:
+                return self._get_assets_image(gi_fallback_url, size, mode), True
+            except AssetFetchError as e_fallback:
+                logger.error(f"Failed to load GI fallback asset '{gi_fallback_url}': {e_fallback}")
+                return None, False
         try:
-            return self._get_assets_image(primary_url)
+            return self._get_assets_image(primary_url, size, mode), False
         except AssetFetchError as e_primary:
             logger.warning(f"Failed to load primary asset '{primary_url}': {e_primary}. Trying GI fallback.")
-            gi_fallback_url = gi_fallback_url_template.format(game="gi", id=item_identifier)
             if primary_url == gi_fallback_url: # Already tried GI or GI was primary
                 logger.error(f"GI fallback URL is same as primary and failed: {gi_fallback_url}")
-                return None
+                return None, False
             try:
-                return self._get_assets_image(gi_fallback_url)
+                return self._get_assets_image(gi_fallback_url, size, mode), True
             except AssetFetchError as e_fallback:
                 logger.error(f"Failed to load GI fallback asset '{gi_fallback_url}': {e_fallback}")
-                return None
+                return None, False
+
+    def _card_template(self, base_number: int, game_short_name: str) -> Optional[Image.Image]:
+        """
+        The function `_card_template` returns the framed base of a card: the base image converted to
+        RGB with the frame pasted at both reward slots. Each of the `CARD_BASE_COUNT` templates is
+        composited once per game and kept in `image_cache`, renders draw on a copy.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param base_number (int)  - Which base image to use, from 1 to `CARD_BASE_COUNT`.
+        
+        .-.-.-.
+        
+        @ param game_short_name (str)  - The short name of the game, e.g. 'gi'.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns A new RGB image the caller may draw on, or `None` if no base image could be loaded.
+        
+        .-.-.-.
+        
+        
+        """
+        template_key = self.image_cache.make_key(f"template:{game_short_name}:{base_number}", None, 'RGB')
+        if self.use_card_templates:
+            template = self.image_cache.get(template_key)
+            if template is not None:
+                return template
+
+        base_img, from_fallback = self._get_asset_and_origin("cards", "{game}_cards_{id}.png", base_number,
+                                                             game_short_name, mode='RGB')
+        if not base_img:
+            return None
+        try:
+            frame_img = self._get_assets_image(self.CARD_FRAME_URL, mode='RGBA')
+        except AssetFetchError as e:
+            logger.warning(f"Failed to load frame image for card: {e}")
+            return base_img # Not cached, so the frame is tried again on the next render
+        for position in self.CARD_FRAME_POSITIONS:
+            base_img.paste(frame_img, position, frame_img)
+        if not self.use_card_templates or from_fallback:
+            return base_img # A fallback base is not cached, so the game's own art is tried again next render
+        self.image_cache.put(template_key, base_img)
+        return base_img.copy()
+
+    def warm_card_templates(self, game_short_name: str) -> int:
+        """
+        The function `warm_card_templates` builds every card template of a game ahead of time, so the
+        first renders of a run do not pay for it. The headless app runs it in the background at the
+        start of each run.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param game_short_name (str)  - The short name of the game, e.g. 'gi'.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns How many templates are available.
+        
+        .-.-.-.
+        
+        
+        """
+        return sum(1 for base_number in range(1, self.CARD_BASE_COUNT + 1)
+                   if self._card_template(base_number, game_short_name) is not None)
 
     def _card_generator(self, card_data: Dict[str, Any], game_short_name: str) -> Optional[Image.Image]:
         """
@@ -929,37 +1540,24 @@ class LoginManager:
             return None
 
         try:
-            base_number = random.randint(1, 9)
-            base_img = self._get_asset_with_fallback("cards", "{game}_cards_{id}.png", base_number, game_short_name)
+            base_number = random.randint(1, self.CARD_BASE_COUNT)
+            base_img = self._card_template(base_number, game_short_name)
             if not base_img:
                 logger.error(f"Failed to load ANY base card image for {game_short_name} or GI fallback.")
                 return None # Cannot proceed without a base image
-            base_img = base_img.convert('RGB')
-
-            frame_img = self._get_assets_image("https://cdn.hoyohelper.com/frame/frame_1.png")
-            if frame_img:
-                frame_img = frame_img.convert("RGBA") if frame_img.mode != "RGBA" else frame_img
-                base_img.paste(frame_img, (20, 68), frame_img)
-                base_img.paste(frame_img, (20, 284), frame_img)
-            else:
-                logger.warning("Failed to load frame image for card.")
             
             if card_data.get('icon_1'):
                 try:
-                    icon_1_img = self._fetch_image_from_url(card_data['icon_1'])
+                    icon_1_img = self._fetch_image_from_url(card_data['icon_1'], size=(100, 100), mode='RGBA')
                     if icon_1_img:
-                        icon_1_img = icon_1_img.resize((100, 100), Image.Resampling.LANCZOS)
-                        if icon_1_img.mode != 'RGBA': icon_1_img = icon_1_img.convert('RGBA')
                         base_img.paste(icon_1_img, (40, 88), icon_1_img)
                 except (AssetFetchError, KeyError) as e_icon1:
                      logger.warning(f"Failed to load or process icon_1 ({card_data.get('icon_1')}): {e_icon1}")
 
             if not card_data.get('end_of_month', False) and card_data.get('icon_2'):
                 try:
-                    icon_2_img = self._fetch_image_from_url(card_data['icon_2'])
+                    icon_2_img = self._fetch_image_from_url(card_data['icon_2'], size=(100, 100), mode='RGBA')
                     if icon_2_img:
-                        icon_2_img = icon_2_img.resize((100, 100), Image.Resampling.LANCZOS)
-                        if icon_2_img.mode != 'RGBA': icon_2_img = icon_2_img.convert('RGBA')
                         base_img.paste(icon_2_img, (40, 304), icon_2_img)
                 except (AssetFetchError, KeyError) as e_icon2:
                     logging.warning(f"Failed to load or process icon_2 ({card_data.get('icon_2')}): {e_icon2}")
@@ -974,10 +1572,9 @@ class LoginManager:
 
             if card_data.get('end_of_month', False):
                 sticker_number = random.randint(2, 153)
-                sticker_img = self._get_asset_with_fallback("stickers", "{game}_stickers_{id}.png", sticker_number, game_short_name)
+                sticker_img = self._get_asset_with_fallback("stickers", "{game}_stickers_{id}.png", sticker_number, game_short_name,
+                                                            size=(100, 100), mode='RGBA')
                 if sticker_img:
-                    sticker_img = sticker_img.resize((100, 100), Image.Resampling.LANCZOS)
-                    if sticker_img.mode != 'RGBA': sticker_img = sticker_img.convert('RGBA')
                     base_img.paste(sticker_img, (40, 304), sticker_img)
                 else:
                     logger.warning(f"Failed to load sticker for {game_short_name} or GI fallback.")
@@ -1006,9 +1603,8 @@ class LoginManager:
             d.text((835, 100), f"{day_label} this month!", font=self.small_text_font, fill=text_fill_shadow)
 
             portrait_number = random.randint(2, 32)
-            portrait_img = self._get_asset_with_fallback("car_dec", "{game}_car_dec_{id}.png", portrait_number, game_short_name)
+            portrait_img = self._get_asset_with_fallback("car_dec", "{game}_car_dec_{id}.png", portrait_number, game_short_name, mode='RGBA')
             if portrait_img:
-                if portrait_img.mode != 'RGBA': portrait_img = portrait_img.convert('RGBA')
                 base_img.paste(portrait_img, (630, 422), portrait_img)
             else:
                 logger.warning(f"Failed to load portrait for {game_short_name} or GI fallback.")
@@ -1017,11 +1613,133 @@ class LoginManager:
             logger.error(f"An unexpected error occurred during card generation: {e}", exc_info=True)
             return None # Return None on any unexpected card generation error
 
+    def _start_card_render(self, card_data: Dict[str, Any], game_short_name: str) -> "asyncio.Future":
+        """
+        The function `_start_card_render` starts rendering a card in the background, through
+        `render_pipeline` when one is set and in a worker thread otherwise.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param card_data (Dict[str, Any])  - The parsed card data from `_data_parser`.
+        
+        .-.-.-.
+        
+        @ param game_short_name (str)  - The short name of the game, used for card assets.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns An asyncio future resolving to the card image or `None`.
+        
+        .-.-.-.
+        
+        
+        """
+        if self.render_pipeline is not None:
+            card_future = asyncio.wrap_future(self.render_pipeline.submit(card_data, game_short_name))
+        else:
+            card_future = asyncio.ensure_future(asyncio.to_thread(self._card_generator, card_data, game_short_name))
+        metrics = current_metrics()
+        if metrics is not None:
+            started = time.perf_counter()
+            card_future.add_done_callback(lambda _: metrics.card_rendered(time.perf_counter() - started))
+        return card_future
+
+    async def _await_card(self, card_future: "asyncio.Future", full_account_name_for_logs: str,
+                          account_webhook_url: Optional[str] = None) -> Optional[Image.Image]:
+        """
+        The async function `_await_card` waits for a background card render and reports render
+        failures the same way an inline render did.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param card_future (asyncio.Future)  - The future returned by `_start_card_render`.
+        
+        .-.-.-.
+        
+        @ param full_account_name_for_logs (str)  - "account (game)", used in logs and messages.
+        
+        .-.-.-.
+        
+        @ param account_webhook_url (Optional[str])  - Webhook URL for this account's notifications.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns The card image, or `None` if it could not be generated.
+        
+        .-.-.-.
+        
+        
+        """
+        try:
+            card_image = await card_future
+            if card_image is None: # Explicitly check if card_generator returned None
+                logger.warning(f"{full_account_name_for_logs}: Card image generation resulted in None, will proceed without card image.")
+            return card_image
+        except CardGenerationError as e_card_gen:
+            logger.error(f"{full_account_name_for_logs}: Failed to generate reward card due to CardGenerationError: {e_card_gen}", exc_info=True)
+            await self._send_webhook_async(f"WARNING: {full_account_name_for_logs} - Could not generate reward card ({e_card_gen.message}). Sign-in will proceed.", url=account_webhook_url)
+        except Exception as e_card_unexpected: # Catch any other unexpected error from card_generator
+            logger.error(f"{full_account_name_for_logs}: Unexpected error during card generation: {e_card_unexpected}", exc_info=True)
+            await self._send_webhook_async(f"WARNING: {full_account_name_for_logs} - Unexpected error generating reward card. Sign-in will proceed.", url=account_webhook_url)
+        return None
+
+    async def _send_card_message(self, message: str, card_future: "asyncio.Future", full_account_name_for_logs: str,
+                                 account_webhook_url: Optional[str] = None):
+        """
+        The async function `_send_card_message` sends `message` with the card attached as soon as the
+        render finishes. It runs next to the sign-in, so webhook errors are logged instead of raised.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param message (str)  - The message text.
+        
+        .-.-.-.
+        
+        @ param card_future (asyncio.Future)  - The future returned by `_start_card_render`.
+        
+        .-.-.-.
+        
+        @ param full_account_name_for_logs (str)  - "account (game)", used in logs and messages.
+        
+        .-.-.-.
+        
+        @ param account_webhook_url (Optional[str])  - Webhook URL for this account's notifications.
+        
+        .-.-.-.
+        
+        
+        """
+        try:
+            card_image = await self._await_card(card_future, full_account_name_for_logs, account_webhook_url)
+            await self._send_webhook_async(message, card_image, url=account_webhook_url)
+        except WebhookError as e:
+            logger.warning(f"{full_account_name_for_logs}: Failed to send card message: {e}")
+
     def process_account(self, cookie: str, account_name: str, game_links: Dict[str, str], 
                         game_short_name: str, account_webhook_url: Optional[str] = None) -> bool:
         """
         The `process_account` function processes account information for a specific game, handling
-        various checks, actions, and error scenarios, with optional webhook notifications.
+        various checks, actions, and error scenarios, with optional webhook notifications. It is a
+        synchronous wrapper around `process_account_async` for callers without an event loop (GUI).
         
         .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
         
@@ -1071,92 +1789,276 @@ class LoginManager:
         .-.-.-.
         
         
+        """
+        return self._run_sync(self.process_account_async(cookie, account_name, game_links,
+                                                         game_short_name, account_webhook_url))
+
+    @classmethod
+    def current_sign_date(cls, now: Optional[datetime] = None) -> str:
+        """
+        The function `current_sign_date` returns the check-in day in the server reset timezone, the
+        period a daily sign-in counts for.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param now (Optional[datetime])  - A timezone-aware moment, the current time when `None`.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns The date as 'YYYY-MM-DD'.
+        
+        .-.-.-.
+        
+        
+        """
+        now = now or datetime.now(timezone.utc)
+        return now.astimezone(cls.SERVER_RESET_TZ).strftime("%Y-%m-%d")
+
+    async def process_account_async(self, cookie: str, account_name: str, game_links: Dict[str, str],
+                                    game_short_name: str, account_webhook_url: Optional[str] = None) -> bool:
+        """
+        The async function `process_account_async` runs the full check-in flow for one account and
+        game. See `process_account_outcome_async` for the details of the run.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param cookie (str)  - The daily login cookie of the account.
+        
+        .-.-.-.
+        
+        @ param account_name (str)  - The account nickname, used in logs and webhook messages.
+        
+        .-.-.-.
+        
+        @ param game_links (Dict[str, str])  - The links configuration of the game being processed.
+        
+        .-.-.-.
+        
+        @ param game_short_name (str)  - The short name of the game, used for card assets.
+        
+        .-.-.-.
+        
+        @ param account_webhook_url (Optional[str])  - Webhook URL for this account's notifications.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns `True` if the account was signed in (or already was), `False` otherwise.
+        
+        .-.-.-.
+        
+        
+        """
+        outcome = await self.process_account_outcome_async(cookie, account_name, game_links, game_short_name,
+                                                           account_webhook_url)
+        return outcome["success"]
+
+    async def process_account_outcome_async(self, cookie: str, account_name: str, game_links: Dict[str, str],
+                                            game_short_name: str, account_webhook_url: Optional[str] = None) -> ProcessOutcome:
+        """
+        The async function `process_account_outcome_async` runs the check-in flow like
+        `process_account_async` and reports what happened, for the run status kept in the database.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param cookie (str)  - The daily login cookie of the account.
+        
+        .-.-.-.
+        
+        @ param account_name (str)  - The account nickname, used in logs and webhook messages.
+        
+        .-.-.-.
+        
+        @ param game_links (Dict[str, str])  - The links configuration of the game being processed.
+        
+        .-.-.-.
+        
+        @ param game_short_name (str)  - The short name of the game, used for card assets.
+        
+        .-.-.-.
+        
+        @ param account_webhook_url (Optional[str])  - Webhook URL for this account's notifications.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns A `ProcessOutcome`: whether it succeeded, whether the account is signed in for today,
+        the `total_sign_day` the API reported (counting today's sign-in), the error message if it
+        failed and the seconds the whole flow took.
+        
+        .-.-.-.
+        
+        
+        """
+        outcome: ProcessOutcome = {"success": False, "signed_in": False, "total_sign_day": None, "error": None,
+                                   "latency": 0.0}
+        started = time.perf_counter()
+        try:
+            outcome["success"] = await self._process_account_flow(cookie, account_name, game_links, game_short_name,
+                                                                  account_webhook_url, outcome)
+        finally:
+            outcome["latency"] = time.perf_counter() - started
+        return outcome
+
+    async def _process_account_flow(self, cookie: str, account_name: str, game_links: Dict[str, str],
+                                    game_short_name: str, account_webhook_url: Optional[str],
+                                    outcome: ProcessOutcome) -> bool:
+        """
+        The async function `_process_account_flow` runs the full check-in flow for one account and
+        game, filling in `outcome` as it goes. Every HTTP call, webhook and card render runs off the event loop and the jitter
+        sleeps are non-blocking, so many accounts can be processed in one loop. The card is rendered
+        in the background while the sign-in runs; its message is sent once it is ready, and always
+        before the sign-in result.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param cookie (str)  - The daily login cookie of the account.
+        
+        .-.-.-.
+        
+        @ param account_name (str)  - The account nickname, used in logs and webhook messages.
+        
+        .-.-.-.
+        
+        @ param game_links (Dict[str, str])  - The links configuration of the game being processed.
+        
+        .-.-.-.
+        
+        @ param game_short_name (str)  - The short name of the game, used for card assets.
+        
+        .-.-.-.
+        
+        @ param account_webhook_url (Optional[str])  - Webhook URL for this account's notifications.
+        
+        .-.-.-.
+        
+        @ param outcome (ProcessOutcome)  - Updated with the sign-in state, day count and error.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns `True` if the account was signed in (or already was), `False` otherwise.
+        
+        .-.-.-.
+        
+        
         """
         full_account_name_for_logs = f"{account_name} ({game_short_name})"
         if not cookie or not game_links or not account_name or not game_short_name:
             logger.critical(f"CRITICAL: Missing parameters for processing {full_account_name_for_logs}. This is a bug.")
+            outcome["error"] = "Missing parameters."
             try:
-                self.webhook_manager.send(f"CRITICAL BUG: Missing parameters for {full_account_name_for_logs}. Cannot proceed.", url=account_webhook_url)
+                await self._send_webhook_async(f"CRITICAL BUG: Missing parameters for {full_account_name_for_logs}. Cannot proceed.", url=account_webhook_url)
             except Exception as e_wh:
                 logger.error(f"Failed to send critical bug webhook: {e_wh}")
             return False
 
         try:
-            is_already_signed_in = self._signin_check(cookie, game_links)
+            is_already_signed_in = await self._signin_check_async(cookie, game_links)
             logger.info(f"{full_account_name_for_logs}: Already signed in: {is_already_signed_in}")
 
-            rewards_list = self._reward_info(cookie, game_links)
-            day_count_api = self._day_counter(cookie, game_links)
-            refresh_time_unix = self._time_info(cookie, game_links)
+            refresh_time_unix = await self._time_info_async(cookie, game_links)
+            rewards_list = await self._reward_info_async(cookie, game_links, refresh_time_unix)
+            day_count_api = await self._day_counter_async(cookie, game_links)
+            outcome["total_sign_day"] = day_count_api
             refresh_time_formatted = self._time_formater(refresh_time_unix) 
 
             parsed_card_data = self._data_parser(rewards_list, day_count_api, refresh_time_formatted, is_already_signed_in)
-            card_image = None
-            try:
-                card_image = self._card_generator(parsed_card_data, game_short_name)
-                if card_image is None: # Explicitly check if card_generator returned None
-                    logger.warning(f"{full_account_name_for_logs}: Card image generation resulted in None, will proceed without card image.")
-            except CardGenerationError as e_card_gen:
-                logger.error(f"{full_account_name_for_logs}: Failed to generate reward card due to CardGenerationError: {e_card_gen}", exc_info=True)
-                self.webhook_manager.send(f"WARNING: {full_account_name_for_logs} - Could not generate reward card ({e_card_gen.message}). Sign-in will proceed.", url=account_webhook_url)
-            except Exception as e_card_unexpected: # Catch any other unexpected error from card_generator
-                logger.error(f"{full_account_name_for_logs}: Unexpected error during card generation: {e_card_unexpected}", exc_info=True)
-                self.webhook_manager.send(f"WARNING: {full_account_name_for_logs} - Unexpected error generating reward card. Sign-in will proceed.", url=account_webhook_url)
-
+            card_future = self._start_card_render(parsed_card_data, game_short_name)
 
             if is_already_signed_in:
+                outcome["signed_in"] = True
                 logger.info(f"{full_account_name_for_logs} has already signed in today.")
                 message = f"{full_account_name_for_logs} has already signed in today. Current rewards:"
-                self.webhook_manager.send(message, card_image, url=account_webhook_url)
+                card_image = await self._await_card(card_future, full_account_name_for_logs, account_webhook_url)
+                await self._send_webhook_async(message, card_image, url=account_webhook_url)
                 return True
             else: 
                 logger.info(f"{full_account_name_for_logs} has not signed in today. Attempting sign-in...")
                 message_before_signin = f"{full_account_name_for_logs} is attempting to sign in. Today's expected reward:"
-                self.webhook_manager.send(message_before_signin, card_image, url=account_webhook_url)
+                card_message = asyncio.create_task(self._send_card_message(message_before_signin, card_future, full_account_name_for_logs, account_webhook_url))
 
-                time.sleep(random.uniform(1, 3))
-                signin_successful = self._signin(cookie, game_links) 
-                time.sleep(random.uniform(1, 2))
+                try:
+                    await asyncio.sleep(random.uniform(1, 3))
+                    signin_successful = await self._signin_async(cookie, game_links) 
+                    await asyncio.sleep(random.uniform(1, 2))
+                finally:
+                    await card_message # Keeps the card message ahead of the sign-in result or error
 
                 if signin_successful:
-                    final_check_signed_in = self._signin_check(cookie, game_links) 
+                    final_check_signed_in = await self._signin_check_async(cookie, game_links) 
                     if final_check_signed_in:
+                        outcome["signed_in"] = True
+                        outcome["total_sign_day"] = day_count_api + 1
                         logger.info(f"{full_account_name_for_logs} successfully signed in and verified.")
-                        self.webhook_manager.send(f"SUCCESS: {full_account_name_for_logs} has successfully signed in and claimed their reward!", url=account_webhook_url) 
+                        await self._send_webhook_async(f"SUCCESS: {full_account_name_for_logs} has successfully signed in and claimed their reward!", url=account_webhook_url) 
                         return True
                     else:
                         logger.warning(f"{full_account_name_for_logs}: Sign-in API reported success/already done, but subsequent check shows not signed in. State is inconsistent.")
-                        self.webhook_manager.send(f"WARNING: {full_account_name_for_logs} - Sign-in status is inconsistent after attempt. Please check manually.", url=account_webhook_url)
+                        outcome["error"] = "Sign-in status is inconsistent after attempt."
+                        await self._send_webhook_async(f"WARNING: {full_account_name_for_logs} - Sign-in status is inconsistent after attempt. Please check manually.", url=account_webhook_url)
                         return False 
                 else: # Should ideally be caught by SigninError from _signin
                     logger.warning(f"{full_account_name_for_logs}: _signin returned False without raising an exception. This is unexpected.")
-                    self.webhook_manager.send(f"ERROR: {full_account_name_for_logs} - Sign-in attempt failed (unexpected return).", url=account_webhook_url)
+                    outcome["error"] = "Sign-in attempt failed (unexpected return)."
+                    await self._send_webhook_async(f"ERROR: {full_account_name_for_logs} - Sign-in attempt failed (unexpected return).", url=account_webhook_url)
                     return False
 
         except APIRequestError as e:
             logger.error(f"{full_account_name_for_logs}: Failed during API request: {e}", exc_info=True)
-            self.webhook_manager.send(f"ERROR: {full_account_name_for_logs} - API Request Error: {e.message}", url=account_webhook_url)
+            outcome["error"] = f"API Request Error: {e.message}"
+            await self._send_webhook_async(f"ERROR: {full_account_name_for_logs} - API Request Error: {e.message}", url=account_webhook_url)
             return False
         except APIDataError as e:
             logger.error(f"{full_account_name_for_logs}: Failed due to API data issue: {e}", exc_info=True)
-            self.webhook_manager.send(f"ERROR: {full_account_name_for_logs} - API Data Error: {e.message}", url=account_webhook_url)
+            outcome["error"] = f"API Data Error: {e.message}"
+            await self._send_webhook_async(f"ERROR: {full_account_name_for_logs} - API Data Error: {e.message}", url=account_webhook_url)
             return False
         except SigninError as e:
             logger.error(f"{full_account_name_for_logs}: Sign-in process failed: {e}", exc_info=True)
-            self.webhook_manager.send(f"ERROR: {full_account_name_for_logs} - Sign-in Failed: {e.message}", url=account_webhook_url)
+            outcome["error"] = f"Sign-in Failed: {e.message}"
+            await self._send_webhook_async(f"ERROR: {full_account_name_for_logs} - Sign-in Failed: {e.message}", url=account_webhook_url)
             return False
         except ValueError as e: # Catch string to int conversion errors, etc.
             logger.error(f"{full_account_name_for_logs}: Invalid data encountered: {e}", exc_info=True)
-            self.webhook_manager.send(f"ERROR: {full_account_name_for_logs} - Invalid Data: {e}", url=account_webhook_url)
+            outcome["error"] = f"Invalid Data: {e}"
+            await self._send_webhook_async(f"ERROR: {full_account_name_for_logs} - Invalid Data: {e}", url=account_webhook_url)
             return False
         except LoginManagerError as e: 
             logger.error(f"{full_account_name_for_logs}: A login process error occurred: {e}", exc_info=True)
-            self.webhook_manager.send(f"ERROR: {full_account_name_for_logs} - Login Process Error: {e.message}", url=account_webhook_url)
+            outcome["error"] = f"Login Process Error: {e.message}"
+            await self._send_webhook_async(f"ERROR: {full_account_name_for_logs} - Login Process Error: {e.message}", url=account_webhook_url)
             return False
         except Exception as e:
             logger.critical(f"{full_account_name_for_logs}: An UNEXPECTED error occurred in process_account: {e}", exc_info=True)
+            outcome["error"] = f"{type(e).__name__}: {str(e)[:200]}"
             try:
-                self.webhook_manager.send(f"CRITICAL UNEXPECTED ERROR: {full_account_name_for_logs} - {type(e).__name__}: {str(e)[:100]}. Check server logs!", url=account_webhook_url)
+                await self._send_webhook_async(f"CRITICAL UNEXPECTED ERROR: {full_account_name_for_logs} - {type(e).__name__}: {str(e)[:100]}. Check server logs!", url=account_webhook_url)
             except Exception as e_wh_crit:
                 logger.error(f"Failed to send CRITICAL UNEXPECTED error webhook: {e_wh_crit}")
             return False
\ No newline at end of file
@@ -0,0 +1,210 @@
+FILE_VERSION = "0.1.0"
+
+import logging
+import os
+import sqlite3
+import tempfile
+import time
+from sqlite3 import Connection, Cursor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from .exceptions import MigrationError
+
+logger = logging.getLogger(__name__)
+
+
+class Migration(NamedTuple):
+    version: int
+    description: str
+    apply: Callable[[Cursor], None]
+
+
+def schema_version(conn: Connection) -> int:
+    """
+    The function `schema_version` reads the schema version stored in the database header.
+
+    .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+    Author - Liam Scott
+    Last update - 10/18/2026
+
+    .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+    @ param conn (Connection)  - An open database connection.
+
+    .-.-.-.
+
+
+
+    @ returns The value of `PRAGMA user_version`, 0 for a database that was never migrated.
+
+    .-.-.-.
+
+
+    """
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def latest_version(migrations: Sequence[Migration]) -> int:
+    return max((migration.version for migration in migrations), default=0)
+
+
+def backup_database(conn: Connection, backup_file: str):
+    """
+    The function `backup_database` writes a consistent copy of an open database with SQLite's
+    online backup API, which is safe while other connections use it.
+
+    .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+    Author - Liam Scott
+    Last update - 10/18/2026
+
+    .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+    @ param conn (Connection)  - The database to copy.
+
+    .-.-.-.
+
+    @ param backup_file (str)  - Path of the copy. An existing file is overwritten.
+
+    .-.-.-.
+
+
+    """
+    target = sqlite3.connect(backup_file)
+    try:
+        conn.backup(target)
+    finally:
+        target.close()
+
+
+def migrate(conn: Connection, migrations: Sequence[Migration], target_version: Optional[int] = None) -> List[int]:
+    """
+    The function `migrate` applies every migration above the database's `user_version`, in order.
+    Each one runs in its own `BEGIN IMMEDIATE` transaction together with the `user_version` bump,
+    so a failed migration leaves the database exactly at the previous version.
+
+    .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+    Author - Liam Scott
+    Last update - 10/18/2026
+
+    .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+    @ param conn (Connection)  - An open database connection with no transaction in progress.
+
+    .-.-.-.
+
+    @ param migrations (Sequence[Migration])  - All migrations of the schema. Versions must be unique.
+
+    .-.-.-.
+
+    @ param target_version (Optional[int])  - Stop after this version, the latest when `None`.
+
+    .-.-.-.
+
+
+
+    @ returns The versions that were applied, empty when the database was already up to date.
+    Raises `MigrationError` if a migration fails or the database is newer than `migrations`.
+
+    .-.-.-.
+
+
+    """
+    ordered = sorted(migrations, key=lambda migration: migration.version)
+    if len({migration.version for migration in ordered}) != len(ordered):
+        raise MigrationError("Duplicate migration versions.")
+    target_version = latest_version(ordered) if target_version is None else target_version
+    current = schema_version(conn)
+    if current > latest_version(ordered):
+        raise MigrationError(f"Database schema version {current} is newer than this version of the app "
+                             f"supports ({latest_version(ordered)}).", version=current)
+
+    applied: List[int] = []
+    for migration in ordered:
+        if migration.version <= current or migration.version > target_version:
+            continue
+        started = time.perf_counter()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            migration.apply(conn.cursor())
+            conn.execute(f"PRAGMA user_version = {int(migration.version)}")
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise MigrationError(f"Migration {migration.version} ({migration.description}) failed.",
+                                 version=migration.version, original_exception=e) from e
+        logger.info(f"Database migrated to version {migration.version} ({migration.description}) "
+                    f"in {(time.perf_counter() - started) * 1000:.1f} ms.")
+        applied.append(migration.version)
+        current = migration.version
+    return applied
+
+
+def verify_on_copy(database_file: str, migrations: Sequence[Migration]) -> Dict[str, Any]:
+    """
+    The function `verify_on_copy` migrates a throwaway copy of a real database and checks the
+    result, without touching the original. Use it on copies of user databases before shipping a new
+    migration.
+
+    .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+    Author - Liam Scott
+    Last update - 10/18/2026
+
+    .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+    @ param database_file (str)  - Path of the database to test.
+
+    .-.-.-.
+
+    @ param migrations (Sequence[Migration])  - The migrations to apply.
+
+    .-.-.-.
+
+
+
+    @ returns A dictionary with `from_version`, `to_version`, `applied`, `integrity` (the result of
+    `PRAGMA integrity_check`), `foreign_key_errors`, `table_counts` before and after, `ok` and
+    `error`.
+
+    .-.-.-.
+
+
+    """
+    report: Dict[str, Any] = {"database": database_file, "from_version": None, "to_version": None, "applied": [],
+                              "integrity": None, "foreign_key_errors": 0, "table_counts": {}, "ok": False,
+                              "error": None}
+    source = sqlite3.connect(f"file:{database_file}?mode=ro", uri=True)
+    handle, copy_file = tempfile.mkstemp(suffix=".db", prefix="hoyohelper-migrate-")
+    os.close(handle)
+    try:
+        backup_database(source, copy_file)
+        source.close()
+        copy = sqlite3.connect(copy_file)
+        try:
+            report["from_version"] = schema_version(copy)
+            before = _table_counts(copy)
+            copy.execute("PRAGMA foreign_keys = ON")
+            report["applied"] = migrate(copy, migrations)
+            report["to_version"] = schema_version(copy)
+            report["integrity"] = copy.execute("PRAGMA integrity_check").fetchone()[0]
+            report["foreign_key_errors"] = len(copy.execute("PRAGMA foreign_key_check").fetchall())
+            after = _table_counts(copy)
+            report["table_counts"] = {table: (before.get(table), after[table]) for table in after}
+            report["ok"] = report["integrity"] == "ok" and report["foreign_key_errors"] == 0
+        finally:
+            copy.close()
+    except (sqlite3.Error, MigrationError) as e:
+        report["error"] = str(e)
+    finally:
+        source.close()
+        os.remove(copy_file)
+    return report
+
+
+def _table_counts(conn: Connection) -> Dict[str, int]:
+    tables = [row[0] for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%' ORDER BY name")]
+    return {table: conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0] for table in tables}
@@ -0,0 +1,51 @@
+FILE_VERSION = "0.1.0"
+
+import os
+
+
+def get_data_dir(runtime: str = 'os', *parts: str) -> str:
+    """
+    The function `get_data_dir` returns (and creates) a folder under the HoyoHelper data directory,
+    using the same locations as `DatabaseManager` and `ConfigManager`.
+
+    .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+    Author - Liam Scott
+    Last update - 10/18/2026
+
+    .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+    @ param runtime (str) os - The runtime environment, 'os' or 'docker'.
+
+    .-.-.-.
+
+    @ param parts (str)  - Sub folders below the data directory, for example ('cache', 'assets').
+
+    .-.-.-.
+
+
+
+    @ returns The absolute path of the folder.
+
+    .-.-.-.
+
+
+    """
+    if runtime == 'docker':
+        base = os.path.join('/app', 'data')
+    elif os.name == 'nt':
+        app_data_path = os.getenv('APPDATA')
+        if app_data_path:
+            base = os.path.join(app_data_path, 'HoyoHelper', 'data')
+        else: # Fallback if APPDATA is not set
+            base = os.path.join(os.path.expanduser("~"), '.HoyoHelper', 'data')
+    else:
+        home_path = os.getenv('HOME')
+        if home_path:
+            base = os.path.join(home_path, '.config', 'HoyoHelper', 'data')
+        else: # Fallback if HOME is not set
+            base = os.path.join(os.path.expanduser("~"), '.HoyoHelper', 'data')
+
+    path = os.path.join(base, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
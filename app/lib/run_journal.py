@@ -0,0 +1,218 @@
+FILE_VERSION = "0.1.0"
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, List, Optional
+
+from .database import DatabaseManager, RunEvent
+
+logger = logging.getLogger(__name__)
+
+
+class GameMetrics:
+    def __init__(self, account_id: Optional[int], game: str):
+        """
+        The function initializes the counters of one account and game in a run. They are only
+        updated from the event loop, so they need no lock.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param account_id (Optional[int])  - The id of the account.
+
+        .-.-.-.
+
+        @ param game (str)  - The game code.
+
+        .-.-.-.
+
+
+        """
+        self.account_id = account_id
+        self.game = game
+        self.started_at = time.time()
+        self.ended_at: Optional[float] = None
+        self.http_calls = 0
+        self.retries = 0
+        self.retcode: Optional[int] = None
+        self.render_ms: Optional[float] = None
+        self.success = False
+        self.error: Optional[str] = None
+
+    def http_call(self, retcode: Optional[int] = None):
+        """
+        The function `http_call` counts one request that went to the network. The journal keeps the
+        last non-zero retcode, 0 when every response was successful.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param retcode (Optional[int])  - The `retcode` of the response, `None` if it had none.
+
+        .-.-.-.
+
+
+        """
+        self.http_calls += 1
+        if retcode is not None and (retcode != 0 or self.retcode is None):
+            self.retcode = retcode
+
+    def retry(self):
+        self.retries += 1
+
+    def card_rendered(self, seconds: float):
+        self.render_ms = seconds * 1000
+
+    def to_event(self) -> RunEvent:
+        return {
+            "run_id": None,
+            "account_id": self.account_id,
+            "game": self.game,
+            "started_at": self.started_at,
+            "ended_at": self.ended_at if self.ended_at is not None else time.time(),
+            "http_calls": self.http_calls,
+            "retries": self.retries,
+            "retcode": self.retcode,
+            "render_ms": self.render_ms,
+            "success": self.success,
+            "error": self.error,
+        }
+
+
+_current_metrics: ContextVar[Optional[GameMetrics]] = ContextVar("hoyohelper_game_metrics", default=None)
+
+
+def current_metrics() -> Optional[GameMetrics]:
+    """
+    The function `current_metrics` returns the counters of the account and game being processed in
+    the calling task. `asyncio` copies context variables into new tasks and `asyncio.to_thread`, so
+    code deep inside the login flow can count without the counters being passed down.
+
+    .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+    Author - Liam Scott
+    Last update - 10/18/2026
+
+    .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+
+
+    @ returns The active `GameMetrics`, or `None` outside `RunJournal.track`.
+
+    .-.-.-.
+
+
+    """
+    return _current_metrics.get()
+
+
+class RunJournal:
+    def __init__(self, store: DatabaseManager, batch_size: int = 50):
+        """
+        The function initializes the journal of one headless run. Finished games are buffered and
+        written to the `run_events` table `batch_size` at a time, so the run does not pay for a
+        commit per game.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param store (DatabaseManager)  - Where runs and entries are written.
+
+        .-.-.-.
+
+        @ param batch_size (int)  - How many finished games are buffered before a write.
+
+        .-.-.-.
+
+
+        """
+        self.store = store
+        self.batch_size = max(1, batch_size)
+        self.run_id: Optional[int] = None
+        self.started_at: Optional[float] = None
+        self.events_written = 0
+        self._pending: List[RunEvent] = []
+
+    def start(self, max_concurrency: int) -> Optional[int]:
+        self.started_at = time.time()
+        self.run_id = self.store.start_run(self.started_at, max_concurrency)
+        if self.run_id is None:
+            logger.warning("Could not start the run journal; this run will not be recorded.")
+        return self.run_id
+
+    @asynccontextmanager
+    async def track(self, account_id: Optional[int], game: str) -> AsyncIterator[GameMetrics]:
+        """
+        The function `track` collects the metrics of one account and game while the block runs and
+        queues them for the journal when it ends, also when it raises. A full batch is written from a
+        worker thread, so other accounts keep running during the commit.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param account_id (Optional[int])  - The id of the account.
+
+        .-.-.-.
+
+        @ param game (str)  - The game code.
+
+        .-.-.-.
+
+
+
+        @ returns An async context manager yielding the `GameMetrics`; the caller sets `success` and
+        `error`.
+
+        .-.-.-.
+
+
+        """
+        metrics = GameMetrics(account_id, game)
+        token = _current_metrics.set(metrics)
+        try:
+            yield metrics
+        finally:
+            _current_metrics.reset(token)
+            metrics.ended_at = time.time()
+            if self.run_id is not None:
+                self._pending.append(metrics.to_event())
+                if len(self._pending) >= self.batch_size:
+                    events, self._pending = self._pending, [] # Taken on the event loop, written off it
+                    await asyncio.to_thread(self._write, events)
+
+    def flush(self):
+        if not self._pending or self.run_id is None:
+            return
+        events, self._pending = self._pending, []
+        self._write(events)
+
+    def _write(self, events: List[RunEvent]):
+        if self.store.record_run_events(self.run_id, events):
+            self.events_written += len(events)
+        else:
+            logger.warning(f"Could not write {len(events)} run journal entries.")
+
+    def finish(self, accounts: int, failed: int):
+        self.flush()
+        if self.run_id is not None:
+            self.store.finish_run(self.run_id, time.time(), accounts, failed)
+            logger.info(f"Run {self.run_id} journaled with {self.events_written} game entries.")
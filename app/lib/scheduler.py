@@ -0,0 +1,278 @@
+FILE_VERSION = "0.1.0"
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, TypedDict
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+
+class SchedulerReport(TypedDict):
+    accounts: int
+    failures: int
+    elapsed_seconds: float
+    accounts_per_minute: float
+    latency_p50: float
+    latency_p95: float
+
+
+class HostRateLimiter:
+    def __init__(self, requests_per_second: float):
+        """
+        The function initializes a per-host request spacer. Each host gets its own schedule, and
+        callers are given slots in the order they asked for them, so no account can starve another.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param requests_per_second (float)  - Maximum request rate for a single host. A value of 0 or
+        less disables limiting.
+
+        .-.-.-.
+
+
+        """
+        self.requests_per_second = requests_per_second
+        self._interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _host_of(url: str) -> str:
+        return urlsplit(url).netloc.lower()
+
+    def _reserve(self, url: str) -> float:
+        """
+        The function `_reserve` books the next free slot for the host of `url`.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param url (str)  - The URL about to be requested.
+
+        .-.-.-.
+
+
+
+        @ returns How many seconds the caller has to wait before sending the request.
+
+        .-.-.-.
+
+
+        """
+        if self._interval <= 0:
+            return 0.0
+        host = self._host_of(url)
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self._interval
+        return slot - now
+
+    async def acquire(self, url: str):
+        """
+        The async function `acquire` waits until a request to the host of `url` is allowed.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param url (str)  - The URL about to be requested.
+
+        .-.-.-.
+
+
+        """
+        delay = self._reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def acquire_blocking(self, url: str):
+        """
+        The function `acquire_blocking` is the thread version of `acquire`.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param url (str)  - The URL about to be requested.
+
+        .-.-.-.
+
+
+        """
+        delay = self._reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    The function `percentile` returns the nearest-rank percentile of a list of values.
+
+    .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+    Author - Liam Scott
+    Last update - 10/18/2026
+
+    .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+    @ param values (List[float])  - The samples.
+
+    .-.-.-.
+
+    @ param pct (float)  - The percentile to compute, between 0 and 100.
+
+    .-.-.-.
+
+
+
+    @ returns The percentile value, or 0.0 when there are no samples.
+
+    .-.-.-.
+
+
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class AccountScheduler:
+    def __init__(self, max_concurrency: int = 4):
+        """
+        The function initializes a scheduler that runs one coroutine per account with a global
+        concurrency limit.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param max_concurrency (int)  - How many accounts may be processed at the same time.
+
+        .-.-.-.
+
+
+        """
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.latencies: List[float] = []
+        self.failures = 0
+        self.elapsed_seconds = 0.0
+
+    async def run(self, items: Iterable[Any], worker: Callable[[Any], Awaitable[Any]],
+                  on_error: Optional[Callable[[Any, BaseException], Awaitable[None]]] = None) -> SchedulerReport:
+        """
+        The async function `run` processes every item with `worker`, never more than
+        `max_concurrency` at once. Items are started in the order given because waiters on the
+        semaphore are woken first in, first out. Each item still runs its own steps sequentially.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        @ param items (Iterable[Any])  - The accounts to process, in the order they should start.
+
+        .-.-.-.
+
+        @ param worker (Callable[[Any], Awaitable[Any]])  - The coroutine function run for each item.
+
+        .-.-.-.
+
+        @ param on_error (Optional[Callable[[Any, BaseException], Awaitable[None]]])  - Called when
+        `worker` raises. The item is counted as a failure either way.
+
+        .-.-.-.
+
+
+
+        @ returns A `SchedulerReport` with throughput and per-account latency percentiles.
+
+        .-.-.-.
+
+
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.latencies = []
+        self.failures = 0
+
+        async def _run_one(item: Any):
+            async with semaphore:
+                started = time.monotonic()
+                try:
+                    await worker(item)
+                except Exception as e:
+                    self.failures += 1
+                    if on_error is not None:
+                        await on_error(item, e)
+                    else:
+                        logger.error(f"Scheduled task failed: {e}", exc_info=True)
+                finally:
+                    self.latencies.append(time.monotonic() - started)
+
+        run_started = time.monotonic()
+        await asyncio.gather(*(_run_one(item) for item in items))
+        self.elapsed_seconds = time.monotonic() - run_started
+        return self.report()
+
+    def report(self) -> SchedulerReport:
+        """
+        The function `report` summarizes the last run.
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+        Author - Liam Scott
+        Last update - 10/18/2026
+
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+
+
+
+        @ returns A `SchedulerReport` dictionary.
+
+        .-.-.-.
+
+
+        """
+        count = len(self.latencies)
+        per_minute = (count / self.elapsed_seconds * 60) if self.elapsed_seconds > 0 else 0.0
+        return {
+            "accounts": count,
+            "failures": self.failures,
+            "elapsed_seconds": self.elapsed_seconds,
+            "accounts_per_minute": per_minute,
+            "latency_p50": percentile(self.latencies, 50),
+            "latency_p95": percentile(self.latencies, 95),
+        }
+
+    @staticmethod
+    def format_report(report: SchedulerReport) -> str:
+        return (f"{report['accounts']} account(s) in {report['elapsed_seconds']:.1f}s "
+                f"({report['accounts_per_minute']:.1f} accounts/min), "
+                f"per-account latency p50 {report['latency_p50']:.1f}s / p95 {report['latency_p95']:.1f}s, "
+                f"{report['failures']} unhandled failure(s).")
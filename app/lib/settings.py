@@ -172,6 +172,90 @@ class ConfigManager:
             return base64.b64decode(valadation_base64), base64.b64decode(salt_base64)
         return b"", b""
     
+    def get_network_pool_size(self) -> int:
+        return int(self.config_data.get("Network", {}).get("pool_size", 10))
+
+    def get_network_keep_alive(self) -> bool:
+        return bool(self.config_data.get("Network", {}).get("keep_alive", True))
+
+    def get_network_retry_total(self) -> int:
+        return int(self.config_data.get("Network", {}).get("retry_total", 3))
+
+    def get_network_backoff_factor(self) -> float:
+        return float(self.config_data.get("Network", {}).get("backoff_factor", 0.5))
+
+    def get_scheduler_max_concurrency(self) -> int:
+        return int(self.config_data.get("Scheduler", {}).get("max_concurrency", 4))
+
+    def get_scheduler_host_rate(self) -> float:
+        return float(self.config_data.get("Scheduler", {}).get("host_requests_per_second", 2.0))
+
+    def get_scheduler_skip_signed_today(self) -> bool:
+        return bool(self.config_data.get("Scheduler", {}).get("skip_signed_today", True))
+
+    def get_scheduler_run_history_days(self) -> int:
+        return int(self.config_data.get("Scheduler", {}).get("run_history_days", 90))
+
+    def get_kdf_algorithm(self) -> str:
+        return str(self.config_data.get("Encryption", {}).get("kdf_algorithm", "pbkdf2"))
+
+    def get_kdf_iterations(self) -> int:
+        return int(self.config_data.get("Encryption", {}).get("kdf_iterations", 100000))
+
+    def get_kdf_memory_kib(self) -> int:
+        return int(self.config_data.get("Encryption", {}).get("kdf_memory_kib", 0))
+
+    def get_kdf_parallelism(self) -> int:
+        return int(self.config_data.get("Encryption", {}).get("kdf_parallelism", 1))
+
+    def get_kdf_target_ms(self) -> int:
+        return int(self.config_data.get("Encryption", {}).get("kdf_target_ms", 0))
+
+    def get_kdf_calibrated_ms(self) -> int:
+        return int(self.config_data.get("Encryption", {}).get("kdf_calibrated_ms", 0))
+
+    def get_asset_cache_max_megabytes(self) -> int:
+        return int(self.config_data.get("AssetCache", {}).get("max_megabytes", 256))
+
+    def get_asset_cache_revalidate_hours(self) -> float:
+        return float(self.config_data.get("AssetCache", {}).get("revalidate_hours", 24))
+
+    def get_image_cache_max_megabytes(self) -> int:
+        return int(self.config_data.get("AssetCache", {}).get("decoded_max_megabytes", 128))
+
+    def get_render_workers(self) -> int:
+        return int(self.config_data.get("Rendering", {}).get("workers", 2))
+
+    def get_render_use_processes(self) -> bool:
+        return bool(self.config_data.get("Rendering", {}).get("use_processes", False))
+
+    def get_webhook_global_rate(self) -> float:
+        return float(self.config_data.get("Webhook", {}).get("global_requests_per_second", 50.0))
+
+    def get_webhook_max_retries(self) -> int:
+        return int(self.config_data.get("Webhook", {}).get("max_retries", 5))
+
+    def get_webhook_digest(self) -> bool:
+        return bool(self.config_data.get("Webhook", {}).get("digest", False))
+
+    def get_webhook_digest_window(self) -> float:
+        return float(self.config_data.get("Webhook", {}).get("digest_window_seconds", 0.0))
+
+    def get_card_format(self) -> str:
+        return str(self.config_data.get("Webhook", {}).get("card_format", "PNG"))
+
+    def get_card_compress_level(self) -> int:
+        return int(self.config_data.get("Webhook", {}).get("card_compress_level", 6))
+
+    def get_card_quality(self) -> int:
+        return int(self.config_data.get("Webhook", {}).get("card_quality", 90))
+
+    def get_card_quantize_colors(self) -> int:
+        return int(self.config_data.get("Webhook", {}).get("card_quantize_colors", 0))
+
+    def get_card_max_kilobytes(self) -> int:
+        return int(self.config_data.get("Webhook", {}).get("card_max_kilobytes", 0))
+
     def get_salt(self) -> bytes:
         salt_base64 = self.config_data["App"].get("salt", "")
         if salt_base64:
@@ -228,6 +312,141 @@ class ConfigManager:
         self.config_data["App"]["salt"] = salt_base64 # we may not need the set_salt method anymore... or i should break this method up...
         self.save_config()
     
+    def set_network_pool_size(self, pool_size: int):
+        self.config_data.setdefault("Network", {})["pool_size"] = pool_size
+        self.save_config()
+
+    def set_network_keep_alive(self, keep_alive: bool):
+        self.config_data.setdefault("Network", {})["keep_alive"] = keep_alive
+        self.save_config()
+
+    def set_network_retry_total(self, retry_total: int):
+        self.config_data.setdefault("Network", {})["retry_total"] = retry_total
+        self.save_config()
+
+    def set_network_backoff_factor(self, backoff_factor: float):
+        self.config_data.setdefault("Network", {})["backoff_factor"] = backoff_factor
+        self.save_config()
+
+    def set_scheduler_max_concurrency(self, max_concurrency: int):
+        self.config_data.setdefault("Scheduler", {})["max_concurrency"] = max_concurrency
+        self.save_config()
+
+    def set_scheduler_host_rate(self, requests_per_second: float):
+        self.config_data.setdefault("Scheduler", {})["host_requests_per_second"] = requests_per_second
+        self.save_config()
+
+    def set_scheduler_skip_signed_today(self, skip: bool):
+        self.config_data.setdefault("Scheduler", {})["skip_signed_today"] = skip
+        self.save_config()
+
+    def set_scheduler_run_history_days(self, days: int):
+        self.config_data.setdefault("Scheduler", {})["run_history_days"] = days
+        self.save_config()
+
+    def set_kdf_target_ms(self, target_ms: int):
+        self.config_data.setdefault("Encryption", {})["kdf_target_ms"] = target_ms
+        self.save_config()
+
+    def set_kdf_params(self, algorithm: str, iterations: int, memory_kib: int, parallelism: int, calibrated_ms: int = 0):
+        """
+        The function `set_kdf_params` stores the key derivation new secrets are encrypted with, in one
+        write so the saved parameters always belong together.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param algorithm (str)  - 'pbkdf2', 'scrypt' or 'argon2id'.
+        
+        .-.-.-.
+        
+        @ param iterations (int)  - PBKDF2 iterations, scrypt N or Argon2id time cost.
+        
+        .-.-.-.
+        
+        @ param memory_kib (int)  - Memory of scrypt or Argon2id in KiB, 0 for PBKDF2.
+        
+        .-.-.-.
+        
+        @ param parallelism (int)  - scrypt p or Argon2id lanes.
+        
+        .-.-.-.
+        
+        @ param calibrated_ms (int)  - The `kdf_target_ms` these were calibrated for, 0 if set by hand.
+        
+        .-.-.-.
+        
+        
+        """
+        self.config_data.setdefault("Encryption", {}).update({
+            "kdf_algorithm": algorithm,
+            "kdf_iterations": iterations,
+            "kdf_memory_kib": memory_kib,
+            "kdf_parallelism": parallelism,
+            "kdf_calibrated_ms": calibrated_ms,
+        })
+        self.save_config()
+
+    def set_asset_cache_max_megabytes(self, max_megabytes: int):
+        self.config_data.setdefault("AssetCache", {})["max_megabytes"] = max_megabytes
+        self.save_config()
+
+    def set_asset_cache_revalidate_hours(self, revalidate_hours: float):
+        self.config_data.setdefault("AssetCache", {})["revalidate_hours"] = revalidate_hours
+        self.save_config()
+
+    def set_image_cache_max_megabytes(self, max_megabytes: int):
+        self.config_data.setdefault("AssetCache", {})["decoded_max_megabytes"] = max_megabytes
+        self.save_config()
+
+    def set_render_workers(self, workers: int):
+        self.config_data.setdefault("Rendering", {})["workers"] = workers
+        self.save_config()
+
+    def set_render_use_processes(self, use_processes: bool):
+        self.config_data.setdefault("Rendering", {})["use_processes"] = use_processes
+        self.save_config()
+
+    def set_webhook_global_rate(self, requests_per_second: float):
+        self.config_data.setdefault("Webhook", {})["global_requests_per_second"] = requests_per_second
+        self.save_config()
+
+    def set_webhook_max_retries(self, max_retries: int):
+        self.config_data.setdefault("Webhook", {})["max_retries"] = max_retries
+        self.save_config()
+
+    def set_webhook_digest(self, enabled: bool):
+        self.config_data.setdefault("Webhook", {})["digest"] = enabled
+        self.save_config()
+
+    def set_webhook_digest_window(self, seconds: float):
+        self.config_data.setdefault("Webhook", {})["digest_window_seconds"] = seconds
+        self.save_config()
+
+    def set_card_format(self, image_format: str):
+        self.config_data.setdefault("Webhook", {})["card_format"] = image_format
+        self.save_config()
+
+    def set_card_compress_level(self, level: int):
+        self.config_data.setdefault("Webhook", {})["card_compress_level"] = level
+        self.save_config()
+
+    def set_card_quality(self, quality: int):
+        self.config_data.setdefault("Webhook", {})["card_quality"] = quality
+        self.save_config()
+
+    def set_card_quantize_colors(self, colors: int):
+        self.config_data.setdefault("Webhook", {})["card_quantize_colors"] = colors
+        self.save_config()
+
+    def set_card_max_kilobytes(self, kilobytes: int):
+        self.config_data.setdefault("Webhook", {})["card_max_kilobytes"] = kilobytes
+        self.save_config()
+
     def set_salt(self, salt: bytes):
         salt_base64 = base64.b64encode(salt).decode('utf-8')
         self.config_data["App"]["salt"] = salt_base64
@@ -267,6 +486,46 @@ class ConfigManager:
                 "valadation": "ciphercheck",
                 "salt": "ciphercheck"
 
+            },
+            "Network": {
+                "pool_size": 10,
+                "keep_alive": True,
+                "retry_total": 3,
+                "backoff_factor": 0.5
+            },
+            "Scheduler": {
+                "max_concurrency": 4,
+                "host_requests_per_second": 2.0,
+                "skip_signed_today": True,
+                "run_history_days": 90
+            },
+            "Encryption": {
+                "kdf_algorithm": "pbkdf2",
+                "kdf_iterations": 100000,
+                "kdf_memory_kib": 0,
+                "kdf_parallelism": 1,
+                "kdf_target_ms": 0,
+                "kdf_calibrated_ms": 0
+            },
+            "AssetCache": {
+                "max_megabytes": 256,
+                "revalidate_hours": 24,
+                "decoded_max_megabytes": 128
+            },
+            "Rendering": {
+                "workers": 2,
+                "use_processes": False
+            },
+            "Webhook": {
+                "global_requests_per_second": 50.0,
+                "max_retries": 5,
+                "digest": False,
+                "digest_window_seconds": 0.0,
+                "card_format": "PNG",
+                "card_compress_level": 6,
+                "card_quality": 90,
+                "card_quantize_colors": 0,
+                "card_max_kilobytes": 0
             }
         }
         self.save_config()
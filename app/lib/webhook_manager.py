@@ -2,15 +2,204 @@ FILE_VERSION = "0.1.1"
 
 import requests
 import os
+import atexit
+import json
 import logging
+import threading
+import time
+from collections import deque
 from PIL import Image
-from io import BytesIO
-from typing import Optional, Dict, Tuple
+from typing import Any, Deque, List, Optional, Dict, Tuple
+
+from .card_encoder import CardEncoder
+from .exceptions import WebhookError, WebhookRateLimitError
+
+class WebhookRateLimiter:
+    def __init__(self, global_requests_per_second: float = 50.0):
+        """
+        The function initializes the Discord rate limit bookkeeping. Every webhook URL is mapped to the
+        bucket Discord reports in `X-RateLimit-Bucket`, each bucket remembers how many requests are left
+        and when it resets, and a global spacing keeps all posts under Discord's global limit.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param global_requests_per_second (float)  - Upper bound for all webhook posts together. A
+        value of 0 or less disables the global spacing.
+        
+        .-.-.-.
+        
+        
+        """
+        self.global_requests_per_second = global_requests_per_second
+        self._interval = 1.0 / global_requests_per_second if global_requests_per_second > 0 else 0.0
+        self._lock = threading.Lock()
+        self._bucket_of_url: Dict[str, str] = {}
+        self._buckets: Dict[str, Dict[str, float]] = {}
+        self._global_next_slot = 0.0
+        self._global_blocked_until = 0.0
+
+    def _bucket(self, url: str) -> Optional[Dict[str, float]]:
+        return self._buckets.get(self._bucket_of_url.get(url, url))
+
+    def delay(self, url: str) -> float:
+        """
+        The function `delay` tells how long a post to `url` has to wait. It does not reserve anything.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param url (str)  - The webhook URL.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns Seconds to wait, 0.0 when the post may be sent now.
+        
+        .-.-.-.
+        
+        
+        """
+        now = time.monotonic()
+        with self._lock:
+            wait = max(0.0, self._global_blocked_until - now, self._global_next_slot - now)
+            bucket = self._bucket(url)
+            if bucket and bucket["remaining"] <= 0 and bucket["reset_at"] > now:
+                wait = max(wait, bucket["reset_at"] - now)
+            return wait
+
+    def reserve(self, url: str):
+        now = time.monotonic()
+        with self._lock:
+            if self._interval > 0:
+                self._global_next_slot = max(now, self._global_next_slot) + self._interval
+            bucket = self._bucket(url)
+            if bucket and bucket["reset_at"] > now:
+                bucket["remaining"] -= 1
+
+    def block(self, url: str, seconds: float):
+        """
+        The function `block` holds back posts to `url` for `seconds`, used to back off after a failed
+        delivery that was not a 429.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param url (str)  - The webhook URL.
+        
+        .-.-.-.
+        
+        @ param seconds (float)  - How long to wait before the next post.
+        
+        .-.-.-.
+        
+        
+        """
+        reset_at = time.monotonic() + seconds
+        with self._lock:
+            key = self._bucket_of_url.get(url, url)
+            bucket = self._buckets.get(key)
+            if bucket is None or bucket["remaining"] > 0 or bucket["reset_at"] < reset_at:
+                self._buckets[key] = {"remaining": 0, "reset_at": reset_at}
+
+    def update(self, url: str, response: requests.Response) -> Tuple[float, bool]:
+        """
+        The function `update` reads the rate limit headers of a webhook response.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param url (str)  - The webhook URL the response belongs to.
+        
+        .-.-.-.
+        
+        @ param response (requests.Response)  - The response of the post.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns For a 429, the seconds to wait and whether the global limit was hit. `(0.0, False)`
+        for any other status.
+        
+        .-.-.-.
+        
+        
+        """
+        headers = response.headers
+        now = time.monotonic()
+        retry_after = 0.0
+        is_global = False
+        if response.status_code == 429:
+            try:
+                body = response.json()
+            except ValueError:
+                body = {}
+            retry_after = _to_float(headers.get("Retry-After"), _to_float(body.get("retry_after"), 1.0))
+            is_global = (headers.get("X-RateLimit-Global", "").lower() == "true"
+                         or headers.get("X-RateLimit-Scope", "").lower() == "global"
+                         or bool(body.get("global")))
+
+        with self._lock:
+            bucket_id = headers.get("X-RateLimit-Bucket")
+            if bucket_id:
+                self._bucket_of_url[url] = bucket_id
+            key = self._bucket_of_url.get(url, url)
+            if "X-RateLimit-Remaining" in headers:
+                reset_after = _to_float(headers.get("X-RateLimit-Reset-After"), 0.0)
+                self._buckets[key] = {"remaining": _to_float(headers.get("X-RateLimit-Remaining"), 1.0),
+                                      "reset_at": now + reset_after}
+            if response.status_code == 429:
+                if is_global:
+                    self._global_blocked_until = max(self._global_blocked_until, now + retry_after)
+                else:
+                    self._buckets[key] = {"remaining": 0, "reset_at": now + retry_after}
+        return retry_after, is_global
+
+
+def _to_float(value: Any, default: float) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+Attachment = Tuple[str, bytes, str]
+# (content, attachment, attempts, outbox table ids, time.monotonic() when queued)
+OutboxItem = Tuple[str, Optional[Attachment], int, List[int], float]
 
-from .exceptions import WebhookError 
 
 class WebhookManager:
-    def __init__(self, default_url: Optional[str] = None):
+    DISCORD_CONTENT_LIMIT = 2000
+    DISCORD_FILE_LIMIT = 10
+    DISCORD_EMBED_LIMIT = 10
+    DISCORD_EMBED_DESCRIPTION_LIMIT = 4096
+    DISCORD_EMBED_TOTAL_LIMIT = 6000
+    DEFAULT_MAX_RETRIES = 5
+    RETRY_BACKOFF = 2.0
+    MAX_RETRY_BACKOFF = 300.0
+    STORED_RETRY_DELAY = 300.0
+
+    def __init__(self, default_url: Optional[str] = None, global_requests_per_second: float = 50.0,
+                 max_retries: int = DEFAULT_MAX_RETRIES, store=None, digest: bool = False,
+                 digest_window: float = 0.0, encoder: Optional[CardEncoder] = None):
         """
         This Python function initializes a `default_url` attribute with a provided value or an
         environment variable, logging a warning if neither is available.
@@ -29,6 +218,38 @@ class WebhookManager:
         
         .-.-.-.
         
+        @ param global_requests_per_second (float)  - Upper bound for all posts of this manager together.
+        
+        .-.-.-.
+        
+        @ param max_retries (int)  - How many times a queued post is retried, after a 429 or a failed
+        delivery, before it is given up for this run.
+        
+        .-.-.-.
+        
+        @ param store (Optional[DatabaseManager])  - When set, queued messages are also written to its
+        `webhook_outbox` table and only marked sent once Discord accepted them, so nothing is lost if
+        the process dies. Messages given up for this run stay pending there for `restore_pending`.
+        
+        .-.-.-.
+        
+        @ param digest (bool)  - Gather queued messages per URL and post them as digests: up to 10 cards
+        as attachments, each shown in an embed with its status line, plus the text-only lines as the
+        content. One post then replaces up to 10.
+        
+        .-.-.-.
+        
+        @ param digest_window (float)  - How long a digest collects messages, counted from the oldest
+        queued one. With 0 messages are held until `flush` (the end of a run). A digest with 10 cards
+        is posted right away either way.
+        
+        .-.-.-.
+        
+        @ param encoder (Optional[CardEncoder])  - Encodes cards for upload, a default PNG encoder
+        when `None`.
+        
+        .-.-.-.
+        
         
         """
         self.default_url = default_url
@@ -38,6 +259,23 @@ class WebhookManager:
         if not self.default_url:
             logging.warning("WebhookManager initialized without a default URL and DISCORD_WEBHOOK env var is not set.")
 
+        self.rate_limiter = WebhookRateLimiter(global_requests_per_second)
+        self.max_retries = max(0, int(max_retries))
+        self.store = store
+        self.secret_key: Optional[str] = None # Set by the app so outbox URLs are stored encrypted
+        self.encoder = encoder if encoder is not None else CardEncoder()
+        self.digest = digest
+        self.digest_window = max(0.0, float(digest_window))
+        self._outbox: Dict[str, Deque[OutboxItem]] = {}
+        self._outbox_row_ids: set = set()
+        self._outbox_cond = threading.Condition()
+        self._outbox_thread: Optional[threading.Thread] = None
+        self._outbox_in_flight = 0
+        self._outbox_stopping = False
+        self._outbox_flushing = 0
+        self.outbox_counters = {"queued": 0, "restored": 0, "posts": 0, "merged": 0, "digests": 0,
+                                "failed": 0, "rate_limited": 0, "retried": 0}
+
     def _target_url_display(self, url_string: Optional[str]) -> str:
         """
         This function truncates a URL string to 15 characters from the start and end if the length
@@ -71,7 +309,41 @@ class WebhookManager:
             return url_string[:15] + "..." + url_string[-15:]
         return str(url_string)
 
-    def send(self, message: str, card: Optional[Image.Image] = None, url: Optional[str] = None) -> bool:
+    def _encode_card(self, card: Optional[Image.Image]) -> Optional[Attachment]:
+        """
+        The function `_encode_card` turns a card image into the file tuple posted to Discord, using
+        `self.encoder`.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param card (Optional[Image.Image])  - The card image.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns A `(file name, bytes, MIME type)` tuple, or `None` when there is no card or it could
+        not be encoded.
+        
+        .-.-.-.
+        
+        
+        """
+        if not card:
+            return None
+        try:
+            return self.encoder.encode(card)
+        except Exception as e:
+            logging.error(f"Error preparing card image for webhook: {e}")
+            return None
+
+    def send(self, message: str, card: Optional[Image.Image] = None, url: Optional[str] = None,
+             attachment: Optional[Attachment] = None) -> bool:
         """
         This Python function sends a webhook message with an optional image attachment to a specified
         URL.
@@ -104,6 +376,11 @@ class WebhookManager:
         
         .-.-.-.
         
+        @ param attachment (Optional[Tuple[str, bytes, str]])  - An already encoded file to post instead
+        of `card`, as `(file name, bytes, MIME type)`.
+        
+        .-.-.-.
+        
         
         
         @ returns A boolean value indicating whether the webhook was sent successfully or not.
@@ -120,30 +397,118 @@ class WebhookManager:
             raise WebhookError(err_msg)
 
         data: Dict[str, str] = {'content': message}
-        files: Optional[Dict[str, Tuple[str, BytesIO, str]]] = None
-        buffer_for_card: Optional[BytesIO] = None
+        if attachment is None:
+            attachment = self._encode_card(card)
+        files: Optional[Dict[str, Attachment]] = {'file': attachment} if attachment else None
+        logging.debug(f"Attempting to send webhook to {self._target_url_display(target_url)} with message: \"{message[:70]}...\"")
+        return self._post(target_url, data, files)
 
+    def send_digest(self, content: str, cards: List[Tuple[str, Attachment]], url: Optional[str] = None) -> bool:
+        """
+        The function `send_digest` posts several cards in one webhook execution. Every card is
+        uploaded as `files[i]` and shown in its own embed through an `attachment://` reference, with
+        its status line as the embed description.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param content (str)  - Message content shown above the embeds, may be empty.
+        
+        .-.-.-.
+        
+        @ param cards (List[Tuple[str, Tuple[str, bytes, str]]])  - Up to 10 `(status line, attachment)`
+        pairs.
+        
+        .-.-.-.
+        
+        @ param url (Optional[str])  - Target webhook URL, `self.default_url` when `None`.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns `True` if the digest was posted, raises `WebhookError` otherwise.
+        
+        .-.-.-.
+        
+        
+        """
+        target_url = url if url is not None else self.default_url
+        if not target_url:
+            err_msg = "Target URL not specified and no default is set."
+            logging.error(f"Webhook send: {err_msg}")
+            raise WebhookError(err_msg)
+        if len(cards) > self.DISCORD_FILE_LIMIT:
+            raise WebhookError(f"A digest holds at most {self.DISCORD_FILE_LIMIT} cards, got {len(cards)}.", url=target_url)
 
-        if card:
-            buffer_for_card = BytesIO()
-            try:
-                card.save(buffer_for_card, format="PNG")
-                buffer_for_card.seek(0)
-                files = {'file': ('Card.png', buffer_for_card, 'image/png')}
-            except Exception as e:
-                logging.error(f"Error preparing card image for webhook: {e}")
-                card = None 
-                if buffer_for_card:
-                    buffer_for_card.close()
-                    buffer_for_card = None
-
+        embeds = []
+        uploads = []
+        files: Dict[str, Attachment] = {}
+        for index, (description, (name, blob, mime)) in enumerate(cards):
+            extension = os.path.splitext(name)[1] or ".png"
+            filename = f"card_{index}{extension}"
+            files[f"files[{index}]"] = (filename, blob, mime)
+            uploads.append({"id": index, "filename": filename})
+            embed: Dict[str, Any] = {"image": {"url": f"attachment://{filename}"}}
+            if description:
+                embed["description"] = description[:self.DISCORD_EMBED_DESCRIPTION_LIMIT]
+            embeds.append(embed)
+        payload = {"content": content, "embeds": embeds, "attachments": uploads}
+        logging.debug(f"Attempting to send a webhook digest of {len(cards)} card(s) to {self._target_url_display(target_url)}")
+        return self._post(target_url, {'payload_json': json.dumps(payload)}, files)
 
+    def _post(self, target_url: str, data: Dict[str, str], files: Optional[Dict[str, Attachment]]) -> bool:
+        """
+        The function `_post` executes a webhook once it has its slot from the rate limiter and turns
+        failures into `WebhookError`.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param target_url (str)  - The webhook URL.
+        
+        .-.-.-.
+        
+        @ param data (Dict[str, str])  - Form fields of the request.
+        
+        .-.-.-.
+        
+        @ param files (Optional[Dict[str, Tuple[str, bytes, str]]])  - Files to upload, keyed by form
+        field name.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns `True` if the webhook was accepted, raises `WebhookRateLimitError` on a 429 and
+        `WebhookError` on any other failure.
+        
+        .-.-.-.
+        
+        
+        """
         try:
-            logging.debug(f"Attempting to send webhook to {self._target_url_display(target_url)} with message: \"{message[:70]}...\"")
+            wait = self.rate_limiter.delay(target_url)
+            if wait > 0:
+                time.sleep(wait)
+            self.rate_limiter.reserve(target_url)
             if files:
                 response = requests.post(target_url, data=data, files=files, timeout=15)
             else:
                 response = requests.post(target_url, data=data, timeout=10)
+            retry_after, is_global = self.rate_limiter.update(target_url, response)
+            if response.status_code == 429:
+                scope = "global" if is_global else "webhook"
+                logging.warning(f"Webhook to {self._target_url_display(target_url)} hit the {scope} rate limit, retry after {retry_after:.2f}s.")
+                raise WebhookRateLimitError(f"Rate limited ({scope}).", url=target_url, retry_after=retry_after, is_global=is_global)
             response.raise_for_status()
             logging.info(f"Webhook sent successfully to {self._target_url_display(target_url)}.")
             return True
@@ -159,6 +524,433 @@ class WebhookManager:
             err_msg = "Network or request error."
             logging.error(f"Failed to send webhook notification to {self._target_url_display(target_url)}: {err_msg} - {e}")
             raise WebhookError(err_msg, url=target_url, original_exception=e) from e
-        finally:
-            if buffer_for_card and not buffer_for_card.closed:
-                buffer_for_card.close()
\ No newline at end of file
+
+    def queue(self, message: str, card: Optional[Image.Image] = None, url: Optional[str] = None):
+        """
+        The function `queue` hands a message to the background outbox and returns right away. Messages
+        to the same URL are posted in the order they were queued, and consecutive text-only messages
+        are merged into one post while they fit in Discord's content limit.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param message (str)  - The message content.
+        
+        .-.-.-.
+        
+        @ param card (Optional[Image.Image])  - Optional card image. It is encoded to PNG right away and
+        messages with a card are posted on their own.
+        
+        .-.-.-.
+        
+        @ param url (Optional[str])  - Target webhook URL, `self.default_url` when `None`.
+        
+        .-.-.-.
+        
+        
+        """
+        target_url = url if url is not None else self.default_url
+        if not target_url:
+            err_msg = "Target URL not specified and no default is set."
+            logging.error(f"Webhook queue: {err_msg}")
+            raise WebhookError(err_msg)
+
+        if self._outbox_stopping:
+            raise WebhookError("Webhook outbox is closed.", url=target_url)
+        attachment = self._encode_card(card)
+        row_ids: List[int] = []
+        if self.store is not None:
+            name, blob, mime = attachment if attachment else (None, None, None)
+            row_id = self.store.enqueue_webhook(target_url, message, blob, name, mime, secret_key=self.secret_key)
+            if row_id is not None:
+                row_ids.append(row_id)
+        self._append(target_url, message, attachment, row_ids)
+        with self._outbox_cond:
+            self.outbox_counters["queued"] += 1
+
+    def _append(self, target_url: str, message: str, attachment: Optional[Attachment], row_ids: List[int]):
+        with self._outbox_cond:
+            self._outbox.setdefault(target_url, deque()).append((message, attachment, 0, row_ids, time.monotonic()))
+            self._outbox_row_ids.update(row_ids)
+            if self._outbox_thread is None or not self._outbox_thread.is_alive():
+                self._outbox_thread = threading.Thread(target=self._outbox_worker, name="webhook-outbox", daemon=True)
+                self._outbox_thread.start()
+                atexit.register(self.close)
+            self._outbox_cond.notify_all()
+
+    def restore_pending(self, batch_size: int = 500) -> int:
+        """
+        The function `restore_pending` puts messages left pending in the `store` by an earlier run
+        back on the outbox, oldest first. Rows are read in pages by id, so a backlog of thousands is
+        loaded with a handful of queries and then drained at the rate Discord allows.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param batch_size (int)  - Rows read per query.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns The number of messages put back on the outbox.
+        
+        .-.-.-.
+        
+        
+        """
+        if self.store is None:
+            return 0
+        self.store.purge_sent_webhooks()
+        restored = 0
+        after_id = 0
+        while True:
+            rows = self.store.load_pending_webhooks(after_id=after_id, limit=batch_size, secret_key=self.secret_key)
+            if not rows:
+                break
+            for row in rows:
+                after_id = row["id"]
+                with self._outbox_cond:
+                    if row["id"] in self._outbox_row_ids:
+                        continue
+                attachment = None
+                if row["attachment"] is not None:
+                    attachment = (row["attachment_name"] or 'Card.png', bytes(row["attachment"]),
+                                  row["attachment_type"] or 'application/octet-stream')
+                self._append(row["url"], row["content"], attachment, [row["id"]])
+                restored += 1
+        with self._outbox_cond:
+            self.outbox_counters["restored"] += restored
+        if restored:
+            logging.info(f"Restored {restored} undelivered webhook message(s) from the outbox table.")
+        return restored
+
+    @staticmethod
+    def _is_permanent_failure(error: Exception) -> bool:
+        # A 4xx other than 429 (deleted webhook, bad payload) will not succeed on a retry.
+        original = getattr(error, "original_exception", None)
+        response = getattr(original, "response", None)
+        status_code = getattr(response, "status_code", None)
+        return status_code is not None and 400 <= status_code < 500 and status_code != 429
+
+    def _next_batch(self, target_url: str) -> List[OutboxItem]:
+        """
+        The function `_next_batch` takes the queued messages for the next post off a URL's queue:
+        a message with a card on its own, or as many text-only messages as fit in one content. In
+        digest mode `_next_digest` is used instead. The caller must hold `_outbox_cond`.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param target_url (str)  - The webhook URL.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns The queued items that make up the post, oldest first.
+        
+        .-.-.-.
+        
+        
+        """
+        if self.digest:
+            return self._next_digest(target_url)
+        pending = self._outbox[target_url]
+        items = [pending.popleft()]
+        if items[0][1] is not None:
+            return items
+        length = len(items[0][0])
+        while pending and pending[0][1] is None and length + 1 + len(pending[0][0]) <= self.DISCORD_CONTENT_LIMIT:
+            items.append(pending.popleft())
+            length += 1 + len(items[-1][0])
+        return items
+
+    def _next_digest(self, target_url: str) -> List[OutboxItem]:
+        """
+        The function `_next_digest` takes the queued messages for the next digest off a URL's queue,
+        in order, until the next one would pass one of Discord's limits: 10 files and embeds, 6000
+        embed characters or 2000 content characters. The caller must hold `_outbox_cond`.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param target_url (str)  - The webhook URL.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns The queued items that make up the digest, oldest first. Always at least one.
+        
+        .-.-.-.
+        
+        
+        """
+        pending = self._outbox[target_url]
+        items: List[OutboxItem] = []
+        cards = 0
+        embed_chars = 0
+        content_chars = -1
+        while pending:
+            message, attachment = pending[0][0], pending[0][1]
+            if attachment is not None:
+                size = min(len(message), self.DISCORD_EMBED_DESCRIPTION_LIMIT)
+                if items and (cards == self.DISCORD_FILE_LIMIT or embed_chars + size > self.DISCORD_EMBED_TOTAL_LIMIT):
+                    break
+                cards += 1
+                embed_chars += size
+            else:
+                if items and content_chars + 1 + len(message) > self.DISCORD_CONTENT_LIMIT:
+                    break
+                content_chars += 1 + len(message)
+            items.append(pending.popleft())
+        return items
+
+    def _digest_due(self, pending: Deque[OutboxItem], now: float) -> Optional[float]:
+        """
+        The function `_digest_due` tells whether a URL's queue should be posted as a digest now.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param pending (Deque[OutboxItem])  - The queued items of one URL.
+        
+        .-.-.-.
+        
+        @ param now (float)  - The current `time.monotonic()`.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns 0 when it is due, the seconds until its window closes, or `None` when it waits for
+        `flush`.
+        
+        .-.-.-.
+        
+        
+        """
+        if not self.digest or self._outbox_flushing or self._outbox_stopping:
+            return 0.0
+        if sum(1 for item in pending if item[1] is not None) >= self.DISCORD_FILE_LIMIT:
+            return 0.0
+        if self.digest_window <= 0:
+            return None
+        return max(0.0, pending[0][4] + self.digest_window - now)
+
+    def _ready_urls(self) -> Tuple[list, Optional[float]]:
+        """
+        The function `_ready_urls` splits the URLs with queued messages into those that may be posted
+        now and the time until the next rate limited (or, in digest mode, still collecting) one frees
+        up. The caller must hold `_outbox_cond`.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        
+        
+        @ returns The ready URLs and the shortest wait of the others, `None` when there is nothing to
+        wait for.
+        
+        .-.-.-.
+        
+        
+        """
+        ready = []
+        next_wait: Optional[float] = None
+        now = time.monotonic()
+        for target_url, pending in self._outbox.items():
+            if not pending:
+                continue
+            due = self._digest_due(pending, now)
+            if due is None:
+                continue
+            wait = max(due, self.rate_limiter.delay(target_url))
+            if wait <= 0:
+                ready.append(target_url)
+            else:
+                next_wait = wait if next_wait is None else min(next_wait, wait)
+        return ready, next_wait
+
+    def _deliver(self, target_url: str, items: List[OutboxItem]):
+        """
+        The function `_deliver` posts the items taken by `_next_batch`: text-only messages are joined
+        into the content, cards are attached, as a digest when there are several or digest mode is on.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param target_url (str)  - The webhook URL.
+        
+        .-.-.-.
+        
+        @ param items (List[OutboxItem])  - The items of one post.
+        
+        .-.-.-.
+        
+        
+        """
+        cards = [(message, attachment) for message, attachment, *_ in items if attachment is not None]
+        if not self.digest or not cards:
+            message = "\n".join(item[0] for item in items)
+            self.send(message, url=target_url, attachment=cards[0][1] if cards else None)
+        else:
+            content = "\n".join(message for message, attachment, *_ in items if attachment is None)
+            self.send_digest(content, cards, url=target_url)
+
+    def _outbox_worker(self):
+        while True:
+            with self._outbox_cond:
+                while True:
+                    ready, next_wait = self._ready_urls()
+                    if ready:
+                        break
+                    if next_wait is None:
+                        if self._outbox_stopping:
+                            return
+                        self._outbox_cond.wait()
+                    else:
+                        self._outbox_cond.wait(next_wait)
+                batches = [(target_url, self._next_batch(target_url)) for target_url in ready]
+                self._outbox_in_flight += len(batches)
+
+            # One post per URL per pass, so a failed post is back at the head of its queue
+            # before anything queued after it is tried.
+            for target_url, items in batches:
+                count = len(items)
+                attempts = max(item[2] for item in items)
+                row_ids = [row_id for item in items for row_id in item[3]]
+                try:
+                    self._deliver(target_url, items)
+                    if self.store is not None and row_ids:
+                        self.store.mark_webhooks_sent(row_ids)
+                    with self._outbox_cond:
+                        self.outbox_counters["posts"] += 1
+                        self.outbox_counters["merged"] += count - 1
+                        if self.digest and any(item[1] is not None for item in items):
+                            self.outbox_counters["digests"] += 1
+                        self._outbox_row_ids.difference_update(row_ids)
+                except Exception as e: # send() already logged the details
+                    rate_limited = isinstance(e, WebhookRateLimitError)
+                    permanent = self._is_permanent_failure(e)
+                    if not rate_limited and not permanent:
+                        self.rate_limiter.block(target_url, min(self.MAX_RETRY_BACKOFF, self.RETRY_BACKOFF * 2 ** attempts))
+                    with self._outbox_cond:
+                        if not permanent:
+                            self.outbox_counters["rate_limited" if rate_limited else "retried"] += 1
+                            if attempts < self.max_retries:
+                                pending = self._outbox[target_url]
+                                for message, attachment, _, ids, queued_at in reversed(items):
+                                    pending.appendleft((message, attachment, attempts + 1, ids, queued_at))
+                                continue
+                        self.outbox_counters["failed"] += count
+                        self._outbox_row_ids.difference_update(row_ids)
+                    if self.store is not None and row_ids and permanent:
+                        self.store.reschedule_webhooks(row_ids, 0, str(e), max_attempts=0)
+                        logging.warning(f"Dropped {count} webhook message(s) for {self._target_url_display(target_url)}, the webhook rejected them: {e}")
+                    elif self.store is not None and row_ids:
+                        self.store.reschedule_webhooks(row_ids, self.STORED_RETRY_DELAY, str(e))
+                        logging.warning(f"Gave up on {count} webhook message(s) for {self._target_url_display(target_url)} for now, they stay in the outbox table: {e}")
+                    else:
+                        logging.warning(f"Dropped {count} queued webhook message(s) for {self._target_url_display(target_url)} after {attempts + 1} attempt(s): {e}")
+                finally:
+                    with self._outbox_cond:
+                        self._outbox_in_flight -= 1
+                        self._outbox_cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        The function `flush` waits until every queued message has been posted (or failed). Digests
+        that are still collecting are posted right away.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param timeout (Optional[float])  - Maximum seconds to wait, forever when `None`.
+        
+        .-.-.-.
+        
+        
+        
+        @ returns `True` if the outbox is empty, `False` if the timeout expired first.
+        
+        .-.-.-.
+        
+        
+        """
+        with self._outbox_cond:
+            if self._outbox_thread is None:
+                return True
+            self._outbox_flushing += 1
+            self._outbox_cond.notify_all()
+            try:
+                return self._outbox_cond.wait_for(
+                    lambda: not any(self._outbox.values()) and self._outbox_in_flight == 0, timeout)
+            finally:
+                self._outbox_flushing -= 1
+
+    def close(self, timeout: Optional[float] = None):
+        """
+        The function `close` flushes the outbox and stops its worker. It is registered with `atexit`
+        when the worker starts, so queued messages are not lost on a normal exit.
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        Author - Liam Scott
+        Last update - 10/18/2026
+        
+        .-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.-.
+        
+        @ param timeout (Optional[float])  - Maximum seconds to wait for the flush.
+        
+        .-.-.-.
+        
+        
+        """
+        if not self.flush(timeout):
+            logging.warning("Webhook outbox did not drain before shutdown, some messages were not sent.")
+        with self._outbox_cond:
+            self._outbox_stopping = True
+            thread = self._outbox_thread
+            self._outbox_cond.notify_all()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        atexit.unregister(self.close)
+
+    def outbox_stats(self) -> Dict[str, Any]:
+        with self._outbox_cond:
+            pending = sum(len(messages) for messages in self._outbox.values())
+            return dict(self.outbox_counters, pending=pending)
@@ -29,7 +29,7 @@ import asyncio
 from PyQt5 import QtWidgets, QtCore, QtGui 
 # from lib.login import run_account #needs to be swapped to the new login system
 from app.lib.cookie import get_cookie, format_cookies
-from lib.encrypt import encrypt, decrypt, database_encrypt, database_decrypt # this will be the next thing to be transfered to the OOP 
+from lib.encrypt import encrypt, decrypt, database_encrypt, database_decrypt, wipe_key_cache # this will be the next thing to be transfered to the OOP 
 from lib.database import DatabaseManager
 from lib.settings import ConfigManager 
 
@@ -367,6 +367,7 @@ class AccountManagerApp(QtWidgets.QWidget):
 
         if key:
             if settings.check_valadation(key):
+                wipe_key_cache()
                 self.key = key
                 self.show_notification("Encryption key accepted.", "green")
                 settings.set_app_first(False)
@@ -465,6 +466,7 @@ class AccountManagerApp(QtWidgets.QWidget):
             self.encryption_key_entry_new_user.clear()
             self.nav_list.show()
             self.display_page(0)
+            wipe_key_cache()
             self.key = key
             settings = self.settings
             settings.set_use_default_encryption_key(False)
@@ -890,4 +892,6 @@ if __name__ == "__main__":
     app = QtWidgets.QApplication(sys.argv)
     window = AccountManagerApp()
     window.show()
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+    wipe_key_cache()
+    sys.exit(exit_code)
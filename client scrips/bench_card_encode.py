@@ -0,0 +1,74 @@
+"""
+Benchmark for CardEncoder settings.
+
+Encodes one card with several formats, compression levels, palettes and size budgets and prints
+size and encode time for each, to pick the Webhook card_* settings for a deployment. Pass --image
+with a saved card for real numbers; without it a synthetic card with gradients, text and noisy
+icons is used.
+
+    python "client scrips/bench_card_encode.py" --image Card.png --repeat 5
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from PIL import Image, ImageDraw  # noqa: E402
+
+from lib.card_encoder import CardEncoder  # noqa: E402
+
+SETTINGS = [
+    ("PNG level 6 (old default)", dict(image_format="PNG", compress_level=6)),
+    ("PNG level 1", dict(image_format="PNG", compress_level=1)),
+    ("PNG level 9", dict(image_format="PNG", compress_level=9)),
+    ("PNG 256 colors", dict(image_format="PNG", compress_level=6, quantize_colors=256)),
+    ("PNG 64 colors", dict(image_format="PNG", compress_level=6, quantize_colors=64)),
+    ("WebP q90", dict(image_format="WEBP", quality=90, compress_level=4)),
+    ("WebP q75", dict(image_format="WEBP", quality=75, compress_level=4)),
+    ("JPEG q85", dict(image_format="JPEG", quality=85)),
+    ("PNG budget 150 KiB", dict(image_format="PNG", compress_level=6, max_bytes=150 * 1024)),
+    ("WebP budget 60 KiB", dict(image_format="WEBP", quality=90, compress_level=4, max_bytes=60 * 1024)),
+]
+
+
+def synthetic_card(seed):
+    random.seed(seed)
+    card = Image.new("RGBA", (1000, 600))
+    draw = ImageDraw.Draw(card)
+    for y in range(600):
+        draw.line([(0, y), (1000, y)], fill=(30 + y // 8, 40 + y // 10, 70 + y // 6, 255))
+    for slot in range(2):
+        icon = Image.effect_noise((180, 180), 60).convert("RGBA")
+        card.alpha_composite(icon, (120 + slot * 420, 150))
+        draw.rounded_rectangle([100 + slot * 420, 130, 320 + slot * 420, 350], radius=18,
+                               outline=(230, 200, 140, 255), width=6)
+        draw.text((130 + slot * 420, 380), "Fine Enhancement Ore x3", fill=(255, 255, 255, 255))
+    draw.text((40, 540), "Next reset in 1d 4h 0m - day 12 of 28", fill=(240, 240, 240, 255))
+    return card
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare CardEncoder settings.")
+    parser.add_argument("--image", help="a rendered card to encode")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    card = Image.open(args.image).convert("RGBA") if args.image else synthetic_card(1)
+    card.load()
+    for label, options in SETTINGS:
+        encoder = CardEncoder(**options)
+        timings = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            _, data, _ = encoder.encode(card)
+            timings.append((time.perf_counter() - started) * 1000)
+        print(f"{label:<26} {len(data) / 1024:8.1f} KiB   {statistics.median(timings):7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark for LoginManager._card_generator.
+
+Renders the same cards with and without the pre-composited card templates and prints per-card
+timings. By default the assets are generated locally so the numbers only measure rendering; pass
+--cdn to use the real CDN (downloaded once into a temporary asset cache before timing).
+
+    python "client scrips/bench_card_render.py" --cards 200
+"""
+
+import argparse
+import hashlib
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from io import BytesIO
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from PIL import Image  # noqa: E402
+
+from lib.login_manager import LoginManager  # noqa: E402
+from lib.webhook_manager import WebhookManager  # noqa: E402
+
+
+class SyntheticAssets:
+    """Stands in for AssetCache and returns a PNG per URL, sized like the real CDN assets."""
+
+    def __init__(self):
+        self._blobs = {}
+
+    def get(self, url, headers=None, timeout=None):
+        if url not in self._blobs:
+            digest = hashlib.sha256(url.encode()).digest()
+            if "/cards/" in url:
+                size, mode = (1000, 600), "RGBA"
+            elif "frame" in url:
+                size, mode = (140, 140), "RGBA"
+            elif "car_dec" in url:
+                size, mode = (350, 178), "RGBA"
+            else:
+                size, mode = (256, 256), "RGBA"
+            image = Image.new(mode, size, tuple(digest[:3]) + (200,))
+            buffer = BytesIO()
+            image.save(buffer, format="PNG")
+            self._blobs[url] = buffer.getvalue()
+        return self._blobs[url]
+
+    def is_known_missing(self, url):
+        return False
+
+    def flush(self):
+        pass
+
+    def stats(self):
+        return {}
+
+
+def sample_cards(count):
+    icon = "https://upload-static.hoyoverse.com/event/2021/02/25/22542ef6122f5ad4ac1c3834d11cdfb4_8505332314511574414.png"
+    for i in range(count):
+        yield {
+            "icon_1": icon, "name_1": "Fine Enhancement Ore", "cnt_1": 3,
+            "icon_2": icon, "name_2": "Fine Enhancement Ore", "cnt_2": 3,
+            "refresh": "1d 4h 0m", "days": (i % 28) + 1, "end_of_month": i % 10 == 9,
+        }
+
+
+def run(login_mgr, cards, game, seed):
+    random.seed(seed)
+    timings = []
+    for card in cards:
+        started = time.perf_counter()
+        if login_mgr._card_generator(card, game) is None:
+            raise SystemExit("Card generation failed, check the logs.")
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def describe(label, timings):
+    ordered = sorted(timings)
+    p95 = ordered[max(0, int(round(0.95 * len(ordered))) - 1)]
+    print(f"{label:<18} mean {statistics.mean(timings):7.2f} ms   p50 {statistics.median(timings):7.2f} ms   "
+          f"p95 {p95:7.2f} ms")
+    return statistics.mean(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare card render time with and without templates.")
+    parser.add_argument("--cards", type=int, default=100, help="cards rendered per pass")
+    parser.add_argument("--game", default="gi", choices=["gi", "hsr", "zzz"])
+    parser.add_argument("--cdn", action="store_true", help="use the real CDN instead of generated assets")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    login_mgr = LoginManager(WebhookManager(), cache_dir=tempfile.mkdtemp(prefix="hoyohelper-bench-"))
+    if not args.cdn:
+        login_mgr.asset_cache = SyntheticAssets()
+    cards = list(sample_cards(args.cards))
+
+    # Warm-up pass: downloads and decodes every asset the timed passes will use.
+    login_mgr.use_card_templates = False
+    run(login_mgr, cards, args.game, args.seed)
+
+    before = describe("without templates", run(login_mgr, cards, args.game, args.seed))
+    login_mgr.use_card_templates = True
+    login_mgr.warm_card_templates(args.game)
+    after = describe("with templates", run(login_mgr, cards, args.game, args.seed))
+    print(f"speed-up x{before / after:.2f} over {args.cards} card(s)")
+    login_mgr.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark for decrypting many account passwords.
+
+Encrypts one password per simulated account in each blob format, wipes the key cache and then
+decrypts every account twice. Version 1 blobs carry their own salt, so the cold pass pays PBKDF2
+for each value and only the warm pass is served by the key cache. Version 2 envelopes share the
+session's key-encryption key, so even the cold pass runs PBKDF2 once. Setting up 1,000 version 1
+accounts takes a while because encrypting them runs PBKDF2 too.
+
+    python "client scrips/bench_decrypt.py" --accounts 1000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from lib.encrypt import (FORMAT_V1, FORMAT_V2, decrypt, encrypt, key_cache_stats,  # noqa: E402
+                         set_key_cache_size, wipe_key_cache)
+
+
+def timed_pass(master_key, blobs):
+    started = time.perf_counter()
+    for index, blob in enumerate(blobs):
+        if decrypt(master_key, blob) != f"password-{index}":
+            raise SystemExit(f"account {index} did not decrypt correctly")
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure decrypts per second per blob format.")
+    parser.add_argument("--accounts", type=int, default=1000)
+    parser.add_argument("--cache-size", type=int, default=4096, help="key cache size, must cover --accounts")
+    args = parser.parse_args()
+
+    master_key = "benchmark master key"
+    set_key_cache_size(args.cache_size)
+    for label, version in (("v1", FORMAT_V1), ("v2", FORMAT_V2)):
+        print(f"Encrypting {args.accounts} account password(s) as {label}...")
+        blobs = [encrypt(master_key, f"password-{index}", version=version) for index in range(args.accounts)]
+
+        wipe_key_cache()
+        misses = key_cache_stats()["misses"]
+        cold = timed_pass(master_key, blobs)
+        derivations = key_cache_stats()["misses"] - misses
+        warm = timed_pass(master_key, blobs)
+        print(f"  cold: {args.accounts / cold:10.1f} decrypts/s  ({cold:.2f}s, {derivations} key derivation(s))")
+        print(f"  warm: {args.accounts / warm:10.1f} decrypts/s  ({warm:.3f}s)")
+    wipe_key_cache()
+
+
+if __name__ == "__main__":
+    main()
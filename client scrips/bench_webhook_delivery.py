@@ -0,0 +1,75 @@
+"""
+Benchmark for WebhookManager delivery under Discord rate limits, fully offline.
+
+Starts webhook_stub_server.StubWebhookServer, queues messages for several webhook URLs through the
+WebhookManager outbox and reports delivered messages per second, 429s and whether every webhook
+received its messages in order. --cards attaches a small card to every message; compare the post
+count with and without --digest.
+
+    python "client scrips/bench_webhook_delivery.py" --messages 60 --webhooks 3
+    python "client scrips/bench_webhook_delivery.py" --messages 60 --webhooks 3 --cards --digest
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+from PIL import Image
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "app"))
+sys.path.insert(0, HERE)
+
+from lib.webhook_manager import WebhookManager  # noqa: E402
+from webhook_stub_server import StubWebhookServer  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure webhook delivery against a rate limited stub.")
+    parser.add_argument("--messages", type=int, default=60, help="messages per webhook")
+    parser.add_argument("--webhooks", type=int, default=3)
+    parser.add_argument("--bucket-limit", type=int, default=5)
+    parser.add_argument("--bucket-window", type=float, default=2.0)
+    parser.add_argument("--global-limit", type=int, default=50)
+    parser.add_argument("--merge", action="store_true", help="use short messages so the outbox can merge them")
+    parser.add_argument("--cards", action="store_true", help="attach a card to every message")
+    parser.add_argument("--digest", action="store_true", help="post cards as digests of up to 10")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.ERROR)
+
+    server = StubWebhookServer(bucket_limit=args.bucket_limit, bucket_window=args.bucket_window,
+                               global_limit=args.global_limit).start()
+    manager = WebhookManager(default_url=server.webhook_url(0), max_retries=50, digest=args.digest)
+    padding = "" if args.merge or args.cards else " " + "x" * 1200  # two of these never fit in one post
+    card = Image.new("RGB", (200, 120), (40, 60, 90)) if args.cards else None
+
+    started = time.perf_counter()
+    for index in range(args.messages):
+        for webhook in range(args.webhooks):
+            manager.queue(f"msg-{index:05d}{padding}", card, url=server.webhook_url(webhook))
+    manager.flush()
+    elapsed = time.perf_counter() - started
+
+    in_order = True
+    for webhook in range(args.webhooks):
+        path = server.webhook_url(webhook)[len(server.base_url):]
+        lines = [line[:9] for post in server.received.get(path, []) for line in post.decode().split("\n")]
+        in_order &= lines == [f"msg-{index:05d}" for index in range(args.messages)]
+
+    total = args.messages * args.webhooks
+    stats = manager.outbox_stats()
+    print(f"{total} message(s) to {args.webhooks} webhook(s) in {elapsed:.2f}s "
+          f"-> {total / elapsed:.1f} messages/s, {stats['posts'] / elapsed:.1f} posts/s")
+    print(f"posts {stats['posts']}, merged {stats['merged']}, digests {stats['digests']}, "
+          f"files {server.stats['files']}, rate limited {stats['rate_limited']}, "
+          f"failed {stats['failed']}, stub 429s {server.stats['bucket_429']} bucket / {server.stats['global_429']} global")
+    print(f"order preserved: {in_order}")
+    manager.close()
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
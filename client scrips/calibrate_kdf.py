@@ -0,0 +1,54 @@
+"""
+Calibrates the key derivation that protects account secrets on this host.
+
+Measures PBKDF2, scrypt and Argon2id for --target-ms and prints the parameters each one needs and
+what a derivation then costs. With --save the chosen algorithm is written to the config; the
+headless app uses it for new secrets and rehashes older ones the next time they decrypt. Setting
+kdf_target_ms in the config instead makes the headless app calibrate by itself.
+
+    python "client scrips/calibrate_kdf.py" --target-ms 300
+    python "client scrips/calibrate_kdf.py" --target-ms 300 --save argon2id
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from lib.encrypt import KDF_MINIMUMS, calibrate_kdf, measure_kdf  # noqa: E402
+from lib.settings import ConfigManager  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pick key derivation parameters for a target latency.")
+    parser.add_argument("--target-ms", type=int, default=250, help="wanted time of one derivation (default 250)")
+    parser.add_argument("--max-memory-mib", type=int, default=256, help="memory cap for scrypt and Argon2id")
+    parser.add_argument("--parallelism", type=int, default=1, help="scrypt p / Argon2id lanes")
+    parser.add_argument("--save", choices=tuple(KDF_MINIMUMS), help="store this algorithm's result in the config")
+    parser.add_argument("--runtime", choices=("os", "docker"), default="os")
+    args = parser.parse_args()
+
+    results = {}
+    for algorithm in KDF_MINIMUMS:
+        try:
+            params = calibrate_kdf(algorithm, args.target_ms, max_memory_kib=args.max_memory_mib * 1024,
+                                   parallelism=args.parallelism)
+        except ValueError as e:
+            print(f"{algorithm:<9} unavailable: {e}")
+            continue
+        results[algorithm] = params
+        print(f"{algorithm:<9} {measure_kdf(params) * 1000:7.1f} ms  {params.describe()}")
+
+    if args.save:
+        if args.save not in results:
+            parser.error(f"{args.save} could not be calibrated on this host")
+        params = results[args.save]
+        config = ConfigManager(runtime=args.runtime)
+        config.set_kdf_target_ms(args.target_ms)
+        config.set_kdf_params(*params, calibrated_ms=args.target_ms)
+        print(f"Saved {params.describe()}; secrets are rehashed the next time they decrypt.")
+
+
+if __name__ == "__main__":
+    main()
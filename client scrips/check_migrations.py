@@ -0,0 +1,46 @@
+"""
+Dry-runs the database schema migrations on copies of real databases.
+
+Each database is copied with SQLite's backup API, the copy is migrated to the latest schema and
+checked with PRAGMA integrity_check and foreign_key_check; the original is never written. Run it on
+copies of user databases before shipping a new migration:
+
+    python "client scrips/check_migrations.py" ~/.config/HoyoHelper/data/database/Info.db
+
+On Windows the database is in %APPDATA%\\HoyoHelper\\data\\database\\Info.db, in Docker in
+/app/data/database/Info.db. Exits with status 1 if any database fails.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from lib.database import SCHEMA_MIGRATIONS, SCHEMA_VERSION  # noqa: E402
+from lib.migrations import verify_on_copy  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test schema migrations on copies of databases.")
+    parser.add_argument("databases", nargs="+", help="database files to test")
+    args = parser.parse_args()
+
+    failed = 0
+    for database_file in args.databases:
+        report = verify_on_copy(database_file, SCHEMA_MIGRATIONS)
+        status = "OK" if report["ok"] else "FAILED"
+        print(f"{status}  {database_file}: version {report['from_version']} -> {report['to_version']} "
+              f"(latest {SCHEMA_VERSION}), applied {report['applied'] or 'nothing'}")
+        if report["error"]:
+            print(f"    error: {report['error']}")
+        else:
+            print(f"    integrity: {report['integrity']}, foreign key errors: {report['foreign_key_errors']}")
+            for table, (before, after) in sorted(report["table_counts"].items()):
+                print(f"    {table:<16} {'-' if before is None else before:>6} -> {after} row(s)")
+        failed += not report["ok"]
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Runs a bulk encryption job over the accounts table and prints its progress.
+
+Operations: encrypt (plain text secrets to v2 blobs), decrypt (blobs to plain text), rekey (move
+every blob to a new master key) and upgrade (v1 blobs to v2). Keys are prompted for, so they do not
+end up in the shell history. An interrupted job (Ctrl+C, crash, power loss) keeps every finished
+chunk; run the same command again to resume it. Before encrypting, the master key is checked against
+the app's validation token (or asked for twice when --database points elsewhere or there is no
+token), since a mistyped key would leave every secret encrypted under a key nobody knows.
+
+    python "client scrips/crypto_job.py" rekey --database ~/.config/HoyoHelper/data/database/Info.db
+"""
+
+import argparse
+import getpass
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from lib.database import DatabaseManager  # noqa: E402
+from lib.exceptions import CryptoJobError  # noqa: E402
+from lib.settings import ConfigManager  # noqa: E402
+
+
+def print_progress(report):
+    total = max(report["rows_total"], 1)
+    rate = report["rows_done"] / report["elapsed_seconds"] if report["elapsed_seconds"] else 0.0
+    print(f"\r  {report['rows_done']}/{report['rows_total']} row(s) ({report['rows_done'] / total:.0%}), "
+          f"{report['rows_failed']} failed, {rate:.0f} rows/s", end="", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Encrypt, decrypt, re-key or upgrade account secrets in bulk.")
+    parser.add_argument("operation", choices=DatabaseManager.CRYPTO_OPERATIONS)
+    parser.add_argument("--database", help="database file, the app's default location when omitted")
+    parser.add_argument("--runtime", choices=("os", "docker"), default="os")
+    parser.add_argument("--columns", nargs="+", choices=DatabaseManager.SECRET_COLUMNS,
+                        help="columns to process (default: all secret columns)")
+    parser.add_argument("--chunk-size", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    args = parser.parse_args()
+
+    if args.database and not os.path.exists(args.database):
+        parser.error(f"database {args.database} does not exist")
+    key = getpass.getpass("Master key: ")
+    if args.operation == "encrypt":
+        config = ConfigManager(runtime=args.runtime)
+        if not args.database and all(config.get_valadation()):
+            if not config.check_valadation(key):
+                parser.error("the master key does not match the app's key")
+        elif key != getpass.getpass("Repeat the master key: "):
+            parser.error("the keys do not match")
+    new_key = None
+    if args.operation == "rekey":
+        new_key = getpass.getpass("New master key: ")
+        if new_key != getpass.getpass("Repeat the new master key: "):
+            parser.error("the new keys do not match")
+
+    database = (DatabaseManager(database_file=os.path.abspath(args.database), runtime=args.runtime)
+                if args.database else DatabaseManager(runtime=args.runtime))
+    print(f"Running '{args.operation}' on {database.database_file}")
+    try:
+        report = database.run_crypto_job(args.operation, key, new_key=new_key, columns=args.columns,
+                                         chunk_size=args.chunk_size, workers=args.workers, progress=print_progress)
+    except KeyboardInterrupt:
+        print("\nInterrupted; finished chunks are saved, run the same command to resume.")
+        sys.exit(130)
+    except CryptoJobError as e:
+        print(f"\n{e}")
+        sys.exit(1)
+    finally:
+        database.close()
+    print(f"\nJob {report['job_id']} finished in {report['elapsed_seconds']:.1f}s, "
+          f"{report['rows_failed']} row(s) could not be processed.")
+    sys.exit(1 if report["rows_failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Capacity report from the run journal.
+
+Reads the runs and run_events tables the headless app fills in and prints, for the last --days
+days, throughput per run, tail latency per game, failure and retry rates, the API retcodes that
+came back and a per-day breakdown. Rising p95 latency, retries or non-zero retcodes at the same
+concurrency mean HoYoLAB is throttling us; low latency with spare run time means concurrency can
+go up.
+
+    python "client scrips/run_report.py" --days 14
+    python "client scrips/run_report.py" --database /app/data/database/Info.db
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from lib.database import DatabaseManager  # noqa: E402
+from lib.scheduler import percentile  # noqa: E402
+
+
+def latency_line(label, latencies):
+    return (f"{label:<14} {len(latencies):>6}  p50 {percentile(latencies, 50):6.1f}s  "
+            f"p95 {percentile(latencies, 95):6.1f}s  p99 {percentile(latencies, 99):6.1f}s  "
+            f"max {max(latencies, default=0.0):6.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize recent runs from the run journal.")
+    parser.add_argument("--days", type=float, default=7, help="how many days back to report (default 7)")
+    parser.add_argument("--database", help="database file, the app's default location when omitted")
+    parser.add_argument("--runtime", choices=("os", "docker"), default="os")
+    args = parser.parse_args()
+
+    if args.database and not os.path.exists(args.database):
+        parser.error(f"database {args.database} does not exist")
+    database = (DatabaseManager(database_file=os.path.abspath(args.database), runtime=args.runtime)
+                if args.database else DatabaseManager(runtime=args.runtime))
+    since = time.time() - args.days * 24 * 3600
+    runs = database.load_runs(since)
+    events = database.load_run_events(since)
+    database.close()
+    if not runs:
+        print(f"No runs recorded in the last {args.days:g} day(s).")
+        return
+
+    print(f"{len(runs)} run(s) and {len(events)} game(s) in the last {args.days:g} day(s)\n")
+
+    events_by_run = defaultdict(list)
+    for event in events:
+        events_by_run[event["run_id"]].append(event)
+    print("Throughput")
+    rates = []
+    for run in runs:
+        if run["ended_at"] is None:
+            continue
+        minutes = max(run["ended_at"] - run["started_at"], 1e-6) / 60
+        rates.append(len(events_by_run[run["id"]]) / minutes)
+    finished = [run for run in runs if run["ended_at"] is not None]
+    if finished:
+        last = finished[-1]
+        print(f"  games per minute: median {percentile(rates, 50):.1f}, worst {min(rates):.1f}, best {max(rates):.1f}")
+        print(f"  last run: {datetime.fromtimestamp(last['started_at']):%Y-%m-%d %H:%M}, "
+              f"{last['ended_at'] - last['started_at']:.0f}s, {last['accounts']} account(s), "
+              f"{last['failed']} failed, concurrency {last['max_concurrency']}")
+    if len(finished) < len(runs):
+        print(f"  {len(runs) - len(finished)} run(s) did not finish")
+
+    if not events:
+        return
+    latencies_by_game = defaultdict(list)
+    for event in events:
+        latencies_by_game[event["game"]].append(event["ended_at"] - event["started_at"])
+    print("\nLatency per game")
+    print("  " + latency_line("all", [latency for values in latencies_by_game.values() for latency in values]))
+    for game in sorted(latencies_by_game):
+        print("  " + latency_line(game, latencies_by_game[game]))
+
+    calls = sum(event["http_calls"] for event in events)
+    retries = sum(event["retries"] for event in events)
+    failures = [event for event in events if not event["success"]]
+    renders = [event["render_ms"] for event in events if event["render_ms"] is not None]
+    print("\nFailures and retries")
+    print(f"  failed: {len(failures)} of {len(events)} ({len(failures) / len(events):.1%})")
+    for game in sorted(latencies_by_game):
+        game_events = [event for event in events if event["game"] == game]
+        game_failures = sum(not event["success"] for event in game_events)
+        print(f"    {game:<12} {game_failures:>5} of {len(game_events):<6} ({game_failures / len(game_events):.1%})")
+    print(f"  HTTP calls: {calls} ({calls / len(events):.1f} per game), retries: {retries} "
+          f"({retries / calls if calls else 0.0:.1%} of calls)")
+    if renders:
+        print(f"  card render: p50 {percentile(renders, 50):.0f} ms, p95 {percentile(renders, 95):.0f} ms")
+    retcodes = Counter(event["retcode"] for event in events if event["retcode"])
+    if retcodes:
+        print("  API retcodes: " + ", ".join(f"{retcode} x{count}" for retcode, count in retcodes.most_common(8)))
+    errors = Counter((event["error"] or "unknown")[:80] for event in failures)
+    for error, count in errors.most_common(5):
+        print(f"    {count:>5}  {error}")
+
+    print("\nPer day")
+    print(f"  {'date':<10} {'runs':>4} {'games':>6} {'failed':>7} {'retries':>7} {'p95':>7}")
+    days = defaultdict(list)
+    for event in events:
+        days[datetime.fromtimestamp(event["started_at"]).strftime("%Y-%m-%d")].append(event)
+    for day in sorted(days):
+        day_events = days[day]
+        day_failures = sum(not event["success"] for event in day_events)
+        print(f"  {day:<10} {len({event['run_id'] for event in day_events}):>4} {len(day_events):>6} "
+              f"{day_failures / len(day_events):>7.1%} {sum(event['retries'] for event in day_events):>7} "
+              f"{percentile([event['ended_at'] - event['started_at'] for event in day_events], 95):>6.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Local stand-in for Discord webhooks that enforces Discord-style rate limits.
+
+Every path is its own webhook with a bucket of --bucket-limit posts per --bucket-window seconds,
+and all webhooks together share a global limit of --global-limit posts per second. Responses carry
+the X-RateLimit-* headers Discord sends; posts over a limit get a 429 with Retry-After and a JSON
+body. Digests (payload_json with embeds and files[n] uploads) are recorded as their content lines
+followed by the embed descriptions. Run it on its own to point HoYo Helper at it:
+
+    python "client scrips/webhook_stub_server.py" --port 8787
+
+or import StubWebhookServer, as bench_webhook_delivery.py does.
+"""
+
+import argparse
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+
+class StubWebhookServer:
+    def __init__(self, host="127.0.0.1", port=0, bucket_limit=5, bucket_window=2.0, global_limit=50):
+        self.bucket_limit = bucket_limit
+        self.bucket_window = bucket_window
+        self.global_limit = global_limit
+        self.lock = threading.Lock()
+        self.buckets = {}
+        self.global_window = (0.0, 0)
+        self.received = {}
+        self.stats = {"accepted": 0, "bucket_429": 0, "global_429": 0, "files": 0}
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def webhook_url(self, index):
+        return f"{self.base_url}/api/webhooks/{index}/stub-token"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _check(self, path):
+        """Returns (status, headers, body) for a post to `path`, updating the counters."""
+        now = time.monotonic()
+        with self.lock:
+            window_start, count = self.global_window
+            if now - window_start >= 1.0:
+                window_start, count = now, 0
+            if count >= self.global_limit:
+                retry_after = round(1.0 - (now - window_start), 3)
+                self.stats["global_429"] += 1
+                body = {"message": "You are being rate limited.", "retry_after": retry_after, "global": True}
+                return 429, {"Retry-After": str(retry_after), "X-RateLimit-Global": "true",
+                             "X-RateLimit-Scope": "global"}, body
+            self.global_window = (window_start, count + 1)
+
+            bucket_start, used = self.buckets.get(path, (now, 0))
+            if now - bucket_start >= self.bucket_window:
+                bucket_start, used = now, 0
+            reset_after = round(self.bucket_window - (now - bucket_start), 3)
+            headers = {"X-RateLimit-Limit": str(self.bucket_limit), "X-RateLimit-Reset-After": str(reset_after),
+                       "X-RateLimit-Bucket": f"bucket-{abs(hash(path)) % 10**8}"}
+            if used >= self.bucket_limit:
+                self.stats["bucket_429"] += 1
+                headers.update({"X-RateLimit-Remaining": "0", "Retry-After": str(reset_after),
+                                "X-RateLimit-Scope": "user"})
+                return 429, headers, {"message": "You are being rate limited.", "retry_after": reset_after,
+                                      "global": False}
+            self.buckets[path] = (bucket_start, used + 1)
+            headers["X-RateLimit-Remaining"] = str(self.bucket_limit - used - 1)
+            self.stats["accepted"] += 1
+            return 204, headers, None
+
+    @staticmethod
+    def _parse_multipart(raw):
+        match = re.search(rb'name="payload_json"\r\n(?:[^\r\n]*\r\n)*?\r\n(.*?)\r\n--', raw, re.S)
+        if match:
+            payload = json.loads(match.group(1))
+            lines = [payload["content"]] if payload.get("content") else []
+            lines += [embed.get("description", "") for embed in payload.get("embeds", [])]
+            return "\n".join(lines).encode()
+        match = re.search(rb'name="content"\r\n\r\n(.*?)\r\n--', raw, re.S)
+        return match.group(1) if match else raw
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                raw = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                status, headers, body = server._check(self.path)
+                if status == 204:
+                    if self.headers.get("Content-Type", "").startswith("application/x-www-form-urlencoded"):
+                        content = parse_qs(raw.decode()).get("content", [""])[0].encode()
+                    else:
+                        content = server._parse_multipart(raw)
+                    files = len(re.findall(rb'; filename="', raw))
+                    with server.lock:
+                        server.received.setdefault(self.path, []).append(content)
+                        server.stats["files"] += files
+                payload = json.dumps(body).encode() if body is not None else b""
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                if payload:
+                    self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Discord webhook stub with rate limits.")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--bucket-limit", type=int, default=5)
+    parser.add_argument("--bucket-window", type=float, default=2.0)
+    parser.add_argument("--global-limit", type=int, default=50)
+    args = parser.parse_args()
+    server = StubWebhookServer(port=args.port, bucket_limit=args.bucket_limit,
+                               bucket_window=args.bucket_window, global_limit=args.global_limit)
+    print(f"Webhook stub listening, use {server.webhook_url(1)} (any path works). Ctrl+C to stop.")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(server.stats))
+
+
+if __name__ == "__main__":
+    main()